@@ -0,0 +1,185 @@
+import argparse
+import io
+import re
+from html.parser import HTMLParser
+
+import main
+import svg_loader
+
+# ================= 配置 =================
+# 只有 transform / opacity 能完全交给合成线程；其余属性做动画都要重新布局或重绘
+COMPOSITOR_PROPS = {"transform", "opacity"}
+# 非合成属性的相对代价：filter 每帧重新栅格化整层最贵
+PROP_WEIGHTS = {"filter": 10, "fill": 3, "stroke-dashoffset": 3, "background-color": 2}
+DEFAULT_WEIGHT = 2
+
+# ================= 图标 =================
+
+def analyze_icon(icon, instances):
+    markup = icon["body"] + icon["overlay"]
+    paths = re.findall(r'\bd="([^"]*)"', icon["body"])
+    commands = 0
+    for d in paths:
+        try: commands += len(svg_loader._absolute_path(svg_loader._tokenize_path(d)))
+        except ValueError: continue
+
+    overflow = 0.0
+    # bbox 是构建时解析得到的，已按各级 transform 换算到根 viewBox
+    if icon["bbox"] and icon["view_box"]:
+        vx, vy, vw, vh = (float(v) for v in icon["view_box"].replace(',', ' ').split())
+        x0, y0, x1, y1 = icon["bbox"]
+        # 超出 viewBox 的最大距离，按画布边长的百分比
+        over = max(vx - x0, vy - y0, x1 - (vx + vw), y1 - (vy + vh), 0)
+        overflow = 100 * over / max(vw, vh)
+
+    nodes = len(re.findall(r'<[a-zA-Z]', markup))
+    return {"name": icon["name"], "instances": instances, "paths": len(paths), "commands": commands,
+            "nodes": nodes, "overflow_pct": round(overflow, 2),
+            # 旋转时每一帧都要栅格化所有实例的路径命令
+            "cost": commands * instances}
+
+# ================= DOM / CSS =================
+
+class _Element:
+    __slots__ = ("tag", "classes", "parent")
+
+    def __init__(self, tag, classes, parent):
+        self.tag, self.classes, self.parent = tag, classes, parent
+
+class _DomBuilder(HTMLParser):
+    VOID = {"meta", "link", "br", "img", "input", "hr"}
+
+    def __init__(self):
+        super().__init__()
+        self.elements, self.stack = [], []
+
+    def handle_starttag(self, tag, attrs):
+        classes = set((dict(attrs).get("class") or "").split())
+        el = _Element(tag, classes, self.stack[-1] if self.stack else None)
+        self.elements.append(el)
+        if tag not in self.VOID: self.stack.append(el)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in self.VOID and self.stack: self.stack.pop()
+
+    def handle_endtag(self, tag):
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                break
+
+def _compound_matches(el, compound, runtime, holder):
+    if compound == ':root': return el.tag == 'html'
+    compound = re.sub(r'::?[\w-]+(\([^)]*\))?', '', compound)
+    tag = re.match(r'^[\w-]+|^\*', compound)
+    if tag and tag.group() not in ('*', el.tag): return False
+    return all(c in el.classes or (c in runtime and el is holder) for c in re.findall(r'\.([\w-]+)', compound))
+
+def _selector_matches(el, parts, runtime=(), holder=None):
+    if not _compound_matches(el, parts[-1], runtime, holder): return False
+    node = el.parent
+    for compound in reversed(parts[:-1]):
+        while node is not None and not _compound_matches(node, compound, runtime, holder): node = node.parent
+        if node is None: return False
+        node = node.parent
+    return True
+
+def _subtree(elements, root):
+    result = []
+    for el in elements:
+        node = el
+        while node is not None and node is not root: node = node.parent
+        if node is root: result.append(el)
+    return result
+
+def _parse_css(css):
+    # 返回 (普通规则 [(选择器, {属性: 值})], keyframes {名字: 被动画的属性集合})
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    rules, keyframes, pos = [], {}, 0
+    for match in re.finditer(r'([^{}]+)\{', css):
+        if match.start() < pos: continue
+        selector = match.group(1).strip()
+        depth, i = 1, match.end()
+        while depth and i < len(css):
+            depth += {'{': 1, '}': -1}.get(css[i], 0)
+            i += 1
+        block, pos = css[match.end():i - 1], i
+        if selector.startswith('@keyframes'):
+            keyframes[selector.split()[1]] = set(re.findall(r'([\w-]+)\s*:', re.sub(r'[^{}]+\{', '', block)))
+        elif not selector.startswith('@'):
+            props = dict((k.strip(), v.strip()) for k, v in re.findall(r'([\w-]+)\s*:\s*([^;]+)', block))
+            rules.append((selector, props))
+    return rules, keyframes
+
+def analyze_css(html):
+    css = "\n".join(re.findall(r'<style>(.*?)</style>', html, re.S))
+    rules, keyframes = _parse_css(css)
+    dom = _DomBuilder()
+    dom.feed(html)
+    static_classes = set().union(*(el.classes for el in dom.elements))
+    # 每个卷轴的子树（含 .reel 本身），运行时状态类都挂在卷轴内部
+    reels = [_subtree(dom.elements, el) for el in dom.elements if "reel" in el.classes]
+
+    report = []
+    for selector, props in rules:
+        animated = set()
+        if "animation" in props:
+            for name in re.findall(r'[\w-]+', props["animation"]):
+                animated |= keyframes.get(name, set())
+        if "transition" in props:
+            transition = re.sub(r'\([^)]*\)', '', props["transition"])
+            animated |= {p for p in re.findall(r'(?:^|,)\s*([\w-]+)', transition) if p not in ("all", "none")}
+        # filter 本身不动，但挂在做动画的层上时每帧都要重新模糊
+        if "filter" in props and animated: animated.add("filter")
+        slow = sorted(animated - COMPOSITOR_PROPS)
+
+        for part in selector.split(','):
+            parts = part.split()
+            if not parts: continue
+            runtime = {c for c in re.findall(r'\.([\w-]+)', part) if c not in static_classes}
+            if runtime:
+                # 运行时才加上的类（heartbeat、blur-spin...）：假设每个卷轴同一时刻只有一个元素持有，取最坏情况
+                matched = []
+                for nodes in reels:
+                    best = max(([el for el in nodes if _selector_matches(el, parts, runtime, holder)] for holder in nodes), key=len)
+                    matched += best
+            else:
+                matched = [el for el in dom.elements if _selector_matches(el, parts)]
+            # filter 作用于整棵子树，代价按子树节点数计
+            nodes = sum(len(_subtree(dom.elements, el)) for el in matched) if "filter" in slow else len(matched)
+            weight = sum(PROP_WEIGHTS.get(p, DEFAULT_WEIGHT) for p in slow)
+            report.append({"selector": part.strip(), "multiplicity": len(matched), "nodes": nodes, "runtime": bool(runtime),
+                           "animated": sorted(animated), "non_compositor": slow, "cost": weight * nodes})
+    return report
+
+def analyze(h_icons, a_icons):
+    out = io.StringIO()
+    main.write_html(main.render_page(h_icons, a_icons), out)
+    # h_reel 一个卷轴，a_reel 两个卷轴；每个卷轴的份数取决于是否虚拟化
+    copies = main._reel_copies()
+    icons = [analyze_icon(i, copies) for i in h_icons] + [analyze_icon(i, 2 * copies) for i in a_icons]
+    return sorted(icons, key=lambda r: -r["cost"]), sorted(analyze_css(out.getvalue()), key=lambda r: -r["cost"])
+
+def format_report(icons, rules):
+    lines = ["== 图标（按每帧栅格化命令数排序）==",
+             f"{'icon':<12}{'inst':>5}{'paths':>6}{'cmds':>6}{'nodes':>6}{'overflow%':>10}{'cost':>7}"]
+    for r in icons:
+        lines.append(f"{r['name']:<12}{r['instances']:>5}{r['paths']:>6}{r['commands']:>6}{r['nodes']:>6}{r['overflow_pct']:>10.2f}{r['cost']:>7}")
+    lines += ["", "== CSS 规则（按非合成属性动画代价排序）==",
+              f"{'selector':<40}{'DOM':>5}{'nodes':>7}  {'non-compositor':<20}cost"]
+    for r in rules:
+        flag = "⚠️ " if r["non_compositor"] else "   "
+        dom = f"{r['multiplicity']}{'*' if r['runtime'] else ''}"
+        lines.append(f"{flag}{r['selector'][:37]:<37}{dom:>5}{r['nodes']:>7}  {', '.join(r['non_compositor']) or '-':<20}{r['cost']}")
+    lines.append("* 含运行时才添加的类，按每个卷轴同时只有一个元素持有该类估算最坏情况")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="静态分析图标与生成 CSS 的渲染代价")
+    parser.add_argument("--all", action="store_true", help="CSS 部分也列出没有非合成动画的规则")
+    args = parser.parse_args()
+    h_icons, a_icons = main.load_icons(main.H_REEL_DIR), main.load_icons(main.A_REEL_DIR)
+    icons, rules = analyze(h_icons, a_icons)
+    if not args.all: rules = [r for r in rules if r["non_compositor"]]
+    print(format_report(icons, rules))
@@ -0,0 +1,145 @@
+import argparse
+import gzip
+import io
+import json
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import main
+import svg_loader
+
+# ================= 配置 =================
+BASE_DIR = Path(__file__).parent
+BENCH_TXT = BASE_DIR / "bench_output.txt"
+BENCH_JSON = BASE_DIR / "bench_output.json"
+SYNTHETIC_SIZES = (100, 500)   # 合成图标集的图标总数（两个卷轴各一半）
+REPEAT = 5                     # 计时取最小值，减少偶发抖动
+THRESHOLD = 0.10               # 字节数 / 内存回退超过 10% 判定失败
+TIME_THRESHOLD = 0.30          # 耗时波动更大，单独给宽一些的阈值
+
+# 数值越大越差的指标；比较模式只看这些
+METRICS = ("load_ms", "strip_ms", "generate_ms", "peak_kb", "output_bytes", "gzip_bytes")
+
+# ================= 图标集 =================
+
+def _jitter_svg(content, rng):
+    # 在原图标基础上轻微扰动坐标，得到“内容不同但规模相近”的合成图标
+    return re.sub(r'\d+\.\d+', lambda m: f"{float(m.group()) + rng.uniform(-0.5, 0.5):.4f}", content)
+
+def make_synthetic_set(root, total, seed=0):
+    rng = random.Random(seed)
+    sources = sorted(main.H_REEL_DIR.glob("*.svg")) + sorted(main.A_REEL_DIR.glob("*.svg"))
+    dirs = (Path(root) / "h_reel", Path(root) / "a_reel")
+    for d in dirs: d.mkdir(parents=True, exist_ok=True)
+    for i in range(total):
+        source = sources[i % len(sources)]
+        # 保留 alien / human 原名各一次，保证特效注入也在测量范围内
+        name = source.stem if i < len(sources) else f"{source.stem}_{i:04d}"
+        content = source.read_text(encoding='utf-8')
+        if i >= len(sources): content = _jitter_svg(content, rng)
+        (dirs[i % 2] / f"{name}.svg").write_text(content, encoding='utf-8')
+    return dirs
+
+# ================= 测量 =================
+
+def _best_ms(func, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def measure(name, h_dir, a_dir, repeat=REPEAT):
+    # 全部关闭缓存，测的是冷构建本身；svg_loader 的进程内记忆也每次清空，否则只有第一轮包含解析
+    def load():
+        svg_loader._MEMO.clear()
+        return main.load_icons(h_dir), main.load_icons(a_dir)
+
+    def generate():
+        h_icons, a_icons = load()
+        out = io.StringIO()
+        main.write_html(main.render_page(h_icons, a_icons), out)
+        return out.getvalue()
+
+    load_ms, (h_icons, a_icons) = _best_ms(load, repeat)
+    strip_ms, _ = _best_ms(lambda: [main._build_strip(icons * main._reel_copies(), main.SPRITE_MODE) for icons in (h_icons, a_icons)], repeat)
+    generate_ms, html = _best_ms(generate, repeat)
+
+    tracemalloc.start()
+    generate()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    data = html.encode('utf-8')
+    return {"case": name, "icons": len(h_icons) + len(a_icons),
+            "load_ms": round(load_ms, 2), "strip_ms": round(strip_ms, 2), "generate_ms": round(generate_ms, 2),
+            "peak_kb": round(peak / 1024, 1), "output_bytes": len(data),
+            "gzip_bytes": len(gzip.compress(data, compresslevel=9, mtime=0))}
+
+def run_suite(sizes=SYNTHETIC_SIZES, repeat=REPEAT):
+    results = [measure("real", main.H_REEL_DIR, main.A_REEL_DIR, repeat)]
+    root = Path(tempfile.mkdtemp(prefix="haa_bench_"))
+    try:
+        for total in sizes:
+            h_dir, a_dir = make_synthetic_set(root / f"syn_{total}", total)
+            results.append(measure(f"synthetic-{total}", h_dir, a_dir, repeat))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return results
+
+# ================= 报告 / 比较 =================
+
+def format_table(results):
+    header = f"{'case':<16}{'icons':>6}{'load ms':>10}{'strip ms':>10}{'gen ms':>10}{'peak KB':>10}{'bytes':>10}{'gzip':>9}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(f"{r['case']:<16}{r['icons']:>6}{r['load_ms']:>10.2f}{r['strip_ms']:>10.2f}{r['generate_ms']:>10.2f}"
+                     f"{r['peak_kb']:>10.1f}{r['output_bytes']:>10}{r['gzip_bytes']:>9}")
+    return "\n".join(lines)
+
+def compare(results, baseline, threshold=THRESHOLD, time_threshold=TIME_THRESHOLD):
+    regressions = []
+    base_by_case = {r["case"]: r for r in baseline}
+    for r in results:
+        base = base_by_case.get(r["case"])
+        if not base: continue
+        for metric in METRICS:
+            limit = time_threshold if metric.endswith("_ms") else threshold
+            old, new = base.get(metric), r.get(metric)
+            if old and new is not None and new > old * (1 + limit):
+                regressions.append(f"{r['case']}.{metric}: {old} -> {new} (+{100 * (new - old) / old:.0f}%, 阈值 {limit:.0%})")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="生成器基准测试：耗时 / 峰值内存 / 输出大小")
+    parser.add_argument("--compare", metavar="JSON", help="与之前保存的结果比较，任一指标回退超过阈值则返回非零")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="字节数 / 内存允许的回退比例")
+    parser.add_argument("--time-threshold", type=float, default=TIME_THRESHOLD, help="耗时允许的回退比例")
+    parser.add_argument("--sizes", type=int, nargs="*", default=list(SYNTHETIC_SIZES), help="合成图标集规模")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    args = parser.parse_args()
+
+    # 先读基线，允许直接拿上一次的 bench_output.json 做比较
+    baseline = json.loads(Path(args.compare).read_text(encoding='utf-8')) if args.compare else None
+    results = run_suite(args.sizes, args.repeat)
+    table = format_table(results)
+    print(table)
+    BENCH_TXT.write_text(table + "\n", encoding='utf-8')
+    BENCH_JSON.write_text(json.dumps(results, indent=2) + "\n", encoding='utf-8')
+    print(f"结果已写入 {BENCH_TXT.name} / {BENCH_JSON.name}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold, args.time_threshold)
+        if regressions:
+            print("❌ 性能回退:")
+            for line in regressions: print(f"  {line}")
+            sys.exit(1)
+        print("✅ 无回退")
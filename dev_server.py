@@ -0,0 +1,231 @@
+import importlib
+import json
+import os
+import queue
+import threading
+import time
+import webbrowser
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# ================= 配置 =================
+BASE_DIR = Path(__file__).parent
+DEV_HOST = "127.0.0.1"
+DEV_PORT = 8765
+POLL_INTERVAL = 0.05     # 文件轮询间隔（秒），保证改动后 100ms 内有反馈
+EVENTS_PATH = "/__events"
+CONFIG_PATH = "/__config"   # 调试台 POST 参数到这里，合并写入 run(config_file=...)
+
+# 注入到每个 HTML 页面的客户端：reload = 整页刷新，icon = 只替换 sprite 里的一个 <symbol>
+LIVE_RELOAD_SCRIPT = """
+<script>
+(() => {
+    const events = new EventSource('%s');
+    events.addEventListener('reload', () => location.reload());
+    events.addEventListener('icon', e => {
+        const icon = JSON.parse(e.data);
+        const symbol = document.getElementById(icon.id);
+        if (!symbol) return location.reload();
+        const uses = document.querySelectorAll(`use[href="#${icon.id}"]`);
+        if (icon.body !== undefined) {
+            if (icon.viewBox) {
+                symbol.setAttribute('viewBox', icon.viewBox);
+                uses.forEach(u => u.parentNode.setAttribute('viewBox', icon.viewBox));
+            }
+            symbol.innerHTML = icon.body;
+        }
+        // overlay 跟在每个实例的 <use> 后面
+        if (icon.overlay !== undefined) uses.forEach(u => {
+            while (u.nextSibling) u.nextSibling.remove();
+            u.insertAdjacentHTML('afterend', icon.overlay);
+        });
+    });
+})();
+</script>
+""" % EVENTS_PATH
+
+# ================= 事件广播 =================
+
+class EventHub:
+    def __init__(self):
+        self._clients = []
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        client = queue.Queue()
+        with self._lock: self._clients.append(client)
+        return client
+
+    def unsubscribe(self, client):
+        with self._lock:
+            if client in self._clients: self._clients.remove(client)
+
+    def publish(self, event, data=None):
+        message = f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode('utf-8')
+        with self._lock:
+            for client in self._clients: client.put(message)
+        return len(self._clients)
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    hub = None
+    config_file = None
+    written = None      # 服务器自己写过的文件 -> (mtime_ns, size)，监听时忽略这些变化
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path == EVENTS_PATH: return self._serve_events()
+        if path.endswith('.html') or path.endswith('/'):
+            file = Path(self.translate_path(path))
+            if file.is_dir(): file = file / "index.html"
+            if file.is_file(): return self._serve_html(file)
+        return super().do_GET()
+
+    def do_POST(self):
+        if self.path.split('?', 1)[0] != CONFIG_PATH or self.config_file is None:
+            return self.send_error(404)
+        # 错误信息会写进状态行（只能是 latin-1），所以用英文
+        # 只接受本服务器页面发来的 JSON：别的网页可以向 127.0.0.1 提交 text/plain 表单，但改不了 Content-Type 和 Origin
+        # （跨域的 application/json 请求要先过 CORS 预检，而这里不响应 OPTIONS）
+        if self.headers.get_content_type() != "application/json":
+            return self.send_error(415, "Content-Type must be application/json")
+        origin = self.headers.get("Origin")
+        if origin is not None and origin not in self._own_origins():
+            return self.send_error(403, "Cross-origin request rejected")
+        try:
+            update = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+            if not isinstance(update, dict): raise ValueError("expected a JSON object")
+        except ValueError as e:
+            return self.send_error(400, str(e))
+        config = _merge_config(self.config_file, update)
+        stat = self.config_file.stat()
+        self.written[self.config_file] = (stat.st_mtime_ns, stat.st_size)
+        body = json.dumps(config, ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _own_origins(self):
+        port = self.server.server_address[1]
+        return {f"http://{host}:{port}" for host in (DEV_HOST, "localhost", "127.0.0.1")}
+
+    def _serve_html(self, file):
+        html = file.read_text(encoding='utf-8')
+        if '</body>' in html: html = html.replace('</body>', f'{LIVE_RELOAD_SCRIPT}</body>', 1)
+        else: html += LIVE_RELOAD_SCRIPT
+        body = html.encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _serve_events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        client = self.hub.subscribe()
+        try:
+            while True:
+                try: message = client.get(timeout=15)
+                except queue.Empty: message = b": keep-alive\n\n"
+                self.wfile.write(message)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError): pass
+        finally: self.hub.unsubscribe(client)
+
+    def log_message(self, format, *args):
+        pass
+
+_CONFIG_LOCK = threading.Lock()
+
+def _merge_config(path, update):
+    # 按段合并：{"alien": {...}} 只覆盖 alien 段里给出的键
+    with _CONFIG_LOCK:
+        try: config = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError): config = {}
+        for section, values in update.items():
+            if isinstance(values, dict) and isinstance(config.get(section), dict): config[section].update(values)
+            else: config[section] = values
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(config, ensure_ascii=False, indent=2) + "\n", encoding='utf-8')
+        os.replace(tmp, path)
+    return config
+
+# ================= 文件监听 =================
+
+def _snapshot(paths):
+    state = {}
+    for root in paths:
+        root = Path(root)
+        if root.is_file():
+            stat = root.stat()
+            state[root] = (stat.st_mtime_ns, stat.st_size)
+            continue
+        for dirpath, _, files in os.walk(root):
+            for name in files:
+                file = Path(dirpath) / name
+                try: stat = file.stat()
+                except OSError: continue
+                state[file] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+def _changed(before, after):
+    return {p for p in before.keys() | after.keys() if before.get(p) != after.get(p)}
+
+def run(module_name, build, page, watch_paths, hot_swap=None, build_kwargs=None, port=DEV_PORT, root=BASE_DIR,
+        config_file=None):
+    # module_name: 要监听并热重载的脚本模块；build: 模块里的生成函数名，需支持 open_browser=False
+    # hot_swap: 模块里的函数名，(旧结果, 新结果) -> icon 补丁列表；返回 None 表示需要整页刷新
+    # config_file: 允许页面通过 POST CONFIG_PATH 写入的 JSON 文件
+    build_kwargs = dict(build_kwargs or {}, open_browser=False)
+    module = importlib.import_module(module_name)
+    source = Path(module.__file__).resolve()
+    watch_paths = [Path(p).resolve() for p in watch_paths] + [source]
+
+    hub = EventHub()
+    written = {}
+    config_file = Path(config_file).resolve() if config_file else None
+    handler = partial(type("Handler", (DevRequestHandler,), {"hub": hub, "config_file": config_file, "written": written}),
+                      directory=str(root))
+    server = ThreadingHTTPServer((DEV_HOST, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    result = getattr(module, build)(**build_kwargs)
+    url = f"http://{DEV_HOST}:{port}/{Path(page).resolve().relative_to(Path(root).resolve()).as_posix()}"
+    print(f"开发服务器已启动: {url}  (Ctrl+C 退出)")
+    webbrowser.open(url)
+
+    state = _snapshot(watch_paths)
+    try:
+        while True:
+            time.sleep(POLL_INTERVAL)
+            current = _snapshot(watch_paths)
+            # 自己刚通过 CONFIG_PATH 写入的文件不算变化：调试台拖动滑块时不刷新自己
+            changed = {p for p in _changed(state, current) if written.get(p) is None or written.get(p) != current.get(p)}
+            state = current
+            if not changed: continue
+            started = time.perf_counter()
+            try:
+                # 配置常量在脚本里：脚本本身变了就重新加载模块
+                if source in changed: module = importlib.reload(module)
+                previous, result = result, getattr(module, build)(**build_kwargs)
+            except Exception as e:
+                print(f"❌ 重新生成失败: {e}")
+                continue
+            patches = getattr(module, hot_swap)(previous, result) if hot_swap and source not in changed else None
+            if patches is None: clients = hub.publish("reload")
+            else: clients = max([hub.publish("icon", patch) for patch in patches] or [0])
+            elapsed = (time.perf_counter() - started) * 1000
+            mode = "整页刷新" if patches is None else f"热替换 {len(patches)} 个图标"
+            print(f"🔁 {len(changed)} 个文件变化 -> 重新生成 {elapsed:.0f} ms，{mode}，{clients} 个页面")
+    except KeyboardInterrupt:
+        print("已停止")
+    finally:
+        server.shutdown()
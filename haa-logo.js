@@ -0,0 +1,283 @@
+// <haa-logo> 自定义元素，由 main.py --component 生成，不要手工修改
+// 用法：<script src="haa-logo.js" defer></script> 之后在页面任意位置写 <haa-logo></haa-logo>
+(() => {
+        const STYLE = "        :where(haa-logo) {\n            --size: 80px;\n            --gap: 3px;\n            --bg-color: #f4f4f4;\n            --icon-color: #000000;\n            --heart-color: #D32F2F;\n            --water-color: #000000;\n            --anchor-hover-y: calc(var(--size) * -0.075); \n        }\n        /* === Logo 容器 === */\n        .haa-logo {\n            display: flex;\n            gap: var(--gap);\n            position: relative;\n        }\n\n        /* 遮罩 */\n        .haa-logo::before, .haa-logo::after {\n            content: \"\";\n            position: absolute;\n            left: 0; right: 0;\n            height: 25%; \n            z-index: 10; \n            pointer-events: none;\n        }\n        .haa-logo::before { top: 0; background: linear-gradient(to bottom, var(--bg-color) 0%, transparent 100%); }\n        .haa-logo::after { bottom: 0; background: linear-gradient(to top, var(--bg-color) 0%, transparent 100%); }\n\n        .reel {\n            width: var(--size);\n            height: var(--size);\n            overflow: hidden; \n            position: relative;\n            z-index: 1; \n        }\n        \n        .reel.pop-out {\n            overflow: visible !important; \n            z-index: 20; \n        }\n\n        .reel.pop-out .strip .icon-box { opacity: 0; transition: opacity 0s; }\n        .reel.pop-out .strip .icon-box.active-overlay { opacity: 1; }\n\n        .strip {\n            display: flex;\n            flex-direction: column;\n            will-change: transform;\n        }\n\n        .icon-box {\n            width: var(--size);\n            height: var(--size);\n            display: flex;\n            justify-content: center;\n            align-items: center;\n            flex-shrink: 0;\n            position: relative;\n        }\n\n        /* sprite 容器：只提供 <symbol> 定义，不参与布局 */\n        .icon-sprite { position: absolute; width: 0; height: 0; overflow: hidden; }\n\n        .haa-logo svg {\n            width: 70%; \n            height: 70%;\n            fill: var(--icon-color);\n            transition: fill 0.3s ease;\n            transform-origin: center center;\n            /* 允许内容溢出画布 */\n            overflow: visible !important; \n        }\n\n        /* === 模糊旋转 === */\n        /* 预模糊贴图：两轮图标，平移 -50% 正好一轮 */\n        .spin-texture { position: absolute; top: 0; left: 0; width: var(--size); display: none; pointer-events: none;\n                        background-repeat: no-repeat; background-size: 100% 100%; will-change: transform; }\n        .reel.spinning .spin-texture { display: block; animation: texture-spin 0.4s linear infinite; }\n        .reel.spinning .strip { visibility: hidden; }\n        @keyframes texture-spin { 0% { transform: translateY(0); } 100% { transform: translateY(-50%); } }\n        .spin-h { height: calc(var(--size) * 14); background-image: url(\"data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 80 80 1120' fill='%23000000'%3E%3Cdefs%3E%3Csymbol id='s0' viewBox='0 0 200 200'%3E%3Cpath d='M143.55 95.96l40.39-40.39 15.05 15.06c1.33 1.33 1.9 3.31 1.58 5.52l-3.29 6.22-26.93 26.93-6.23 3.29c-2.2.32-4.19-.24-5.52-1.57zM39.27 180.17l-6.23 3.29c-2.2.32-4.19-.24-5.52-1.57L7.45 161.82c-1.33-1.33-1.9-3.32-1.58-5.52l3.29-6.23 94.25-94.25L70.79 23.21 83.76 10.24l4.02-2.68 4.28-.64 49.23 6L173.9 45.54z'/%3E%3C/symbol%3E%3Csymbol id='s1' viewBox='0 0 182 181'%3E%3Cpath d='M90.72 0C40.68 0 0 40.56 0 90.44c0 49.88 40.68 90.44 90.72 90.44 50.05 0 90.73-40.56 90.73-90.44C181.45 40.56 140.77 0 90.72 0zM49.66 76.73c-2.25 8.08-14.86 4.66-12.61-3.43 6.38-22.47 39.36-22.59 45.65 0 .96 3.43-.95 7.05-4.58 8l-1.72.19c-2.87 0-5.54-1.9-6.3-4.76-2.96-10.12-17.48-10.11-20.44 0zm75.06 40.56c-8.75 34.46-59.84 34.07-67.99-.58-.96-3.99 2.48-7.99 6.68-7.99h54.82c4.39-.19 7.64 4.19 6.49 8.57zM139.81 81.3l-1.72.19c-2.86 0-5.54-1.9-6.3-4.76-2.97-10.14-17.66-10.14-20.63 0-2.25 8.08-14.86 4.66-12.6-3.43 6.38-22.47 39.35-22.58 45.65 0 .95 3.43-.96 7.05-4.4 8z'/%3E%3C/symbol%3E%3Csymbol id='s2' viewBox='0 0 168 200'%3E%3Cpath d='M53.65.54c-2.2 1-3 2.86-3.4 7.91l-.8 4.41-3.65-2.25c-3.9-2.76-6.55-3.91-8.1-3.56-3.15.8-6.55 5.66-6 8.61 .35 1.81 1.55 2.86 8.05 7.22L60.2 39.35 47.45 49.67 32.15 30.44C23.23 23.1 6.03 33.93 1.6 42.31L0 48.37c0 2.85.15 3.25 2.85 7.16L13.1 72.3l-2.5 3.26C5.4 82.47 3.45 91.23 3.75 106.5c.77 36.97 18.56 87.83 60.7 93.2 7.85 1 18.55-.55 25.65-3.71l11.05-7.31 20.4-28.34c16.57-22.38 34.64-52.16 17.35-79.47l-2.05-3.21c-.5-.85 6.95-2.6 12.45-2.95l6.85-1.11c17.82-5.62 14.89-38.52-4.25-39.61-5.25-.3-20.6 3.21-30.1 6.86l-3.95 1.51-3.05-2.16c-6.9-4.9-13.85-7.21-22.95-7.66l-5.95-.3L87.1 5.3l-12.85.3L72 33.09 61.9 22.38l.85-8.47c.55-5.69.56-17.83-9.1-13.37zM30.1 49.27l9.5 14.17-.6 2.6c-.85 3.51-.85 3.51-2.6 2.61L25.6 66.44 17.85 53.67c-3.65-5.3-3.7-5.51-2.9-6.61l8.85-4.65zM95 46.41l8.5 2.96L79.1 67.04c-7.61 1.91-10.6 9.82-7.45 16.63L73 86.62l-5.45 5.61c-5.28 5.4-8.88 10.54-5.3 18.13 2.35 5.16 8.2 9.87 15.15 12.22l3.1 1.6-3.25 13.67-9.75 17.98 10.9 8.26 1-1.35c7.5-10.72 12.45-23.34 14.15-35.95 .6-4.41.65-4.56 2.95-6.82l5.05-9.56c2.65-7.36 13.35-20.18 21.1-25.34l1.95-1.3 .95 1.25 6 12.97 .65 8.26c-.05 12.92-5.85 25.04-22.9 47.78l-9 13.22c-5.85 9.86-11.55 15.12-18.95 17.47L72 185.98l-10.75-.8c-25.39-6.16-37.24-36.23-41.7-59.15-4.85-25.08-2.7-41.71 5.95-45.21 10.23-4.21 11.12 13.62 9.75 19.43-1.29 5.39 2.39 11.51 8.6 9.21 4.1-1.6 5.1-5.16 5.65-20.48 .72-20.38 9.04-39.77 32-42.52zm58.1 2.86c3.63 6.09-3.6 16.85-5.6 7.41-1.35-6.61 2.85-12.22 5.6-7.41zm-19.5 4.85l.95 8.67-2.9 1.5c-17.94 7.26-36.35 23.36-43.1 41.91l-1.35 3.56-2.4.15L75.25 106c-1.5-1.67 11.77-14.16 11.7-19.28l-1.3-6.21L93.25 74c7.15-6.41 16.55-12.66 25.55-16.92l14.45-5.66z'/%3E%3C/symbol%3E%3Csymbol id='s3' viewBox='0 0 176 188'%3E%3Cpath d='M163.32 75.45l-4.75-16.83c-1.49-3.28-3.08-6.03-7.25-6.37C147.45 26.95 122.22 0 87.55 0 52.7 0 27.36 26.96 23.49 52.26c-4.27.42-5.82 3.84-7.01 6.51l-4.7 16.68C5.22 75.86 0 81.36 0 88.06v23.21c0 6.97 5.64 12.64 12.57 12.64h3.52l2.69 10.83c1.06 4 3.9 6.3 8.03 6.55 10.34 31.24 22.67 46.43 37.67 46.43h46.14c15 0 27.33-15.19 37.67-46.43 4.13-.25 6.97-2.55 8.03-6.56l2.69-10.82h3.52c6.93 0 12.57-5.67 12.57-12.64V88.06c0-6.7-5.22-12.2-11.78-12.61zM31.03 116.03L25.61 83.29H149.49l-5.42 32.74z'/%3E%3Cpath d='M76.01 186.68H99.09c5.1 0 5.1-7.87 0-7.87H76.01c-5.1 0-5.1 7.87 0 7.87z'/%3E%3C/symbol%3E%3Csymbol id='s4' viewBox='0 0 138 183'%3E%3Cpath d='M126.44 56.49C125.92 25.25 100.3 0 68.88 0 37.46 0 11.84 25.25 11.32 56.49 4.99 57 0 62.3 0 68.75v62.09c0 6.45 5 11.75 11.33 12.26 .72 18.69 21.94 39.55 40.58 39.55H85.85c18.65 0 39.87-20.86 40.58-39.55 6.33-.51 11.33-5.81 11.33-12.26V68.75c0-6.45-4.99-11.75-11.32-12.26zM91.51 152.41H46.26c-9.17 0-17.43-4.48-22.41-11.79 6.36 5.3 14.13 8.16 22.41 8.16H91.51c8.16 0 16.07-2.94 22.45-8.22-4.98 7.35-13.26 11.85-22.45 11.85zm0-11.29H46.26c-14.78 0-27.27-12.21-27.27-26.65V57.46c0-27.46 22.38-49.8 49.89-49.8 27.51 0 49.89 22.34 49.89 49.8v57.01c0 14.44-12.48 26.65-27.26 26.65z'/%3E%3C/symbol%3E%3Csymbol id='s5' viewBox='0 0 165 165'%3E%3Cpath d='M154.43 164.72H109.02c-5.46 0-9.92-4.48-9.92-9.95V111.89c0-9.25-7.7-17.03-16.96-17.03l-.75.04c-8.91.38-16.17 8.64-16.17 18.42v41.45c0 5.47-4.47 9.95-9.92 9.95H9.88c-5.46 0-9.88-4.44-9.88-9.92V76.64c0-2.74 1.16-5.41 3.18-7.29L75.44 2.61c3.85-3.54 9.73-3.42 13.44 0l72.29 66.74c2.03 1.88 3.19 4.55 3.19 7.29l-.01 78.13c0 5.47-4.46 9.95-9.92 9.95z'/%3E%3C/symbol%3E%3Csymbol id='s6' viewBox='0 0 163 190'%3E%3Cpath d='M81.5 36.36c21.53 0 24.78-31.85 3.59-36.01C59.73-4.63 55.22 36.36 81.5 36.36z'/%3E%3Cpath d='M152.48 44.15H131.74l21.12-11.37 2.03-3.54-.59-7.94c-2.6-5.08-9.03-7.13-14.12-4.6L84.94 44.15H78.37L23.14 16.7C11.09 10.71 1.52 29.19 13.67 35.24l17.88 8.91H10.52c-13.55 0-13.55 20.78 0 20.78H57.84V95.35L15.91 161.13l1.79 7.76 2.99 2.79 7.81 2.99 6.06-1.92 23.28-35.09v41.55c0 5.71 4.84 10.39 10.51 10.39l9.59-.93 3.56-2.6 3.56 2.6 9.59.93c5.67 0 10.51-4.68 10.51-10.39V137.66l23.25 34.99 6.09 1.91 7.81-2.99 4.66-6.5 .11-4.07-41.92-65.65V64.93h47.32c13.55 0 13.55-20.78 0-20.78z'/%3E%3C/symbol%3E%3Cfilter id='b'%3E%3CfeGaussianBlur stdDeviation='2'/%3E%3C/filter%3E%3C/defs%3E%3Cg filter='url(%23b)'%3E%3Cuse href='%23s6' x='12' y='12' width='56' height='56'/%3E%3Cuse href='%23s0' x='12' y='92' width='56' height='56'/%3E%3Cuse href='%23s1' x='12' y='172' width='56' height='56'/%3E%3Cuse href='%23s2' x='12' y='252' width='56' height='56'/%3E%3Cuse href='%23s3' x='12' y='332' width='56' height='56'/%3E%3Cuse href='%23s4' x='12' y='412' width='56' height='56'/%3E%3Cuse href='%23s5' x='12' y='492' width='56' height='56'/%3E%3Cuse href='%23s6' x='12' y='572' width='56' height='56'/%3E%3Cuse href='%23s0' x='12' y='652' width='56' height='56'/%3E%3Cuse href='%23s1' x='12' y='732' width='56' height='56'/%3E%3Cuse href='%23s2' x='12' y='812' width='56' height='56'/%3E%3Cuse href='%23s3' x='12' y='892' width='56' height='56'/%3E%3Cuse href='%23s4' x='12' y='972' width='56' height='56'/%3E%3Cuse href='%23s5' x='12' y='1052' width='56' height='56'/%3E%3Cuse href='%23s6' x='12' y='1132' width='56' height='56'/%3E%3Cuse href='%23s0' x='12' y='1212' width='56' height='56'/%3E%3C/g%3E%3C/svg%3E\"); }\n        .spin-a { height: calc(var(--size) * 14); background-image: url(\"data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 80 80 1120' fill='%23000000'%3E%3Cdefs%3E%3Csymbol id='s0' viewBox='0 0 171 171'%3E%3Cpath d='M58.4 170.62c-2.2 0-4.27-.86-5.82-2.41l-18.19-33.6L2.41 118.12c-3.21-3.21-3.21-8.43 0-11.63L13.39 95.52l27.55 7.12L67.56 73.18 3.88 37.95c-3.55-3.54-3.55-9.46 0-13.01L20.31 8.53l84.18 25.16L128.97 7.57c14.95-14.92 42.15-5.58 41.52 16.55-.18 6.49-2.87 12.66-7.57 17.35L136.97 65.72l25.36 84.62-16.43 16.4c-3.55 3.55-9.48 3.55-13.03 0L97.32 102.68 67.94 129.2l7.27 28.05-10.98 10.96c-1.56 1.55-3.63 2.41-5.83 2.41z'/%3E%3C/symbol%3E%3Csymbol id='s1' viewBox='0 0 156 188'%3E%3Cpath d='M77.56 0c42.25 0 77.56 35.32 77.56 77.56 0 59.31-50.18 109.5-77.56 109.5C50.19 187.06 0 136.88 0 77.56 0 35.32 35.32 0 77.56 0zm50.19 91.25c-24.04 0-43.37 21.49-40.83 45.4 25.6 2.72 47.88-19.57 45.16-45.17zm-100.38 0l-4.33.23c-2.72 25.6 19.57 47.89 45.17 45.17 2.54-23.91-16.8-45.4-40.83-45.4z'/%3E%3C/symbol%3E%3Csymbol id='s2' viewBox='0 0 185 191'%3E%3Cpath d='M92.37 20.55c11.04 0 11.04 17.18 0 17.18-11.05 0-11.05-17.18 0-17.18zM92.5 0c-29 0-39.12 39.38-14.88 53.99l.01 20.92H63.5c-19.18 0-19.18 29.85 0 29.85l14.13.01v46.35c-13.86-3.59-25.36-12.04-32.53-23.04l2.45-3.05c4.22-6.89 2.18-15.88-4.52-20.27L30.51 97.02l-7.76-2.21c-4.95 0-9.82 2.51-12.62 7.1L2.47 113.44c-6.44 9.74.88 23.11 12.33 23.11l.86-.02c11.29 22.54 32.95 39.09 58.62 44.44l6.24 4.05c2.84 3.8 7.29 5.98 11.94 5.98h.04c5.11 0 9.61-2.6 12.28-6.51l6.18-3.6c25.51-5.44 47.02-21.93 58.25-44.37l.98.03c11.46 0 18.78-13.37 12.33-23.11l-7.86-11.87c-2.83-4.38-7.59-6.76-12.41-6.76l-7.76 2.21-12.19 7.54c-6.98 4.31-9.14 13.47-4.86 20.46l2.38 2.98c-7.14 11-18.62 19.47-32.45 23.07V104.76l14.13.01c19.18-.02 19.18-29.85 0-29.87l-14.13.01L107.35 54C131.45 39.49 121.69.35 92.86 0z'/%3E%3C/symbol%3E%3Csymbol id='s3' viewBox='0 0 200 200'%3E%3Cpath fill-rule='evenodd' d='M101.07 184.88c28.95 16.93 55.56-14.36 67.38-38.22 12.85-25.98 19.31-75.6-15.21-88.69-18-6.83-35.88-2.57-52.26 6.59l-2.99-.02C77.13 52.9 44.92 47.77 29.23 70.81c-24.91 36.52 1.24 90.25 32.84 113.16 10.83 7.85 24.56 7.54 35.9.89z'/%3E%3Cpath d='M86.13 48.36c4.49 1.67 9.07 2.42 13.44 2.22 .98-21.16-19.37-41.53-40.54-40.55-.78 16.78 11.77 32.64 27.1 38.33z'/%3E%3C/symbol%3E%3Csymbol id='s4' viewBox='0 0 166 165'%3E%3Cpath d='M82.88 0L60.43 52.28C49.92 74.12 33.44 105.22 0 165c26.28-15.1 46.65-24.4 65.64-27.96l-1.21-12.03c.41-16.76 9.17-29.64 19.55-28.77 10.38.88 18.44 15.18 18.02 31.93l-1.06 9c18.78 3.65 38.94 12.94 64.86 27.83l-19.83-36.55C101.66 46.37 98.08 35.48 82.88 0z'/%3E%3C/symbol%3E%3Csymbol id='s5' viewBox='0 0 200 200'%3E%3Cpath d='M170.77 9.83H59.56l-7.52 1.33-6.41 4.13-4.3 6.31-1.52 7.47 1.51 7.48 4.3 6.31L52.03 47l7.51 1.33 65.69-.05L15.91 157.6c-17.57 17.56 9.67 44.79 27.23 27.23L152.16 75.81l.05 65.19c.61 24.24 37.9 24.22 38.49-.02V29.77l-1.45-7.38-4.87-6.91c-3.61-3.61-8.5-5.64-13.61-5.65z'/%3E%3C/symbol%3E%3Csymbol id='s6' viewBox='0 0 182 200'%3E%3Cpath d='M38.37 181.92L140.2 163.98c6.41-1.12 12.74 3.28 13.88 9.7l-1.96 16.28-3.66 6.82-7.08 3.17L37.85 200l-5.64-2.33-2.34-5.64 2.07-6.19zM85.44 0c44.78 0 84.75 32.02 94.35 75.78H119.18c-14.24-24.3-49.58-26.87-67.2-4.91L30.72 55.23c-19.41 23.63-19.41 58.66 0 82.29l21.26-15.64c17.63 21.96 52.97 19.38 67.21-4.92l60.59.01c-3.65 16.72-11.71 32.17-23.34 44.74l-7.4-4.71-8.69-1.08L36.98 174.07l-5.75 2.04c-6.43-4.34-12.31-9.45-17.51-15.21l-2.01-6.14 1-3.15 5.14-4.62c-23.51-29.2-23.51-72.02 0-101.22l-6.08-7.29 1.95-6.63C31.88 11.69 58.31-.03 85.44 0zM83.88 71.52c29.22-.01 33.54 43.55 4.87 49.24-23.46 4.66-39.64-24.83-22.48-41.96 4.67-4.66 11-7.28 17.61-7.28zm97.29 12.23c1.11 8.38 1.11 16.87 0 25.25h-58.4c2.39-7.39 2.63-15.31.7-22.83l-.7-2.42z'/%3E%3C/symbol%3E%3Cfilter id='b'%3E%3CfeGaussianBlur stdDeviation='2'/%3E%3C/filter%3E%3C/defs%3E%3Cg filter='url(%23b)'%3E%3Cuse href='%23s6' x='12' y='12' width='56' height='56'/%3E%3Cuse href='%23s0' x='12' y='92' width='56' height='56'/%3E%3Cuse href='%23s1' x='12' y='172' width='56' height='56'/%3E%3Cuse href='%23s2' x='12' y='252' width='56' height='56'/%3E%3Cuse href='%23s3' x='12' y='332' width='56' height='56'/%3E%3Cuse href='%23s4' x='12' y='412' width='56' height='56'/%3E%3Cuse href='%23s5' x='12' y='492' width='56' height='56'/%3E%3Cuse href='%23s6' x='12' y='572' width='56' height='56'/%3E%3Cuse href='%23s0' x='12' y='652' width='56' height='56'/%3E%3Cuse href='%23s1' x='12' y='732' width='56' height='56'/%3E%3Cuse href='%23s2' x='12' y='812' width='56' height='56'/%3E%3Cuse href='%23s3' x='12' y='892' width='56' height='56'/%3E%3Cuse href='%23s4' x='12' y='972' width='56' height='56'/%3E%3Cuse href='%23s5' x='12' y='1052' width='56' height='56'/%3E%3Cuse href='%23s6' x='12' y='1132' width='56' height='56'/%3E%3Cuse href='%23s0' x='12' y='1212' width='56' height='56'/%3E%3C/g%3E%3C/svg%3E\"); }\n\n        /* 减少动态效果：关掉所有动画和过渡，卷轴每轮直接跳到结果 */\n        @media (prefers-reduced-motion: reduce) {\n            .haa-logo *, .haa-logo *::before, .haa-logo *::after { animation: none !important; transition: none !important; }\n        }\n\n        /* 暂停时冻结 Logo 内所有 CSS 动画，包括 blur-spin、heartbeat 这类无限循环的 */\n        .haa-logo.haa-paused *, .haa-logo.haa-paused *::before, .haa-logo.haa-paused *::after { animation-play-state: paused !important; }\n\n        /* === 粒子系统 === */\n        .particle-wrapper {\n            position: absolute;\n            /* 强制层级最高，确保粒子在 Frame 和 Mask 之上 */\n            z-index: 100; \n            opacity: 0;\n            pointer-events: none;\n            /* 开启 GPU 加速 */\n            transform: translateZ(1px); \n            animation: fly-x 0.4s linear forwards;\n        }\n\n        .particle-inner {\n            width: 100%;\n            height: 100%;\n            animation: fly-y 0.4s cubic-bezier(0.25, 1, 0.5, 1) forwards;\n        }\n        .p-crumb .particle-inner {\n            width: 0; height: 0; \n            border-left: 2px solid transparent; \n            border-right: 2px solid transparent; \n            border-bottom: 4px solid var(--icon-color);\n        }\n        .p-water .particle-inner {\n            background-color: var(--water-color); \n            border-radius: 50%;\n        }\n\n        @keyframes fly-x {\n            0% { transform: translateX(0); opacity: 1; }\n            100% { transform: translateX(var(--tx)); opacity: 0; }\n        }\n\n        @keyframes fly-y {\n            0% { transform: translateY(0) scale(1); }\n            100% { transform: translateY(var(--ty)) scale(0.5); }\n        }\n\n        /* 预计算的粒子轨迹：每个 class 固定位置 / 尺寸 / 位移 */\n        .pt-anchor-0 { top: 75.1%; left: 46.2%; width: calc(var(--size) * 0.03141); height: calc(var(--size) * 0.03141); --tx: calc(var(--size) * 0.01921); --ty: calc(var(--size) * -0.1805); }\n        .pt-anchor-1 { top: 78.0%; left: 47.2%; width: calc(var(--size) * 0.05924); height: calc(var(--size) * 0.05924); --tx: calc(var(--size) * 0.09191); --ty: calc(var(--size) * -0.1767); }\n        .pt-anchor-2 { top: 83.0%; left: 52.3%; width: calc(var(--size) * 0.04); height: calc(var(--size) * 0.04); --tx: calc(var(--size) * 0.4079); --ty: calc(var(--size) * -0.1668); }\n        .pt-anchor-3 { top: 63.3%; left: 51.1%; width: calc(var(--size) * 0.07592); height: calc(var(--size) * 0.07592); --tx: calc(var(--size) * 0.5147); --ty: calc(var(--size) * -0.16); }\n        .pt-anchor-4 { top: 80.4%; left: 51.9%; width: calc(var(--size) * 0.08624); height: calc(var(--size) * 0.08624); --tx: calc(var(--size) * -0.4709); --ty: calc(var(--size) * -0.1501); }\n        .pt-anchor-5 { top: 84.2%; left: 54.3%; width: calc(var(--size) * 0.02977); height: calc(var(--size) * 0.02977); --tx: calc(var(--size) * 0.8119); --ty: calc(var(--size) * -0.1632); }\n        .pt-anchor-6 { top: 76.7%; left: 48.4%; width: calc(var(--size) * 0.07978); height: calc(var(--size) * 0.07978); --tx: calc(var(--size) * -0.3378); --ty: calc(var(--size) * -0.1604); }\n        .pt-anchor-7 { top: 77.3%; left: 52.0%; width: calc(var(--size) * 0.04772); height: calc(var(--size) * 0.04772); --tx: calc(var(--size) * -0.7723); --ty: calc(var(--size) * -0.173); }\n        .pt-anchor-8 { top: 72.0%; left: 49.2%; width: calc(var(--size) * 0.03228); height: calc(var(--size) * 0.03228); --tx: calc(var(--size) * 0.1393); --ty: calc(var(--size) * -0.1624); }\n        .pt-anchor-9 { top: 82.5%; left: 50.1%; width: calc(var(--size) * 0.0823); height: calc(var(--size) * 0.0823); --tx: calc(var(--size) * 0.1628); --ty: calc(var(--size) * -0.1621); }\n        .pt-anchor-10 { top: 72.6%; left: 47.6%; width: calc(var(--size) * 0.05737); height: calc(var(--size) * 0.05737); --tx: calc(var(--size) * 0.6926); --ty: calc(var(--size) * -0.1615); }\n        .pt-anchor-11 { top: 66.7%; left: 45.3%; width: calc(var(--size) * 0.06904); height: calc(var(--size) * 0.06904); --tx: calc(var(--size) * -0.6029); --ty: calc(var(--size) * -0.1399); }\n        .pt-anchor-12 { top: 63.1%; left: 53.9%; width: calc(var(--size) * 0.05513); height: calc(var(--size) * 0.05513); --tx: calc(var(--size) * 0.1988); --ty: calc(var(--size) * -0.161); }\n        .pt-anchor-13 { top: 86.6%; left: 47.3%; width: calc(var(--size) * 0.05434); height: calc(var(--size) * 0.05434); --tx: calc(var(--size) * 0.2058); --ty: calc(var(--size) * -0.1603); }\n        .pt-anchor-14 { top: 89.6%; left: 54.3%; width: calc(var(--size) * 0.06686); height: calc(var(--size) * 0.06686); --tx: calc(var(--size) * 0.07415); --ty: calc(var(--size) * -0.1655); }\n        .pt-anchor-15 { top: 84.0%; left: 48.1%; width: calc(var(--size) * 0.08028); height: calc(var(--size) * 0.08028); --tx: calc(var(--size) * 0.003087); --ty: calc(var(--size) * -0.1614); }\n        .pt-anchor-16 { top: 68.8%; left: 49.3%; width: calc(var(--size) * 0.06598); height: calc(var(--size) * 0.06598); --tx: calc(var(--size) * -0.3753); --ty: calc(var(--size) * -0.1392); }\n        .pt-anchor-17 { top: 73.7%; left: 51.0%; width: calc(var(--size) * 0.08259); height: calc(var(--size) * 0.08259); --tx: calc(var(--size) * 0.03719); --ty: calc(var(--size) * -0.162); }\n        .pt-anchor-18 { top: 74.6%; left: 47.6%; width: calc(var(--size) * 0.0755); height: calc(var(--size) * 0.0755); --tx: calc(var(--size) * 0.01831); --ty: calc(var(--size) * -0.1788); }\n        .pt-anchor-19 { top: 87.2%; left: 50.6%; width: calc(var(--size) * 0.0823); height: calc(var(--size) * 0.0823); --tx: calc(var(--size) * 0.5385); --ty: calc(var(--size) * -0.1533); }\n        .pt-anchor-20 { top: 80.7%; left: 46.0%; width: calc(var(--size) * 0.05331); height: calc(var(--size) * 0.05331); --tx: calc(var(--size) * 0.4633); --ty: calc(var(--size) * -0.1633); }\n        .pt-anchor-21 { top: 89.0%; left: 54.7%; width: calc(var(--size) * 0.02902); height: calc(var(--size) * 0.02902); --tx: calc(var(--size) * 0.5565); --ty: calc(var(--size) * -0.1615); }\n        .pt-anchor-22 { top: 75.0%; left: 47.7%; width: calc(var(--size) * 0.05071); height: calc(var(--size) * 0.05071); --tx: calc(var(--size) * -0.6554); --ty: calc(var(--size) * -0.1749); }\n        .pt-anchor-23 { top: 60.4%; left: 49.5%; width: calc(var(--size) * 0.08326); height: calc(var(--size) * 0.08326); --tx: calc(var(--size) * -0.8122); --ty: calc(var(--size) * -0.1665); }\n        .pt-anchor-24 { top: 83.8%; left: 45.8%; width: calc(var(--size) * 0.07199); height: calc(var(--size) * 0.07199); --tx: calc(var(--size) * -0.4098); --ty: calc(var(--size) * -0.1686); }\n        .pt-anchor-25 { top: 80.1%; left: 54.6%; width: calc(var(--size) * 0.04459); height: calc(var(--size) * 0.04459); --tx: calc(var(--size) * 0.22); --ty: calc(var(--size) * -0.1452); }\n        .pt-anchor-26 { top: 83.1%; left: 50.8%; width: calc(var(--size) * 0.07003); height: calc(var(--size) * 0.07003); --tx: calc(var(--size) * 0.7311); --ty: calc(var(--size) * -0.1621); }\n        .pt-anchor-27 { top: 66.7%; left: 46.3%; width: calc(var(--size) * 0.07975); height: calc(var(--size) * 0.07975); --tx: calc(var(--size) * 0.1429); --ty: calc(var(--size) * -0.1854); }\n        .pt-anchor-28 { top: 62.5%; left: 50.0%; width: calc(var(--size) * 0.07396); height: calc(var(--size) * 0.07396); --tx: calc(var(--size) * 0.2739); --ty: calc(var(--size) * -0.1843); }\n        .pt-anchor-29 { top: 69.2%; left: 54.2%; width: calc(var(--size) * 0.0575); height: calc(var(--size) * 0.0575); --tx: calc(var(--size) * -0.1429); --ty: calc(var(--size) * -0.1779); }\n        .pt-anchor-30 { top: 60.4%; left: 47.0%; width: calc(var(--size) * 0.02821); height: calc(var(--size) * 0.02821); --tx: calc(var(--size) * -0.64); --ty: calc(var(--size) * -0.1819); }\n        .pt-anchor-31 { top: 70.6%; left: 48.5%; width: calc(var(--size) * 0.0569); height: calc(var(--size) * 0.0569); --tx: calc(var(--size) * 0.438); --ty: calc(var(--size) * -0.1388); }\n        .pt-anchor-32 { top: 69.1%; left: 48.3%; width: calc(var(--size) * 0.0843); height: calc(var(--size) * 0.0843); --tx: calc(var(--size) * -0.2827); --ty: calc(var(--size) * -0.1436); }\n        .pt-anchor-33 { top: 84.1%; left: 50.7%; width: calc(var(--size) * 0.0521); height: calc(var(--size) * 0.0521); --tx: calc(var(--size) * -0.5624); --ty: calc(var(--size) * -0.1635); }\n        .pt-anchor-34 { top: 77.9%; left: 48.4%; width: calc(var(--size) * 0.04995); height: calc(var(--size) * 0.04995); --tx: calc(var(--size) * 0.2901); --ty: calc(var(--size) * -0.141); }\n        .pt-anchor-35 { top: 87.6%; left: 47.0%; width: calc(var(--size) * 0.07744); height: calc(var(--size) * 0.07744); --tx: calc(var(--size) * -0.739); --ty: calc(var(--size) * -0.1647); }\n        .pt-anchor-36 { top: 82.6%; left: 49.5%; width: calc(var(--size) * 0.07986); height: calc(var(--size) * 0.07986); --tx: calc(var(--size) * -0.5061); --ty: calc(var(--size) * -0.173); }\n        .pt-anchor-37 { top: 75.9%; left: 46.3%; width: calc(var(--size) * 0.08479); height: calc(var(--size) * 0.08479); --tx: calc(var(--size) * 0.4638); --ty: calc(var(--size) * -0.1633); }\n        .pt-anchor-38 { top: 85.3%; left: 46.6%; width: calc(var(--size) * 0.05088); height: calc(var(--size) * 0.05088); --tx: calc(var(--size) * -0.1788); --ty: calc(var(--size) * -0.1588); }\n        .pt-anchor-39 { top: 69.1%; left: 45.8%; width: calc(var(--size) * 0.0561); height: calc(var(--size) * 0.0561); --tx: calc(var(--size) * -0.2534); --ty: calc(var(--size) * -0.1507); }\n        .pt-anchor-40 { top: 72.5%; left: 52.8%; width: calc(var(--size) * 0.05513); height: calc(var(--size) * 0.05513); --tx: calc(var(--size) * -0.05249); --ty: calc(var(--size) * -0.1538); }\n        .pt-hammer-0 { top: 46.5%; left: 88.2%; --tx: calc(var(--size) * 0.2225); --ty: calc(var(--size) * 0.329); }\n        .pt-hammer-1 { top: 43.7%; left: 95.5%; --tx: calc(var(--size) * 0.3403); --ty: calc(var(--size) * 0.3447); }\n        .pt-hammer-2 { top: 44.5%; left: 93.5%; --tx: calc(var(--size) * 0.2125); --ty: calc(var(--size) * 0.3374); }\n        .pt-hammer-3 { top: 47.3%; left: 93.7%; --tx: calc(var(--size) * -0.111); --ty: calc(var(--size) * 0.1642); }\n        .pt-hammer-4 { top: 45.4%; left: 92.6%; --tx: calc(var(--size) * 0.02878); --ty: calc(var(--size) * 0.1524); }\n        .pt-hammer-5 { top: 45.3%; left: 94.2%; --tx: calc(var(--size) * 0.05103); --ty: calc(var(--size) * 0.1786); }\n        .pt-hammer-6 { top: 43.8%; left: 89.9%; --tx: calc(var(--size) * 0.0418); --ty: calc(var(--size) * 0.1504); }\n        .pt-hammer-7 { top: 47.3%; left: 89.6%; --tx: calc(var(--size) * -0.2465); --ty: calc(var(--size) * 0.2961); }\n        .pt-hammer-8 { top: 46.1%; left: 94.6%; --tx: calc(var(--size) * -0.2359); --ty: calc(var(--size) * 0.2825); }\n        .pt-hammer-9 { top: 43.9%; left: 92.1%; --tx: calc(var(--size) * 0.253); --ty: calc(var(--size) * 0.1978); }\n        .pt-hammer-10 { top: 43.8%; left: 90.1%; --tx: calc(var(--size) * -0.3278); --ty: calc(var(--size) * 0.2279); }\n        .pt-hammer-11 { top: 46.4%; left: 96.0%; --tx: calc(var(--size) * -0.0641); --ty: calc(var(--size) * 0.1289); }\n        .pt-hammer-12 { top: 42.6%; left: 88.0%; --tx: calc(var(--size) * -0.2827); --ty: calc(var(--size) * 0.2965); }\n        .pt-hammer-13 { top: 47.2%; left: 92.8%; --tx: calc(var(--size) * -0.1123); --ty: calc(var(--size) * 0.3199); }\n        .pt-hammer-14 { top: 45.8%; left: 93.1%; --tx: calc(var(--size) * 0.08636); --ty: calc(var(--size) * 0.3562); }\n        .pt-hammer-15 { top: 43.6%; left: 90.2%; --tx: calc(var(--size) * -0.028); --ty: calc(var(--size) * 0.3698); }\n        .pt-hammer-16 { top: 45.9%; left: 95.8%; --tx: calc(var(--size) * 0.271); --ty: calc(var(--size) * 0.2954); }\n        .pt-apple-1-0 { top: 24.4%; left: 79.2%; --tx: calc(var(--size) * 0.1676); --ty: calc(var(--size) * -0.2141); }\n        .pt-apple-1-1 { top: 24.7%; left: 77.4%; --tx: calc(var(--size) * -0.1786); --ty: calc(var(--size) * -0.2988); }\n        .pt-apple-1-2 { top: 27.3%; left: 72.9%; --tx: calc(var(--size) * 0.1124); --ty: calc(var(--size) * -0.1556); }\n        .pt-apple-1-3 { top: 24.1%; left: 77.7%; --tx: calc(var(--size) * 0.1511); --ty: calc(var(--size) * -0.2605); }\n        .pt-apple-1-4 { top: 25.3%; left: 73.4%; --tx: calc(var(--size) * 0.08313); --ty: calc(var(--size) * -0.1531); }\n        .pt-apple-1-5 { top: 23.1%; left: 76.2%; --tx: calc(var(--size) * -0.1404); --ty: calc(var(--size) * -0.2135); }\n        .pt-apple-1-6 { top: 25.8%; left: 76.5%; --tx: calc(var(--size) * -0.1767); --ty: calc(var(--size) * -0.2695); }\n        .pt-apple-1-7 { top: 24.4%; left: 73.6%; --tx: calc(var(--size) * -0.09776); --ty: calc(var(--size) * -0.2302); }\n        .pt-apple-1-8 { top: 23.1%; left: 72.2%; --tx: calc(var(--size) * 0.0161); --ty: calc(var(--size) * -0.2904); }\n        .pt-apple-1-9 { top: 25.9%; left: 79.3%; --tx: calc(var(--size) * -0.03868); --ty: calc(var(--size) * -0.1887); }\n        .pt-apple-1-10 { top: 22.6%; left: 71.5%; --tx: calc(var(--size) * -0.08369); --ty: calc(var(--size) * -0.2447); }\n        .pt-apple-1-11 { top: 24.1%; left: 72.6%; --tx: calc(var(--size) * 0.1666); --ty: calc(var(--size) * -0.2734); }\n        .pt-apple-1-12 { top: 25.3%; left: 78.4%; --tx: calc(var(--size) * 0.05633); --ty: calc(var(--size) * -0.3653); }\n        .pt-apple-1-13 { top: 23.8%; left: 75.1%; --tx: calc(var(--size) * 0.04988); --ty: calc(var(--size) * -0.3136); }\n        .pt-apple-1-14 { top: 25.8%; left: 73.2%; --tx: calc(var(--size) * -0.1832); --ty: calc(var(--size) * -0.3695); }\n        .pt-apple-1-15 { top: 27.4%; left: 74.7%; --tx: calc(var(--size) * 0.06718); --ty: calc(var(--size) * -0.3405); }\n        .pt-apple-1-16 { top: 27.0%; left: 79.3%; --tx: calc(var(--size) * -0.03785); --ty: calc(var(--size) * -0.369); }\n        .pt-apple-2-0 { top: 48.7%; left: 82.5%; --tx: calc(var(--size) * 0.1234); --ty: calc(var(--size) * 0.2109); }\n        .pt-apple-2-1 { top: 49.3%; left: 75.0%; --tx: calc(var(--size) * 0.05138); --ty: calc(var(--size) * 0.2622); }\n        .pt-apple-2-2 { top: 51.4%; left: 77.7%; --tx: calc(var(--size) * 0.03022); --ty: calc(var(--size) * 0.172); }\n        .pt-apple-2-3 { top: 48.3%; left: 79.3%; --tx: calc(var(--size) * 0.1477); --ty: calc(var(--size) * 0.3626); }\n        .pt-apple-2-4 { top: 51.7%; left: 81.1%; --tx: calc(var(--size) * 0.07588); --ty: calc(var(--size) * 0.3238); }\n        .pt-apple-2-5 { top: 47.9%; left: 79.4%; --tx: calc(var(--size) * -0.0477); --ty: calc(var(--size) * 0.3078); }\n        .pt-apple-2-6 { top: 51.2%; left: 74.4%; --tx: calc(var(--size) * 0.1871); --ty: calc(var(--size) * 0.1296); }\n        .pt-apple-2-7 { top: 51.7%; left: 75.2%; --tx: calc(var(--size) * 0.0309); --ty: calc(var(--size) * 0.2682); }\n        .pt-apple-2-8 { top: 49.4%; left: 82.6%; --tx: calc(var(--size) * 0.1737); --ty: calc(var(--size) * 0.2541); }\n        .pt-apple-2-9 { top: 48.3%; left: 79.4%; --tx: calc(var(--size) * 0.003286); --ty: calc(var(--size) * 0.1464); }\n        .pt-apple-2-10 { top: 49.2%; left: 80.3%; --tx: calc(var(--size) * -0.08946); --ty: calc(var(--size) * 0.1354); }\n        .pt-apple-2-11 { top: 51.4%; left: 78.9%; --tx: calc(var(--size) * -0.1267); --ty: calc(var(--size) * 0.1982); }\n        .pt-apple-2-12 { top: 49.3%; left: 78.4%; --tx: calc(var(--size) * 0.1773); --ty: calc(var(--size) * 0.1722); }\n        .pt-apple-2-13 { top: 47.5%; left: 80.5%; --tx: calc(var(--size) * 0.03973); --ty: calc(var(--size) * 0.245); }\n        .pt-apple-2-14 { top: 51.6%; left: 77.2%; --tx: calc(var(--size) * 0.1508); --ty: calc(var(--size) * 0.3698); }\n        .pt-apple-2-15 { top: 48.4%; left: 83.0%; --tx: calc(var(--size) * 0.006071); --ty: calc(var(--size) * 0.1699); }\n        .pt-apple-2-16 { top: 48.3%; left: 78.4%; --tx: calc(var(--size) * 0.1452); --ty: calc(var(--size) * 0.2537); }\n\n        /* === 特效定义 === */\n        /* Anchor */\n        .anchor-hover-high svg { transform: translateY(var(--anchor-hover-y)) !important; }\n        .anchor-drop svg { animation: high-drop 0.2s cubic-bezier(0.5, 0, 0.75, 0) forwards; }\n        @keyframes high-drop { 0% { transform: translateY(var(--anchor-hover-y)); opacity: 1; } 100% { transform: translateY(0); opacity: 1; } }\n\n        /* Hammer */\n        .hammer-action svg { transform-origin: 80% 80%; animation: hammer-smash 0.4s cubic-bezier(0.25, 1, 0.5, 1) forwards; }\n        @keyframes hammer-smash { 0% { transform: rotate(0deg); } 40% { transform: rotate(60deg); } 100% { transform: rotate(0deg); } }\n\n        /* Heart */\n        .heartbeat svg { \n            fill: var(--heart-color) !important; \n            animation: heart-pulse 1.2s infinite ease-in-out;\n        }\n        @keyframes heart-pulse {\n             0% { transform: scale(1); }\n             15% { transform: scale(1.25); }\n             30% { transform: scale(1); }\n             45% { transform: scale(1.15); }\n             60% { transform: scale(1); }\n             100% { transform: scale(1); }\n        }\n\n        /* Apple */\n        .bite-mark { position: absolute; background-color: var(--bg-color); border-radius: 50%; width: 32%; height: 32%; opacity: 0; z-index: 10; }\n        .bite-1 { top: 25%; right: 1%; } \n        .bite-2 { top: 50%; right: -3%; }   \n        .bite-anim { animation: bite-snap 0.05s linear forwards; }\n        @keyframes bite-snap { from { opacity: 0; transform: scale(0.8); } to { opacity: 1; transform: scale(1); } }\n        @media (prefers-reduced-motion: reduce) { .bite-anim { opacity: 1; } }\n\n        /* Alien */\n        .eye-cover { transform: scale(0); transform-origin: center; transition: transform 0.1s cubic-bezier(0, 0, 0.2, 1); }\n        .alien-action .eye-cover { transform: scale(1) !important; }\n\n        /* Human (Vitruvian) */\n        .v-shape {\n            fill: none; stroke: var(--icon-color); stroke-width: 2px;\n            /* [修改] 粗细改为 2px */\n            stroke-width: 2px; \n            /* 周长归一化为 1（pathLength）；间隔和起始偏移略大于 1，圆头线帽在开始前不露出来 */\n            stroke-dasharray: 1 1.05; stroke-dashoffset: 1.02; opacity: 1; vector-effect: non-scaling-stroke; stroke-linecap: round;\n        }\n        .v-circle { transform-origin: center; transform: rotate(-135deg); }\n\n        .draw-circle .v-circle { animation: draw-stroke 1.6s linear forwards; }\n        .draw-square .v-rect { animation: draw-stroke 1.6s linear forwards; }\n        @keyframes draw-stroke { to { stroke-dashoffset: 0; } }\n        @media (prefers-reduced-motion: reduce) { .draw-circle .v-circle, .draw-square .v-rect { stroke-dashoffset: 0; } }\n\n";
+        const SPRITE = "<svg class=\"icon-sprite\" xmlns=\"http://www.w3.org/2000/svg\" width=\"0\" height=\"0\" aria-hidden=\"true\"><defs><symbol id=\"icon-hammer\" viewBox=\"0 0 200 200\"><path d=\"M143.55 95.96l40.39-40.39 15.05 15.06c1.33 1.33 1.9 3.31 1.58 5.52l-3.29 6.22-26.93 26.93-6.23 3.29c-2.2.32-4.19-.24-5.52-1.57zM39.27 180.17l-6.23 3.29c-2.2.32-4.19-.24-5.52-1.57L7.45 161.82c-1.33-1.33-1.9-3.32-1.58-5.52l3.29-6.23 94.25-94.25L70.79 23.21 83.76 10.24l4.02-2.68 4.28-.64 49.23 6L173.9 45.54z\"/></symbol><symbol id=\"icon-happy\" viewBox=\"0 0 182 181\"><path d=\"M90.72 0C40.68 0 0 40.56 0 90.44c0 49.88 40.68 90.44 90.72 90.44 50.05 0 90.73-40.56 90.73-90.44C181.45 40.56 140.77 0 90.72 0zM49.66 76.73c-2.25 8.08-14.86 4.66-12.61-3.43 6.38-22.47 39.36-22.59 45.65 0 .96 3.43-.95 7.05-4.58 8l-1.72.19c-2.87 0-5.54-1.9-6.3-4.76-2.96-10.12-17.48-10.11-20.44 0zm75.06 40.56c-8.75 34.46-59.84 34.07-67.99-.58-.96-3.99 2.48-7.99 6.68-7.99h54.82c4.39-.19 7.64 4.19 6.49 8.57zM139.81 81.3l-1.72.19c-2.86 0-5.54-1.9-6.3-4.76-2.97-10.14-17.66-10.14-20.63 0-2.25 8.08-14.86 4.66-12.6-3.43 6.38-22.47 39.35-22.58 45.65 0 .95 3.43-.96 7.05-4.4 8z\"/></symbol><symbol id=\"icon-heart\" viewBox=\"0 0 168 200\"><path d=\"M53.65.54c-2.2 1-3 2.86-3.4 7.91l-.8 4.41-3.65-2.25c-3.9-2.76-6.55-3.91-8.1-3.56-3.15.8-6.55 5.66-6 8.61 .35 1.81 1.55 2.86 8.05 7.22L60.2 39.35 47.45 49.67 32.15 30.44C23.23 23.1 6.03 33.93 1.6 42.31L0 48.37c0 2.85.15 3.25 2.85 7.16L13.1 72.3l-2.5 3.26C5.4 82.47 3.45 91.23 3.75 106.5c.77 36.97 18.56 87.83 60.7 93.2 7.85 1 18.55-.55 25.65-3.71l11.05-7.31 20.4-28.34c16.57-22.38 34.64-52.16 17.35-79.47l-2.05-3.21c-.5-.85 6.95-2.6 12.45-2.95l6.85-1.11c17.82-5.62 14.89-38.52-4.25-39.61-5.25-.3-20.6 3.21-30.1 6.86l-3.95 1.51-3.05-2.16c-6.9-4.9-13.85-7.21-22.95-7.66l-5.95-.3L87.1 5.3l-12.85.3L72 33.09 61.9 22.38l.85-8.47c.55-5.69.56-17.83-9.1-13.37zM30.1 49.27l9.5 14.17-.6 2.6c-.85 3.51-.85 3.51-2.6 2.61L25.6 66.44 17.85 53.67c-3.65-5.3-3.7-5.51-2.9-6.61l8.85-4.65zM95 46.41l8.5 2.96L79.1 67.04c-7.61 1.91-10.6 9.82-7.45 16.63L73 86.62l-5.45 5.61c-5.28 5.4-8.88 10.54-5.3 18.13 2.35 5.16 8.2 9.87 15.15 12.22l3.1 1.6-3.25 13.67-9.75 17.98 10.9 8.26 1-1.35c7.5-10.72 12.45-23.34 14.15-35.95 .6-4.41.65-4.56 2.95-6.82l5.05-9.56c2.65-7.36 13.35-20.18 21.1-25.34l1.95-1.3 .95 1.25 6 12.97 .65 8.26c-.05 12.92-5.85 25.04-22.9 47.78l-9 13.22c-5.85 9.86-11.55 15.12-18.95 17.47L72 185.98l-10.75-.8c-25.39-6.16-37.24-36.23-41.7-59.15-4.85-25.08-2.7-41.71 5.95-45.21 10.23-4.21 11.12 13.62 9.75 19.43-1.29 5.39 2.39 11.51 8.6 9.21 4.1-1.6 5.1-5.16 5.65-20.48 .72-20.38 9.04-39.77 32-42.52zm58.1 2.86c3.63 6.09-3.6 16.85-5.6 7.41-1.35-6.61 2.85-12.22 5.6-7.41zm-19.5 4.85l.95 8.67-2.9 1.5c-17.94 7.26-36.35 23.36-43.1 41.91l-1.35 3.56-2.4.15L75.25 106c-1.5-1.67 11.77-14.16 11.7-19.28l-1.3-6.21L93.25 74c7.15-6.41 16.55-12.66 25.55-16.92l14.45-5.66z\"/></symbol><symbol id=\"icon-helmet1\" viewBox=\"0 0 176 188\"><path d=\"M163.32 75.45l-4.75-16.83c-1.49-3.28-3.08-6.03-7.25-6.37C147.45 26.95 122.22 0 87.55 0 52.7 0 27.36 26.96 23.49 52.26c-4.27.42-5.82 3.84-7.01 6.51l-4.7 16.68C5.22 75.86 0 81.36 0 88.06v23.21c0 6.97 5.64 12.64 12.57 12.64h3.52l2.69 10.83c1.06 4 3.9 6.3 8.03 6.55 10.34 31.24 22.67 46.43 37.67 46.43h46.14c15 0 27.33-15.19 37.67-46.43 4.13-.25 6.97-2.55 8.03-6.56l2.69-10.82h3.52c6.93 0 12.57-5.67 12.57-12.64V88.06c0-6.7-5.22-12.2-11.78-12.61zM31.03 116.03L25.61 83.29H149.49l-5.42 32.74z\"/><path d=\"M76.01 186.68H99.09c5.1 0 5.1-7.87 0-7.87H76.01c-5.1 0-5.1 7.87 0 7.87z\"/></symbol><symbol id=\"icon-helmet2\" viewBox=\"0 0 138 183\"><path d=\"M126.44 56.49C125.92 25.25 100.3 0 68.88 0 37.46 0 11.84 25.25 11.32 56.49 4.99 57 0 62.3 0 68.75v62.09c0 6.45 5 11.75 11.33 12.26 .72 18.69 21.94 39.55 40.58 39.55H85.85c18.65 0 39.87-20.86 40.58-39.55 6.33-.51 11.33-5.81 11.33-12.26V68.75c0-6.45-4.99-11.75-11.32-12.26zM91.51 152.41H46.26c-9.17 0-17.43-4.48-22.41-11.79 6.36 5.3 14.13 8.16 22.41 8.16H91.51c8.16 0 16.07-2.94 22.45-8.22-4.98 7.35-13.26 11.85-22.45 11.85zm0-11.29H46.26c-14.78 0-27.27-12.21-27.27-26.65V57.46c0-27.46 22.38-49.8 49.89-49.8 27.51 0 49.89 22.34 49.89 49.8v57.01c0 14.44-12.48 26.65-27.26 26.65z\"/></symbol><symbol id=\"icon-home\" viewBox=\"0 0 165 165\"><path d=\"M154.43 164.72H109.02c-5.46 0-9.92-4.48-9.92-9.95V111.89c0-9.25-7.7-17.03-16.96-17.03l-.75.04c-8.91.38-16.17 8.64-16.17 18.42v41.45c0 5.47-4.47 9.95-9.92 9.95H9.88c-5.46 0-9.88-4.44-9.88-9.92V76.64c0-2.74 1.16-5.41 3.18-7.29L75.44 2.61c3.85-3.54 9.73-3.42 13.44 0l72.29 66.74c2.03 1.88 3.19 4.55 3.19 7.29l-.01 78.13c0 5.47-4.46 9.95-9.92 9.95z\"/></symbol><symbol id=\"icon-human\" viewBox=\"0 0 163 190\"><path d=\"M81.5 36.36c21.53 0 24.78-31.85 3.59-36.01C59.73-4.63 55.22 36.36 81.5 36.36z\"/><path d=\"M152.48 44.15H131.74l21.12-11.37 2.03-3.54-.59-7.94c-2.6-5.08-9.03-7.13-14.12-4.6L84.94 44.15H78.37L23.14 16.7C11.09 10.71 1.52 29.19 13.67 35.24l17.88 8.91H10.52c-13.55 0-13.55 20.78 0 20.78H57.84V95.35L15.91 161.13l1.79 7.76 2.99 2.79 7.81 2.99 6.06-1.92 23.28-35.09v41.55c0 5.71 4.84 10.39 10.51 10.39l9.59-.93 3.56-2.6 3.56 2.6 9.59.93c5.67 0 10.51-4.68 10.51-10.39V137.66l23.25 34.99 6.09 1.91 7.81-2.99 4.66-6.5 .11-4.07-41.92-65.65V64.93h47.32c13.55 0 13.55-20.78 0-20.78z\"/></symbol><symbol id=\"icon-airplane\" viewBox=\"0 0 171 171\"><path d=\"M58.4 170.62c-2.2 0-4.27-.86-5.82-2.41l-18.19-33.6L2.41 118.12c-3.21-3.21-3.21-8.43 0-11.63L13.39 95.52l27.55 7.12L67.56 73.18 3.88 37.95c-3.55-3.54-3.55-9.46 0-13.01L20.31 8.53l84.18 25.16L128.97 7.57c14.95-14.92 42.15-5.58 41.52 16.55-.18 6.49-2.87 12.66-7.57 17.35L136.97 65.72l25.36 84.62-16.43 16.4c-3.55 3.55-9.48 3.55-13.03 0L97.32 102.68 67.94 129.2l7.27 28.05-10.98 10.96c-1.56 1.55-3.63 2.41-5.83 2.41z\"/></symbol><symbol id=\"icon-alien\" viewBox=\"0 0 156 188\"><path d=\"M77.56 0c42.25 0 77.56 35.32 77.56 77.56 0 59.31-50.18 109.5-77.56 109.5C50.19 187.06 0 136.88 0 77.56 0 35.32 35.32 0 77.56 0zm50.19 91.25c-24.04 0-43.37 21.49-40.83 45.4 25.6 2.72 47.88-19.57 45.16-45.17zm-100.38 0l-4.33.23c-2.72 25.6 19.57 47.89 45.17 45.17 2.54-23.91-16.8-45.4-40.83-45.4z\"/></symbol><symbol id=\"icon-anchor\" viewBox=\"0 0 185 191\"><path d=\"M92.37 20.55c11.04 0 11.04 17.18 0 17.18-11.05 0-11.05-17.18 0-17.18zM92.5 0c-29 0-39.12 39.38-14.88 53.99l.01 20.92H63.5c-19.18 0-19.18 29.85 0 29.85l14.13.01v46.35c-13.86-3.59-25.36-12.04-32.53-23.04l2.45-3.05c4.22-6.89 2.18-15.88-4.52-20.27L30.51 97.02l-7.76-2.21c-4.95 0-9.82 2.51-12.62 7.1L2.47 113.44c-6.44 9.74.88 23.11 12.33 23.11l.86-.02c11.29 22.54 32.95 39.09 58.62 44.44l6.24 4.05c2.84 3.8 7.29 5.98 11.94 5.98h.04c5.11 0 9.61-2.6 12.28-6.51l6.18-3.6c25.51-5.44 47.02-21.93 58.25-44.37l.98.03c11.46 0 18.78-13.37 12.33-23.11l-7.86-11.87c-2.83-4.38-7.59-6.76-12.41-6.76l-7.76 2.21-12.19 7.54c-6.98 4.31-9.14 13.47-4.86 20.46l2.38 2.98c-7.14 11-18.62 19.47-32.45 23.07V104.76l14.13.01c19.18-.02 19.18-29.85 0-29.87l-14.13.01L107.35 54C131.45 39.49 121.69.35 92.86 0z\"/></symbol><symbol id=\"icon-apple\" viewBox=\"0 0 200 200\"><path fill-rule=\"evenodd\" d=\"M101.07 184.88c28.95 16.93 55.56-14.36 67.38-38.22 12.85-25.98 19.31-75.6-15.21-88.69-18-6.83-35.88-2.57-52.26 6.59l-2.99-.02C77.13 52.9 44.92 47.77 29.23 70.81c-24.91 36.52 1.24 90.25 32.84 113.16 10.83 7.85 24.56 7.54 35.9.89z\"/><path d=\"M86.13 48.36c4.49 1.67 9.07 2.42 13.44 2.22 .98-21.16-19.37-41.53-40.54-40.55-.78 16.78 11.77 32.64 27.1 38.33z\"/></symbol><symbol id=\"icon-arch\" viewBox=\"0 0 166 165\"><path d=\"M82.88 0L60.43 52.28C49.92 74.12 33.44 105.22 0 165c26.28-15.1 46.65-24.4 65.64-27.96l-1.21-12.03c.41-16.76 9.17-29.64 19.55-28.77 10.38.88 18.44 15.18 18.02 31.93l-1.06 9c18.78 3.65 38.94 12.94 64.86 27.83l-19.83-36.55C101.66 46.37 98.08 35.48 82.88 0z\"/></symbol><symbol id=\"icon-arrow\" viewBox=\"0 0 200 200\"><path d=\"M170.77 9.83H59.56l-7.52 1.33-6.41 4.13-4.3 6.31-1.52 7.47 1.51 7.48 4.3 6.31L52.03 47l7.51 1.33 65.69-.05L15.91 157.6c-17.57 17.56 9.67 44.79 27.23 27.23L152.16 75.81l.05 65.19c.61 24.24 37.9 24.22 38.49-.02V29.77l-1.45-7.38-4.87-6.91c-3.61-3.61-8.5-5.64-13.61-5.65z\"/></symbol><symbol id=\"icon-astronaut\" viewBox=\"0 0 182 200\"><path d=\"M38.37 181.92L140.2 163.98c6.41-1.12 12.74 3.28 13.88 9.7l-1.96 16.28-3.66 6.82-7.08 3.17L37.85 200l-5.64-2.33-2.34-5.64 2.07-6.19zM85.44 0c44.78 0 84.75 32.02 94.35 75.78H119.18c-14.24-24.3-49.58-26.87-67.2-4.91L30.72 55.23c-19.41 23.63-19.41 58.66 0 82.29l21.26-15.64c17.63 21.96 52.97 19.38 67.21-4.92l60.59.01c-3.65 16.72-11.71 32.17-23.34 44.74l-7.4-4.71-8.69-1.08L36.98 174.07l-5.75 2.04c-6.43-4.34-12.31-9.45-17.51-15.21l-2.01-6.14 1-3.15 5.14-4.62c-23.51-29.2-23.51-72.02 0-101.22l-6.08-7.29 1.95-6.63C31.88 11.69 58.31-.03 85.44 0zM83.88 71.52c29.22-.01 33.54 43.55 4.87 49.24-23.46 4.66-39.64-24.83-22.48-41.96 4.67-4.66 11-7.28 17.61-7.28zm97.29 12.23c1.11 8.38 1.11 16.87 0 25.25h-58.4c2.39-7.39 2.63-15.31.7-22.83l-.7-2.42z\"/></symbol></defs></svg>";
+        const REELS = [["h",["hammer","happy","heart","helmet1","helmet2","home","human"]],["a",["airplane","alien","anchor","apple","arch","arrow","astronaut"]],["a",["airplane","alien","anchor","apple","arch","arrow","astronaut"]]];
+
+        // 一轮动画的全部事件由生成器编译好：[毫秒, 卷轴, 图标名, 动作, 参数]，按时间排序
+        const CYCLE = 6150;
+        const TIMELINE = [[0,0,"","spin",""],[150,1,"","spin",""],[300,2,"","spin",""],[1450,0,"","stop",""],[1450,0,"hammer","add","active-overlay"],[1450,0,"hammer","reel","pop-out"],[1450,0,"heart","add","active-overlay"],[1450,0,"heart","reel","pop-out"],[1450,0,"human","add","active-overlay"],[1450,0,"human","reel","pop-out"],[1850,1,"","stop",""],[1850,1,"anchor","add","active-overlay"],[1850,1,"anchor","reel","pop-out"],[1850,1,"anchor","add","anchor-hover-high"],[2050,0,"hammer","add","hammer-action"],[2050,0,"heart","add","heartbeat"],[2050,0,"human","add","draw-square"],[2200,0,"hammer","particles","hammer"],[2250,2,"","stop",""],[2250,2,"anchor","add","active-overlay"],[2250,2,"anchor","reel","pop-out"],[2250,2,"anchor","add","anchor-hover-high"],[2450,1,"anchor","remove","anchor-hover-high"],[2450,1,"anchor","add","anchor-drop"],[2450,1,"apple","bite","bite-1"],[2450,1,"apple","particles","apple-1"],[2650,1,"anchor","particles","anchor"],[2700,1,"apple","bite","bite-2"],[2700,1,"apple","particles","apple-2"],[2850,2,"anchor","remove","anchor-hover-high"],[2850,2,"anchor","add","anchor-drop"],[2850,2,"apple","bite","bite-1"],[2850,2,"apple","particles","apple-1"],[3050,2,"anchor","particles","anchor"],[3100,2,"apple","bite","bite-2"],[3100,2,"apple","particles","apple-2"],[3650,0,"human","add","draw-circle"],[6050,1,"alien","add","alien-action"],[6050,2,"alien","add","alien-action"]];
+        
+        const REEL_COPIES = 1;
+        // 虚拟卷轴：每个图标只有一份节点，记住原始顺序以便每轮重排
+        const VIRTUAL_REELS = true;
+        // 窗口卷轴（组件）：每个卷轴只有 STRIP_WINDOW 个格子，图标名 -> [viewBox, overlay]
+        const STRIP_WINDOW = 2;
+        const ICONS = {"hammer":["0 0 200 200",""],"happy":["0 0 182 181",""],"heart":["0 0 168 200",""],"helmet1":["0 0 176 188",""],"helmet2":["0 0 138 183",""],"home":["0 0 165 165",""],"human":["0 0 163 190","<circle class=\"v-shape v-circle\" cx=\"50.1%\" cy=\"47.9%\" r=\"57.15%\" pathLength=\"1\"/><rect class=\"v-shape v-rect\" x=\"0%\" y=\"8.21%\" width=\"100%\" height=\"91.58%\" pathLength=\"1\"/>"],"airplane":["0 0 171 171",""],"alien":["0 0 156 188","<circle class=\"eye-cover left-eye\" cx=\"29.53%\" cy=\"60.67%\" r=\"18.49%\" fill=\"white\" transform=\"scale(0)\"/><circle class=\"eye-cover right-eye\" cx=\"70.47%\" cy=\"60.67%\" r=\"18.49%\" fill=\"white\" transform=\"scale(0)\"/>"],"anchor":["0 0 185 191",""],"apple":["0 0 200 200",""],"arch":["0 0 166 165",""],"arrow":["0 0 200 200",""],"astronaut":["0 0 182 200",""]};
+
+        // 预模糊贴图模式只切换卷轴的 spinning 类；否则退回实时 filter: blur
+        const SPIN_TEXTURE = true;
+        // 减少动态效果：不显示旋转、不发射粒子，每轮直接切换到新图标（动画 / 过渡由 CSS 关掉）
+        const reducedMotion = window.matchMedia ? window.matchMedia('(prefers-reduced-motion: reduce)') : { matches: false };
+        function setSpinning(strip, on) {
+            if (reducedMotion.matches) on = false;
+            if (SPIN_TEXTURE) strip.parentElement.classList.toggle('spinning', on);
+            else strip.classList.toggle('blur-spin', on);
+        }
+
+        function setBoxIcon(box, name) {
+            if (box.getAttribute('data-name') === name) return;
+            const [viewBox, overlay] = ICONS[name];
+            box.setAttribute('data-name', name);
+            box.innerHTML = `<svg${viewBox ? ` viewBox="${viewBox}"` : ''}><use href="#icon-${name}"/>${overlay}</svg>`;
+        }
+
+        // 发射器 -> [粒子类型, 轨迹库大小, 最少粒子数, 随机追加数]
+        const PARTICLE_BANKS = {"anchor": ["water", 41, 20, 10], "hammer": ["crumb", 17, 3, 3], "apple-1": ["crumb", 17, 3, 3], "apple-2": ["crumb", 17, 3, 3]};
+
+        // 每个卷轴一个粒子池：idle 是未挂载的节点，live 是正在播放的节点；节点用到时才创建，最多 PARTICLE_POOL_SIZE 个
+        // 播放结束 (animationend) 即回收，DOM 节点数和内存不随循环次数增长
+        const PARTICLE_POOL_SIZE = 32;
+        function createParticle(pool) {
+            const wrapper = document.createElement('div');
+            const inner = document.createElement('div');
+            inner.className = 'particle-inner';
+            wrapper.appendChild(inner);
+            wrapper.addEventListener('animationend', e => { if (e.target === wrapper) releaseParticle(pool, wrapper); });
+            pool.size++;
+            return wrapper;
+        }
+
+        function releaseParticle(pool, wrapper) {
+            if (!pool.live.delete(wrapper)) return;
+            wrapper.remove();
+            pool.idle.push(wrapper);
+        }
+
+        // 后台标签页里动画可能不结束，新一轮开始时把残留的全部收回
+        function releaseAllParticles(pool) {
+            pool.live.forEach(wrapper => releaseParticle(pool, wrapper));
+        }
+
+        function spawnParticles(container, emitter, pool) {
+            const [type, size, min, extra] = PARTICLE_BANKS[emitter];
+            const count = min + Math.floor(Math.random() * extra);
+            // 库大小是质数，随机起点 + 随机步长可以取到互不重复的一组轨迹
+            const start = Math.floor(Math.random() * size);
+            const step = 1 + Math.floor(Math.random() * (size - 1));
+            for (let k = 0; k < count; k++) {
+                const wrapper = pool.idle.pop() || (pool.size < PARTICLE_POOL_SIZE ? createParticle(pool) : null);
+                if (!wrapper) break;
+                wrapper.className = `particle-wrapper p-${type} pt-${emitter}-${(start + k * step) % size}`;
+                pool.live.add(wrapper);
+                // 重新挂载即从头播放 fly-x / fly-y
+                container.appendChild(wrapper);
+            }
+        }
+
+        // 一个 Logo 实例：卷轴及其图标都从 root 内部读取，不依赖页面上的其他元素
+        // names: 组件模式下每个卷轴的图标名列表（窗口卷轴）；页面模式下卷轴里已经有全部图标
+        function createLogo(root, names = null) {
+            const strips = Array.from(root.querySelectorAll('.strip'));
+            const logo = {
+                root, strips, names,
+                reelIcons: strips.map(strip => Array.from(strip.children)),
+                reelCounts: names ? names.map(list => list.length) : strips.map(strip => strip.children.length / REEL_COPIES),
+                particlePools: strips.map(() => ({ idle: [], live: new Set(), size: 0 })),
+                // 每个卷轴本轮停在的图标，以及特效实际作用过的状态：{ el, name, classes, reelClasses, nodes }
+                // 下一轮启动时只撤销这些，样式重算只涉及每个卷轴的一个图标，而不是全部图标
+                targets: [],
+                cycleStart: null, cursor: 0,
+                connected: false, running: false, onScreen: true, pausedAt: null, pausedAnimations: [],
+            };
+            root.haaLogo = logo;
+            return logo;
+        }
+
+        const ACTIONS = {
+            spin(logo, i) {
+                const strip = logo.strips[i];
+                const target = logo.targets[i];
+                if (target) {
+                    target.el.classList.remove(...target.classes);
+                    strip.parentElement.classList.remove(...target.reelClasses);
+                    target.nodes.forEach(n => n.remove());
+                    logo.targets[i] = null;
+                }
+                releaseAllParticles(logo.particlePools[i]);
+                strip.style.transition = 'none';
+                strip.style.transform = 'translateY(0)';
+                setSpinning(strip, true);
+            },
+            stop(logo, i) {
+                const strip = logo.strips[i];
+                const count = logo.reelCounts[i];
+                const targetIndex = Math.floor(Math.random() * count);
+                // 位移用卷轴自身高度的百分比，不需要测量图标高度，Logo 尺寸变化也不用重新计算
+                let targetEl, finalPos;
+                if (logo.names) {
+                    // 此时卷轴仍被旋转贴图遮住：格子依次换成目标之前的图标和目标，从第一格滚到最后一格
+                    const boxes = strip.children;
+                    const n = boxes.length;
+                    for (let k = 0; k < n; k++) setBoxIcon(boxes[k], logo.names[i][(targetIndex + k - n + 1 + n * count) % count]);
+                    targetEl = boxes[n - 1];
+                    finalPos = -(n - 1) / n;
+                } else if (VIRTUAL_REELS) {
+                    // 此时卷轴仍被旋转贴图遮住：把目标之后的图标排到前面、目标排最后，
+                    // 停止时从第一个滚到最后一个，看起来就像从上一轮接着转过来
+                    const icons = logo.reelIcons[i];
+                    strip.append(...icons.slice(targetIndex + 1), ...icons.slice(0, targetIndex + 1));
+                    targetEl = icons[targetIndex];
+                    finalPos = -(count - 1) / count;
+                } else {
+                    targetEl = strip.children[targetIndex + count];
+                    finalPos = -(targetIndex + count) / (REEL_COPIES * count);
+                }
+                logo.targets[i] = { el: targetEl, name: targetEl.getAttribute('data-name'), classes: new Set(), reelClasses: new Set(), nodes: [] };
+                setSpinning(strip, false);
+                strip.style.transition = 'transform 0.6s cubic-bezier(0.15, 1, 0.3, 1)';
+                strip.style.transform = `translateY(${finalPos * 100}%)`;
+            },
+            add(logo, i, target, cls) {
+                target.el.classList.add(cls);
+                target.classes.add(cls);
+            },
+            remove(logo, i, target, cls) {
+                target.el.classList.remove(cls);
+                target.classes.delete(cls);
+            },
+            reel(logo, i, target, cls) {
+                logo.strips[i].parentElement.classList.add(cls);
+                target.reelClasses.add(cls);
+            },
+            bite(logo, i, target, cls) {
+                const bite = document.createElement('div');
+                bite.className = `bite-mark ${cls} bite-anim`;
+                target.el.appendChild(bite);
+                target.nodes.push(bite);
+            },
+            particles(logo, i, target, emitter) {
+                if (!reducedMotion.matches) spawnParticles(target.el, emitter, logo.particlePools[i]);
+            },
+        };
+
+        function runEvent(logo, [, i, icon, action, arg]) {
+            const target = logo.targets[i];
+            // 特效事件只在该卷轴停在同名图标上时执行
+            if (icon && !(target && target.name === icon)) return;
+            ACTIONS[action](logo, i, target, arg);
+        }
+
+        // 推进一个实例的时间线：执行所有到期的事件，动作都对齐到帧
+        function advance(logo, now) {
+            if (logo.cycleStart === null) logo.cycleStart = now;
+            while (true) {
+                const elapsed = now - logo.cycleStart;
+                while (logo.cursor < TIMELINE.length && TIMELINE[logo.cursor][0] <= elapsed) runEvent(logo, TIMELINE[logo.cursor++]);
+                if (elapsed < CYCLE) break;
+                // 落后超过一整轮（例如标签页在后台时 rAF 暂停）就从现在重新开始，不补放错过的轮次
+                logo.cycleStart = elapsed >= 2 * CYCLE ? now : logo.cycleStart + CYCLE;
+                logo.cursor = 0;
+            }
+        }
+
+        // 唯一的调度器：不管页面上有多少个 Logo，每帧只有一次回调；没有正在播放的实例时不注册 rAF
+        const logos = new Set(), playing = new Set();
+        let rafId = 0;
+        function tick(now) {
+            playing.forEach(logo => advance(logo, now));
+            rafId = playing.size ? requestAnimationFrame(tick) : 0;
+        }
+
+        // 暂停 / 恢复：标签页隐藏、Logo 不在视口内或已从文档移除时停止推进并冻结它正在播放的 CSS 动画和过渡；
+        // 恢复时该实例的时间线整体后移暂停的时长，从暂停处继续
+        function updatePaused(logo) {
+            const shouldRun = logo.connected && !document.hidden && logo.onScreen;
+            if (shouldRun === logo.running) return;
+            logo.running = shouldRun;
+            logo.root.classList.toggle('haa-paused', !shouldRun);
+            if (!shouldRun) {
+                playing.delete(logo);
+                if (!playing.size) {
+                    cancelAnimationFrame(rafId);
+                    rafId = 0;
+                }
+                logo.pausedAt = performance.now();
+                // 只冻结正在播放的：已经播完（forwards）的动画再 play() 会从头开始
+                logo.pausedAnimations = logo.root.getAnimations ? logo.root.getAnimations({ subtree: true }).filter(a => a.playState === 'running') : [];
+                logo.pausedAnimations.forEach(a => a.pause());
+                return;
+            }
+            if (logo.pausedAt !== null && logo.cycleStart !== null) logo.cycleStart += performance.now() - logo.pausedAt;
+            logo.pausedAt = null;
+            logo.pausedAnimations.forEach(a => a.play());
+            logo.pausedAnimations = [];
+            playing.add(logo);
+            if (!rafId) rafId = requestAnimationFrame(tick);
+        }
+
+        // 所有实例共用一个 IntersectionObserver 和一个 visibilitychange 监听
+        const observer = window.IntersectionObserver ? new IntersectionObserver(entries => entries.forEach(entry => {
+            const logo = entry.target.haaLogo;
+            if (!logo) return;
+            logo.onScreen = entry.isIntersecting;
+            updatePaused(logo);
+        })) : null;
+        document.addEventListener('visibilitychange', () => logos.forEach(updatePaused));
+
+        function startLogo(logo) {
+            logos.add(logo);
+            logo.connected = true;
+            if (observer) observer.observe(logo.root);
+            updatePaused(logo);
+        }
+
+        // 移出文档：停止推进并从头开始下一次播放，下一轮的 spin 会撤销上一轮留下的状态
+        function stopLogo(logo) {
+            logo.connected = false;
+            updatePaused(logo);
+            if (observer) observer.unobserve(logo.root);
+            logos.delete(logo);
+            logo.cycleStart = null;
+            logo.cursor = 0;
+            logo.pausedAt = null;
+            logo.pausedAnimations = [];
+        }
+
+        // 样式表和 sprite 整页只插入一次
+        let installed = false;
+        function installShared() {
+            if (installed) return;
+            installed = true;
+            const style = document.createElement('style');
+            style.textContent = STYLE;
+            document.head.appendChild(style);
+            document.body.insertAdjacentHTML('afterbegin', SPRITE);
+        }
+
+        // 初始显示每个卷轴的第一个图标，与整页版本一致
+        function buildReels(root) {
+            root.classList.add('haa-logo');
+            root.innerHTML = REELS.map(([key]) => {
+                const texture = SPIN_TEXTURE ? `<div class="spin-texture spin-${key}"></div>` : '';
+                return `<div class="reel">${texture}<div class="strip">${'<div class="icon-box"></div>'.repeat(STRIP_WINDOW)}</div></div>`;
+            }).join('');
+            root.querySelectorAll('.strip').forEach((strip, i) => {
+                Array.from(strip.children).forEach((box, k) => setBoxIcon(box, REELS[i][1][k % REELS[i][1].length]));
+            });
+            return createLogo(root, REELS.map(([, list]) => list));
+        }
+
+        class HaaLogoElement extends HTMLElement {
+            connectedCallback() {
+                installShared();
+                startLogo(this.haaLogo || buildReels(this));
+            }
+            disconnectedCallback() {
+                if (this.haaLogo) stopLogo(this.haaLogo);
+            }
+        }
+
+        if (!customElements.get('haa-logo')) customElements.define('haa-logo', HaaLogoElement);
+})();
@@ -0,0 +1,223 @@
+import argparse
+import json
+import re
+import time
+import unicodedata
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import main
+import svg_loader
+
+# ================= 配置 =================
+RAW_DIR = main.ASSETS_DIR / "raw"
+REEL_DIRS = {"h": main.H_REEL_DIR, "a": main.A_REEL_DIR}
+INGEST_MANIFEST = main.ASSETS_DIR / "ingest-manifest.json"
+INGEST_SIZE = 200              # 统一的正方形画布边长，与现有卷轴图标的最大边一致
+INGEST_PADDING = 0             # 内容与画布边缘的留白（画布单位）
+INGEST_VERSION = 2             # 修改了归一化逻辑时 +1，让 ingest 缓存全部失效
+KEEP_FILLS = main.KEEP_FILLS   # 与生成器保留同样的 fill
+
+# 原始文件名（不含扩展名）-> (卷轴, 输出名)；未列出的按 --reel 指定的卷轴、文件名推导输出名
+INGEST_MAP = {
+    "aliens-fill": ("a", "alien"),
+    "arch-linux": ("a", "arch"),
+    "noun-airplane-492582": ("a", "airplane"),
+    "noun-anchor-8223815": ("a", "anchor"),
+    "noun-arrow-3134192": ("a", "arrow"),
+    "苹果": ("a", "apple"),
+    "宇航员": ("a", "astronaut"),
+    "hammer-fill": ("h", "hammer"),
+    "noun-home-5967981": ("h", "home"),
+    "心脏": ("h", "heart"),
+}
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+# 不参与绘制的元素：编辑器元数据、noun project 的署名文字等
+DROP_TAGS = {"metadata", "title", "desc", "text", "foreignObject", "script", "style"}
+
+# ================= 名字 =================
+
+def normalize_name(stem):
+    # macOS 上的文件名是 NFD，统一成 NFC，中文名保持原样
+    stem = unicodedata.normalize("NFC", stem)
+    if stem in INGEST_MAP: return INGEST_MAP[stem][1]
+    name = re.sub(r'^noun-', '', stem)
+    name = re.sub(r'-\d+(?:\s+\d+)?$', '', name)
+    name = re.sub(r'[\s_]+', '-', name.strip()).lower()
+    # 只去掉文件名 / id 里不安全的字符，Unicode 字母数字都保留
+    return re.sub(r'[^\w-]', '', name) or "icon"
+
+# ================= 清理 =================
+
+def _clean(el):
+    for child in list(el):
+        tag = child.tag.split('}')[-1] if isinstance(child.tag, str) else None
+        # 注释 / 其他命名空间（Adobe、RDF...）的元素一律丢掉
+        if tag is None or tag in DROP_TAGS or not child.tag.startswith(f"{{{SVG_NS}}}"):
+            el.remove(child)
+            continue
+        _clean(child)
+        # Illustrator 的 <switch> 只是包了一层
+        if tag == "switch":
+            index = list(el).index(child)
+            el.remove(child)
+            for i, grandchild in enumerate(list(child)): el.insert(index + i, grandchild)
+
+    for name in list(el.attrib):
+        value = el.attrib[name]
+        local = name.split('}')[-1]
+        if name.startswith('{') and not name.startswith(f"{{{XLINK_NS}}}"): del el.attrib[name]
+        elif local in ("class", "id", "p-id", "t", "enable-background", "xml:space") or local.startswith("data-"):
+            if not (local == "id" and el.tag.endswith("clipPath")): del el.attrib[name]
+        elif local == "fill" and value.strip().lower() not in KEEP_FILLS: del el.attrib[name]
+        elif local == "style":
+            # 去掉写死的颜色，其余样式保留
+            style = re.sub(r'(?:^|;)\s*(?:fill|enable-background)\s*:[^;]*', '', value).strip('; ')
+            if style: el.attrib[name] = style
+            else: del el.attrib[name]
+
+def normalize_svg(content, size=INGEST_SIZE, padding=INGEST_PADDING):
+    content = content.lstrip('﻿')
+    # 包围盒在原始坐标系里算（含根 viewBox 之下的所有 transform）
+    box = svg_loader.parse_svg(content).bbox
+    if box is None: raise ValueError("没有可绘制的图形")
+    root = ET.fromstring(content.encode('utf-8'))
+    _clean(root)
+    width, height = box[2] - box[0], box[3] - box[1]
+    scale = (size - 2 * padding) / max(width, height)
+    # 长边撑满画布，短边居中
+    tx = padding + (size - 2 * padding - width * scale) / 2 - box[0] * scale
+    ty = padding + (size - 2 * padding - height * scale) / 2 - box[1] * scale
+
+    out = ET.Element(f"{{{SVG_NS}}}svg", {"width": str(size), "height": str(size), "viewBox": f"0 0 {size} {size}"})
+    group = ET.SubElement(out, f"{{{SVG_NS}}}g",
+                          {"transform": f"translate({main._format_number(tx, 3)} {main._format_number(ty, 3)}) scale({main._format_number(scale, 6)})"})
+    group.extend(list(root))
+    svg = ET.tostring(out, encoding='unicode', short_empty_elements=True)
+    # 路径沿用生成器的优化（取短、舍入），这里保留更高精度，缩放后再由 main 按 SVG_PRECISION 处理
+    return main.optimize_svg(svg, precision=3) + "\n"
+
+# ================= 主流程 =================
+
+def _ingest_one(source, size, padding):
+    content = Path(source).read_text(encoding='utf-8-sig')
+    return normalize_svg(content, size, padding)
+
+def _plan(raw_dir, default_reel):
+    # INGEST_MAP 指定的名字先全部占上，推导出的名字不能抢走（noun-apple-7941940 不能占掉苹果的 apple）
+    plan, skipped, taken = [], [], set(INGEST_MAP.values())
+    for file in sorted(Path(raw_dir).glob("*.svg"), key=lambda p: unicodedata.normalize("NFC", p.name)):
+        stem = unicodedata.normalize("NFC", file.stem)
+        if stem in INGEST_MAP:
+            plan.append((file, *INGEST_MAP[stem]))
+            continue
+        reel = default_reel
+        if reel is None:
+            skipped.append(file.name)
+            continue
+        # 同一系列的多个版本（noun-daft-punk-37517 / 37518）推导出同名时加序号
+        name, base, n = normalize_name(stem), normalize_name(stem), 1
+        while (reel, name) in taken:
+            n += 1
+            name = f"{base}-{n}"
+        taken.add((reel, name))
+        plan.append((file, reel, name))
+    return plan, skipped
+
+def _rel(path):
+    try: return Path(path).resolve().relative_to(main.ASSETS_DIR.resolve()).as_posix()
+    except ValueError: return str(path)
+
+def ingest(raw_dir=RAW_DIR, default_reel=None, force=False, jobs=None, use_cache=True,
+           size=INGEST_SIZE, padding=INGEST_PADDING, manifest_path=INGEST_MANIFEST):
+    started = time.perf_counter()
+    plan, skipped = _plan(raw_dir, default_reel)
+    cache = main.BuildCache(main.CACHE_DIR, enabled=use_cache)
+    try: previous = json.loads(Path(manifest_path).read_text(encoding='utf-8'))
+    except (OSError, ValueError): previous = {"icons": []}
+    # 只有上一次由 ingest 写出的文件才算“自己的”，手工调整过的卷轴图标不会被覆盖
+    owned = {entry["file"] for entry in previous.get("icons", [])}
+    by_source = {entry["source"]: entry for entry in previous.get("icons", [])}
+
+    results, pending = {}, {}
+    for file, reel, name in plan:
+        key = main._hash_key(file.read_bytes(), str(size), str(padding), str(INGEST_VERSION))
+        hit = cache.get("ingest", key)
+        if hit is not None: results[file] = (key, hit["svg"])
+        else: pending[file] = key
+
+    # 只有未命中缓存的文件才进进程池
+    if pending:
+        files = list(pending)
+        if jobs == 1 or len(files) == 1:
+            outputs = [_try_ingest(f, size, padding) for f in files]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                outputs = list(pool.map(_try_ingest, files, [size] * len(files), [padding] * len(files)))
+        for file, (svg, error) in zip(files, outputs):
+            if error:
+                print(f"❌ {file.name}: {error}")
+                continue
+            cache.put("ingest", pending[file], {"svg": svg})
+            results[file] = (pending[file], svg)
+
+    entries, written, kept = [], 0, []
+    for file, reel, name in plan:
+        if file not in results:
+            # 这次处理失败：沿用上一次的结果，保留已经写出的图标
+            if _rel(file) in by_source: entries.append(by_source[_rel(file)])
+            continue
+        key, svg = results[file]
+        target = REEL_DIRS[reel] / f"{name}.svg"
+        rel = _rel(target)
+        if target.exists() and rel not in owned and not force:
+            kept.append(rel)
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # 内容没变就不写，避免 --watch 因 mtime 变化整页重建
+        if not target.exists() or target.read_text(encoding='utf-8') != svg:
+            main.write_html([svg], target)
+            written += 1
+        entries.append({"source": _rel(file), "file": rel,
+                        "reel": f"{reel}_reel", "name": name, "key": key})
+
+    # 原始文件删掉了：把 ingest 以前写出的对应图标一并删掉；来源还在的（包括这次失败的）不删
+    planned = {_rel(REEL_DIRS[reel] / f"{name}.svg") for _, reel, name in plan}
+    current = {e["file"] for e in entries}
+    for rel in sorted(owned - planned - current):
+        stale = main.ASSETS_DIR / rel
+        if stale.exists():
+            stale.unlink()
+            print(f"🗑️ 删除已不存在来源的图标 {rel}")
+
+    manifest = {"version": INGEST_VERSION, "size": size, "padding": padding, "icons": entries}
+    main.write_html([json.dumps(manifest, ensure_ascii=False, indent=2) + "\n"], Path(manifest_path))
+    cache.report()
+    if kept: print(f"保留手工维护的图标 {len(kept)} 个（--force 覆盖）: {', '.join(kept)}")
+    if skipped: print(f"未分配卷轴 {len(skipped)} 个（用 --reel 指定或加入 INGEST_MAP）: {', '.join(skipped)}")
+    print(f"导入完成: {len(entries)} 个图标，写入 {written} 个，{len(pending)} 个重新处理 "
+          f"({time.perf_counter() - started:.2f} s) -> {Path(manifest_path).name}")
+    return manifest
+
+def _try_ingest(file, size, padding):
+    # 单个文件出错不影响整批
+    try: return _ingest_one(file, size, padding), None
+    except (ET.ParseError, svg_loader.xml.parsers.expat.ExpatError, ValueError, OSError) as e: return None, str(e)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="把 assets/icons/raw 里的原始图标归一化后导入卷轴目录")
+    parser.add_argument("--raw", default=RAW_DIR, help="原始图标目录")
+    parser.add_argument("--reel", choices=sorted(REEL_DIRS), help="INGEST_MAP 里没有的图标放入哪个卷轴")
+    parser.add_argument("--force", action="store_true", help="覆盖不是由 ingest 生成的同名卷轴图标")
+    parser.add_argument("--jobs", type=int, default=None, help="进程数，默认等于 CPU 核数")
+    parser.add_argument("--size", type=int, default=INGEST_SIZE, help="输出画布边长")
+    parser.add_argument("--padding", type=float, default=INGEST_PADDING, help="画布留白")
+    parser.add_argument("--no-cache", action="store_true", help="不读取也不写入 ingest 缓存")
+    args = parser.parse_args()
+    ingest(args.raw, args.reel, force=args.force, jobs=args.jobs, use_cache=not args.no_cache,
+           size=args.size, padding=args.padding)
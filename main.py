@@ -1,7 +1,26 @@
+import argparse
+import gzip
+import hashlib
+import json
+import math
 import os
+import random
+import re
+import time
+import tomllib
+import urllib.parse
 import webbrowser
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import svg_loader
+from svg_loader import _absolute_path, _canonical_segments, _cubic_point, _parse_transform, _tokenize_path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 # =================配置区域=================
 BASE_DIR = Path(__file__).parent
 ASSETS_DIR = BASE_DIR / "assets" / "icons"
@@ -18,67 +37,865 @@ HEART_COLOR = "#D32F2F"
 APPLE_COLOR = "#000000"
 ANCHOR_WATER_COLOR = "#000000" 
 
+# == 粒子轨迹库 ==
+# 构建时按固定种子预先算好轨迹，运行时只挑选 class，不再逐个写 inline style
+PARTICLE_SEED = 2026
+# bank 取质数：运行时用任意步长遍历都不会重复
+PARTICLE_EMITTERS = {
+    "anchor":  {"type": "water", "x": 50, "y": 90, "dir_y": -1, "spread": 40, "bank": 41, "min": 20, "extra": 10},
+    "hammer":  {"type": "crumb", "x": 92, "y": 45, "dir_y": 1,  "spread": 30, "bank": 17, "min": 3,  "extra": 3},
+    "apple-1": {"type": "crumb", "x": 75, "y": 25, "dir_y": -1, "spread": 15, "bank": 17, "min": 3,  "extra": 3},
+    "apple-2": {"type": "crumb", "x": 78, "y": 50, "dir_y": 1,  "spread": 15, "bank": 17, "min": 3,  "extra": 3},
+}
+# 每个卷轴预先创建的粒子节点数，也是同时存活粒子数的硬上限（水花最多 29 个）
+PARTICLE_POOL_SIZE = 32
+
+# == 动画时间线（毫秒）==
+WAIT_TIME = 3500             # 三个卷轴全部停下后的停留时间
+SPIN_DURATION_BASE = 1000    # 全部启动后到第一个卷轴停止
+SPIN_DELAY = 400             # 相邻卷轴停止的间隔
+START_DELAY = 150            # 相邻卷轴启动的间隔
+# 各特效的时间线 / 样式 / 注入见逻辑区域的 EFFECTS 注册表
+
+# == 旋转模糊 ==
+# True: 构建时把每个卷轴烘焙成一张已模糊的贴图，旋转时只做 transform；False: 旋转时实时 filter: blur
+PREBLUR_SPIN = True
+SPIN_BLUR = 2            # 模糊半径（px），与原来的 filter: blur(2px) 一致
+# True: 每个卷轴只渲染一份图标，旋转中（被贴图遮住时）重排节点实现循环；需要 PREBLUR_SPIN
+VIRTUAL_REELS = True
+
+# == 特效几何（百分比，相对图标画布）==
+# 优先级：GEOMETRY_FILE（调试台 --watch 写入的手工值）> 从图标路径自动拟合 > 这里的缺省值
+GEOMETRY_FILE = ASSETS_DIR / "geometry.json"
+AUTO_GEOMETRY = True     # 从路径几何（包围盒 / 形心 / 最小包围圆）自动计算特效位置
+DEFAULT_GEOMETRY = {
+    # 外星人眼罩：左眼圆心与半径，右眼水平镜像
+    "alien": {"eye_x": 29.5, "eye_y": 60.5, "eye_r": 18},
+    # 维特鲁威人：外圆 + 方框
+    "human": {"circle_cx": 50, "circle_cy": 50.5, "circle_r": 55,
+              "rect_x": 2, "rect_y": 8, "rect_w": 100.5, "rect_h": 92},
+}
+
+# == 输出配置 ==
+# True: 每个图标只输出一次 <symbol>，卷轴中用 <use> 引用；False: 每个实例内联完整 SVG
+SPRITE_MODE = True
+
+# == SVG 优化 ==
+OPTIMIZE_SVG = True
+SVG_PRECISION = 2        # 路径坐标保留的小数位数（200 单位画布下 0.01 约等于 0.003px）
+# 几何简化：按最终渲染尺寸换算容差，合并肉眼看不出的折线点和曲线段
+SIMPLIFY_PATHS = True
+SIMPLIFY_TOLERANCE_PX = 0.25   # 渲染后允许的最大偏差（px）
+ICON_RENDER_RATIO = 0.7        # 图标占格子的比例：CSS 里 svg 的 width/height 和预模糊贴图都按它生成
+# 图形上写死的 fill 会压过 CSS 的 fill: var(--icon-color)，除这些以外一律去掉，让图形继承 ICON_COLOR
+# none 是描边图形，白色通常是在黑色图形上“挖洞”
+KEEP_FILLS = {"none", "white", "#fff", "#ffffff", "transparent"}
+
+# == 构建缓存 ==
+CACHE_DIR = OUTPUT_HTML.parent / ".haa_cache"
+CACHE_VERSION = 4        # 修改了图标处理 / 片段生成逻辑时 +1，让旧缓存全部失效
+
+# == 多版本构建 ==
+VARIANTS_OUTPUT_DIR = BASE_DIR / "variants"
+# 变体文件里可以覆盖的配置项（大小写不敏感）
+VARIANT_KEYS = ("LOGO_SIZE", "GAP_SIZE", "BG_COLOR", "ICON_COLOR", "HEART_COLOR", "APPLE_COLOR",
+                "ANCHOR_WATER_COLOR", "SPRITE_MODE", "OPTIMIZE_SVG", "SVG_PRECISION", "H_REEL_DIR", "A_REEL_DIR")
+
+# == index.html 图标包 ==
+INDEX_HTML = BASE_DIR / "index.html"
+ICON_PACK_DIR = ASSETS_DIR             # 输出 icons.<hash>.json，index.html 里的 ICON_PACK_URL 会被同步改写
+
+# == 拆分输出 ==
+# True: 样式 / 脚本 / 图标包各自输出为带内容哈希的文件，HTML 只是引用它们的外壳（也可用 --split）
+SPLIT_OUTPUT = False
+SPLIT_ASSETS_DIR = BASE_DIR / "static"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"   # 写进 asset-manifest，供静态托管使用
+
+# == 可嵌入组件 ==
+# <haa-logo> 自定义元素：一个脚本自带样式、sprite 和调度器，页面上任意多个实例共用（--component）
+COMPONENT_JS = BASE_DIR / "haa-logo.js"
+COMPONENT_WINDOW = 2                   # 组件每个卷轴的格子数：停止时从上一个图标滚到目标
+
+# == 预压缩 ==
+PRECOMPRESS = True                     # 输出文件旁生成 .gz / .br（brotli 已安装时）
+ASSET_MANIFEST = BASE_DIR / "asset-manifest.json"
+DEFLATE_WINDOW = 32 * 1024             # gzip 回溯窗口，重复内容相距超过它就无法复用
+
 # =================逻辑区域=================
 
-def get_svg_content(filepath):
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if '<svg' in content: return content
-    except Exception: return None
+# ---------- SVG 优化 ----------
+
+def _format_number(value, precision):
+    text = f"{round(value, precision):.{precision}f}"
+    # 只去掉小数部分的尾零：precision=0 时没有小数点，"10" 不能变成 "1"
+    if '.' in text: text = text.rstrip('0').rstrip('.')
+    if text in ('-0', ''): text = '0'
+    if text.startswith('0.'): text = text[1:]
+    elif text.startswith('-0.'): text = '-' + text[2:]
+    return text
+
+def _join_numbers(numbers):
+    out, prev = "", ""
+    for text in numbers:
+        # 负号，或前一个数已带小数点时的 ".5"，本身就能充当分隔符
+        if prev and not (text[0] == '-' or (text[0] == '.' and '.' in prev)):
+            out += ' '
+        out += text
+        prev = text
+    return out
+
+def optimize_path(d, precision=SVG_PRECISION, tolerance=0):
+    segments = _absolute_path(_tokenize_path(d))
+    if tolerance > 0: segments = simplify_segments(segments, tolerance)
+    parts, last_cmd = [], None
+    # ex/ey 是“已输出坐标”的当前点，相对坐标以它为基准，避免舍入误差累积
+    ex = ey = sx = sy = 0.0
+    for c, args in segments:
+        if c == 'Z':
+            parts.append('z')
+            last_cmd = 'z'
+            ex, ey = sx, sy
+            continue
+        if c == 'L' and round(args[1] - ey, precision) == 0: c, args = 'H', [args[0]]
+        elif c == 'L' and round(args[0] - ex, precision) == 0: c, args = 'V', [args[1]]
+
+        def encode(relative):
+            vals = []
+            for i, v in enumerate(args):
+                if c == 'A' and i < 5:
+                    vals.append(v)
+                    continue
+                if not relative: base = 0
+                elif c == 'H' or (c == 'A' and i == 5): base = ex
+                elif c == 'V' or (c == 'A' and i == 6): base = ey
+                else: base = ex if i % 2 == 0 else ey
+                vals.append(round(v - base, precision))
+            if c == 'A':
+                texts = [_format_number(v, precision) for v in vals[:3]] + [str(int(vals[3])), str(int(vals[4]))] + [_format_number(v, precision) for v in vals[5:]]
+            else:
+                texts = [_format_number(v, precision) for v in vals]
+            letter = c.lower() if relative else c
+            # 与上一段命令相同时省略字母，只需保证和前一个数之间有分隔
+            prefix = letter
+            if letter == last_cmd: prefix = '' if texts[0][0] == '-' else ' '
+            return prefix + _join_numbers(texts), vals, letter
+
+        abs_text, abs_vals, abs_letter = encode(False)
+        rel_text, rel_vals, rel_letter = encode(True)
+        # M 作为第一条命令时保持绝对坐标
+        if not parts or len(rel_text) >= len(abs_text):
+            text, vals, letter, relative = abs_text, abs_vals, abs_letter, False
+        else:
+            text, vals, letter, relative = rel_text, rel_vals, rel_letter, True
+
+        if c == 'H': ex = round((ex if relative else 0) + vals[0], precision)
+        elif c == 'V': ey = round((ey if relative else 0) + vals[0], precision)
+        else:
+            ex = round((ex if relative else 0) + vals[-2], precision)
+            ey = round((ey if relative else 0) + vals[-1], precision)
+        if c == 'M': sx, sy = ex, ey
+        parts.append(text)
+        last_cmd = letter
+        # m 之后的隐式坐标会被当成 l，不能省略下一个命令字母
+        if letter in 'Mm': last_cmd = None
+    return ''.join(parts).strip()
+
+# ---------- 路径简化 ----------
+
+def _dist_to_segment(p, a, b):
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length = dx * dx + dy * dy
+    t = 0.0 if length == 0 else max(0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length))
+    return math.hypot(p[0] - a[0] - t * dx, p[1] - a[1] - t * dy)
+
+def _dist_to_polyline(p, poly):
+    return min(_dist_to_segment(p, poly[i], poly[i + 1]) for i in range(len(poly) - 1))
+
+def _rdp(points, tolerance):
+    # Ramer–Douglas–Peucker，用栈代替递归
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        index, worst = None, tolerance
+        for i in range(first + 1, last):
+            d = _dist_to_segment(points[i], points[first], points[last])
+            if d > worst: index, worst = i, d
+        if index is not None:
+            keep[index] = True
+            stack += [(first, index), (index, last)]
+    return [p for p, k in zip(points, keep) if k]
+
+def _flatten(curves, steps):
+    points = [curves[0][0]]
+    for curve in curves: points += [_cubic_point(curve, k / steps) for k in range(1, steps + 1)]
+    return points
+
+def _unit(dx, dy):
+    length = math.hypot(dx, dy)
+    return (dx / length, dy / length) if length > 1e-12 else None
+
+def _fit_cubic(curves, tolerance, steps=8):
+    # 端点与两端切线方向固定，用最小二乘求两个控制柄长度（Schneider 曲线拟合）；误差超出容差返回 None
+    p0, p3 = curves[0][0], curves[-1][3]
+    t1 = next((u for q in curves[0][1:] if (u := _unit(q[0] - p0[0], q[1] - p0[1]))), None)
+    t2 = next((u for q in reversed(curves[-1][:3]) if (u := _unit(q[0] - p3[0], q[1] - p3[1]))), None)
+    if t1 is None or t2 is None: return None
+    samples = _flatten(curves, steps)
+    lengths = [0.0]
+    for a, b in zip(samples, samples[1:]): lengths.append(lengths[-1] + math.hypot(b[0] - a[0], b[1] - a[1]))
+    if lengths[-1] == 0: return None
+
+    c11 = c12 = c22 = x1 = x2 = 0.0
+    for point, length in zip(samples, lengths):
+        u = length / lengths[-1]
+        mu = 1 - u
+        b0, b1, b2, b3 = mu * mu * mu, 3 * mu * mu * u, 3 * mu * u * u, u * u * u
+        a1, a2 = (t1[0] * b1, t1[1] * b1), (t2[0] * b2, t2[1] * b2)
+        rx = point[0] - (p0[0] * (b0 + b1) + p3[0] * (b2 + b3))
+        ry = point[1] - (p0[1] * (b0 + b1) + p3[1] * (b2 + b3))
+        c11 += a1[0] * a1[0] + a1[1] * a1[1]
+        c12 += a1[0] * a2[0] + a1[1] * a2[1]
+        c22 += a2[0] * a2[0] + a2[1] * a2[1]
+        x1 += rx * a1[0] + ry * a1[1]
+        x2 += rx * a2[0] + ry * a2[1]
+    det = c11 * c22 - c12 * c12
+    alpha1 = (x1 * c22 - c12 * x2) / det if abs(det) > 1e-12 else 0
+    alpha2 = (c11 * x2 - c12 * x1) / det if abs(det) > 1e-12 else 0
+    chord = math.hypot(p3[0] - p0[0], p3[1] - p0[1])
+    if alpha1 <= 1e-6 or alpha2 <= 1e-6: alpha1 = alpha2 = chord / 3
+    fitted = (p0, (p0[0] + t1[0] * alpha1, p0[1] + t1[1] * alpha1),
+              (p3[0] + t2[0] * alpha2, p3[1] + t2[1] * alpha2), p3)
+
+    # 双向检查：原曲线上的点离拟合曲线、拟合曲线上的点离原曲线都不能超过容差
+    dense = _flatten([fitted], steps * len(curves))
+    if any(_dist_to_polyline(p, dense) > tolerance for p in samples): return None
+    if any(_dist_to_polyline(p, samples) > tolerance for p in dense): return None
+    return fitted
+
+def _merge_curves(curves, tolerance):
+    # 贪心：从每一段开始尽量往后合并，直到拟合误差超出容差
+    result, i = [], 0
+    while i < len(curves):
+        best, j = curves[i], i
+        while j + 1 < len(curves):
+            fitted = _fit_cubic(curves[i:j + 2], tolerance)
+            if fitted is None: break
+            best, j = fitted, j + 1
+        result.append(best)
+        i = j + 1
+    return result
+
+def simplify_segments(segments, tolerance):
+    # 输入/输出都是绝对坐标的 [(命令, 参数)]；连续直线段用 RDP，连续曲线段用重新拟合
+    result, x, y, sx, sy = [], 0.0, 0.0, 0.0, 0.0
+    lines, curves = [], []
+
+    def flush():
+        if lines:
+            for point in _rdp([(x, y)] + lines, tolerance)[1:]: result.append(('L', list(point)))
+            lines.clear()
+        if curves:
+            for curve in _merge_curves(curves, tolerance): result.append(('C', [*curve[1], *curve[2], *curve[3]]))
+            curves.clear()
+
+    cx, cy = 0.0, 0.0    # 已收集的直线 / 曲线段的终点
+    for c, args in _canonical_segments(segments):
+        if c == 'L':
+            if curves:
+                flush()
+                x, y = cx, cy
+            lines.append((args[0], args[1]))
+        elif c == 'C':
+            p0 = (cx, cy)
+            curve = (p0, (args[0], args[1]), (args[2], args[3]), (args[4], args[5]))
+            # 控制点都贴着弦的曲线就是直线
+            if max(_dist_to_segment(curve[1], p0, curve[3]), _dist_to_segment(curve[2], p0, curve[3])) <= tolerance:
+                if curves:
+                    flush()
+                    x, y = cx, cy
+                lines.append(curve[3])
+            else:
+                if lines:
+                    flush()
+                    x, y = cx, cy
+                curves.append(curve)
+        else:
+            flush()
+            if c == 'Z':
+                # 回到起点的最后一条直线由 Z 画出即可
+                if result and result[-1][0] == 'L' and math.hypot(result[-1][1][0] - sx, result[-1][1][1] - sy) < 1e-9: result.pop()
+                result.append(('Z', []))
+                x, y = cx, cy = sx, sy
+                continue
+            result.append((c, args))
+            x, y = cx, cy = args[-2], args[-1]
+            if c == 'M': sx, sy = x, y
+            continue
+        cx, cy = args[-2], args[-1]
+    flush()
+    return result
+
+def _unwrap_group(content, start, end):
+    # 去掉 content[start:end] 处的 <g ...> 开标签及与之匹配的 </g>
+    depth, pos = 1, end
+    for match in re.finditer(r'<(/?)g\b[^>]*?(/?)>', content[end:]):
+        if match.group(2): continue
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            close = end + match.start()
+            return content[:start] + content[end:close] + content[close + len(match.group()):]
+    return content
+
+def _drop_elements(content, names):
+    # 按标签配对删除整个元素（含其中嵌套的自闭合子元素），自闭合的只删它自己
+    for name in names:
+        pattern = re.compile(rf'<(/?){re.escape(name)}\b[^>]*?(/?)>')
+        while (start := pattern.search(content)):
+            if start.group(1): break
+            end = start.end()
+            if not start.group(2):
+                depth = 1
+                for match in pattern.finditer(content, start.end()):
+                    if match.group(2): continue
+                    depth += -1 if match.group(1) else 1
+                    if depth == 0:
+                        end = match.end()
+                        break
+                # 没有配对的结束标签：不是合法的 XML，留给解析阶段报错
+                else: break
+            content = content[:start.start()] + content[end:]
+    return content
+
+def optimize_svg(content, precision=SVG_PRECISION, tolerance=0):
+    # tolerance: 几何简化允许的最大偏差（viewBox 单位），0 表示不简化
+    # 1. 元数据：XML 声明、注释、编辑器信息
+    content = re.sub(r'<\?xml.*?\?>|<!DOCTYPE[^>]*>|<!--.*?-->', '', content, flags=re.S)
+    content = _drop_elements(content, ("metadata", "title", "desc", "sodipodi:namedview"))
+    content = re.sub(r'\s+(?:(?:inkscape|sodipodi|sketch|serif):[\w-]+|data-name)="[^"]*"', '', content)
+    # 命名空间声明只在没有元素 / 属性再用到该前缀时才删
+    content = re.sub(r'\s+xmlns:(?!xlink\b)([\w-]+)="[^"]*"',
+                     lambda m: m.group() if re.search(rf'[<\s/]{re.escape(m.group(1))}:', content.replace(m.group(), '')) else '',
+                     content)
+    # clip-rule 只在 <clipPath> 内部生效
+    if '<clipPath' not in content: content = re.sub(r'\s+clip-rule="[^"]*"', '', content)
+
+    # 2. 覆盖整个画布的 clipPath 等于没裁剪：展开对应的 <g>，再删掉定义
+    view_box = re.search(r'<svg\b[^>]*viewBox="0 0 ([\d.]+) ([\d.]+)"', content)
+    for clip in re.finditer(r'<clipPath id="([^"]+)">\s*<rect width="([\d.]+)" height="([\d.]+)"[^>]*/>\s*</clipPath>', content):
+        if not view_box or (clip.group(2), clip.group(3)) != view_box.groups(): continue
+        group = re.search(rf'<g clip-path="url\(#{re.escape(clip.group(1))}\)">', content)
+        if group:
+            content = _unwrap_group(content, group.start(), group.end())
+            content = content.replace(clip.group(), '')
+    content = re.sub(r'<defs>\s*</defs>', '', content)
+    # 无属性的 <g> 只是包了一层
+    while (group := re.search(r'<g>', content)):
+        content = _unwrap_group(content, group.start(), group.end())
+
+    # 3. 路径数据：几何简化、相对/绝对取短、坐标舍入
+    #    容差按祖先 transform 的缩放换算到路径自己的坐标系
+    parts, pos, scales = [], 0, [1.0]
+    for tag in re.finditer(r'<(/?)([\w:-]+)([^>]*?)(/?)>', content):
+        if tag.group(1):
+            if len(scales) > 1: scales.pop()
+            continue
+        transform = re.search(r'\btransform="([^"]*)"', tag.group(3))
+        a, b, c, d = _parse_transform(transform.group(1))[:4] if transform else (1, 0, 0, 1)
+        scale = scales[-1] * math.sqrt(abs(a * d - b * c))
+        if not tag.group(4): scales.append(scale)
+        if tag.group(2) != 'path': continue
+
+        def _shorten(match):
+            try: return f'd="{optimize_path(match.group(1), precision, tolerance / scale if scale else 0)}"'
+            except ValueError: return match.group()
+        parts += [content[pos:tag.start()], re.sub(r'\bd="([^"]*)"', _shorten, tag.group())]
+        pos = tag.end()
+    content = ''.join(parts) + content[pos:]
+
+    # 4. 标签之间的空白
+    content = re.sub(r'>\s+<', '><', content).strip()
+    return content
+
+# ---------- 构建缓存 ----------
+
+class BuildCache:
+    # 按内容哈希存放处理后的图标和卷轴片段，一个条目一个 JSON 文件
+    def __init__(self, directory=CACHE_DIR, enabled=True):
+        self.directory = Path(directory)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, kind, key):
+        return self.directory / kind / f"{key}.json"
+
+    def get(self, kind, key):
+        if self.enabled:
+            try:
+                with open(self._path(kind, key), 'r', encoding='utf-8') as f:
+                    value = json.load(f)
+                self.hits += 1
+                return value
+            except (OSError, ValueError): pass
+        self.misses += 1
+        return None
+
+    def put(self, kind, key, value):
+        if not self.enabled: return
+        path = self._path(kind, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 先写临时文件再替换，中断时不会留下半个条目
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def report(self):
+        if not self.enabled:
+            print("构建缓存: 已禁用 (--no-cache)")
+            return
+        total = self.hits + self.misses
+        print(f"构建缓存: 命中 {self.hits} / {total}，未命中 {self.misses}  ({self.directory})")
+
+def _hash_key(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8') if isinstance(part, str) else part)
+        digest.update(b'\0')
+    return digest.hexdigest()[:24]
+
+# ---------- 图标加载 ----------
+
+def load_geometry(path=GEOMETRY_FILE, auto=None):
+    # auto: fit_overlay_geometry 的结果，覆盖缺省值；文件里的数值再覆盖它们。文件不存在或内容损坏时忽略
+    geometry = {section: dict(values) for section, values in DEFAULT_GEOMETRY.items()}
+    for section, values in (auto or {}).items():
+        if section in geometry: geometry[section].update(values)
+    try: saved = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, ValueError): saved = {}
+    for section, values in saved.items() if isinstance(saved, dict) else ():
+        if section not in geometry or not isinstance(values, dict): continue
+        for key, value in values.items():
+            try:
+                if key in geometry[section]: geometry[section][key] = float(value)
+            except (TypeError, ValueError): pass
+    return geometry
+
+def _pct(value):
+    return f"{value:g}%"
+
+def _diagonal(width, height):
+    # SVG 里半径等非水平 / 垂直长度的百分比以 sqrt((w² + h²) / 2) 为基准
+    return math.sqrt((width ** 2 + height ** 2) / 2)
+
+def _pct_of(value, length):
+    # 百分比坐标相对 viewBox 宽高（与 viewBox 原点无关）
+    return round(100 * value / length, 2)
+
+def _fit_alien(subpaths, vw, vh):
+    # 眼睛是头部轮廓里挖出的洞：最大子路径之外、形心落在头部包围盒内的两个最大子路径
+    head = max(subpaths, key=lambda s: s.area)
+    x0, y0, x1, y1 = head.bbox
+    holes = sorted((s for s in subpaths if s is not head and x0 <= s.centroid[0] <= x1 and y0 <= s.centroid[1] <= y1),
+                   key=lambda s: -s.area)[:2]
+    if len(holes) < 2: return None
+    left, right = sorted((svg_loader.enclosing_circle(s.points) for s in holes), key=lambda c: c[0])
+    # 右眼由左眼镜像得到：两只眼取平均，半径取大的保证都能盖住
+    return {"eye_x": round((_pct_of(left[0], vw) + 100 - _pct_of(right[0], vw)) / 2, 2),
+            "eye_y": round((_pct_of(left[1], vh) + _pct_of(right[1], vh)) / 2, 2),
+            "eye_r": _pct_of(max(left[2], right[2]), _diagonal(vw, vh))}
+
+def _fit_human(subpaths, vw, vh):
+    # 维特鲁威人：外圆是整个人形的最小包围圆，方框是身体（最大子路径，不含头部）的包围盒
+    cx, cy, r = svg_loader.enclosing_circle([p for s in subpaths for p in s.points])
+    x0, y0, x1, y1 = max(subpaths, key=lambda s: s.area).bbox
+    return {"circle_cx": _pct_of(cx, vw), "circle_cy": _pct_of(cy, vh), "circle_r": _pct_of(r, _diagonal(vw, vh)),
+            "rect_x": _pct_of(x0, vw), "rect_y": _pct_of(y0, vh), "rect_w": _pct_of(x1 - x0, vw), "rect_h": _pct_of(y1 - y0, vh)}
+
+def fit_overlay_geometry(svg):
+    # svg: svg_loader.SvgIcon。返回 {段: {键: 百分比}}，没有注册拟合函数或识别不出结构时返回 {}（沿用缺省值）
+    fit = EFFECTS.get(svg.name, {}).get("fit")
+    if not AUTO_GEOMETRY or fit is None or not svg.box: return {}
+    subpaths = svg.subpaths()
+    values = fit(subpaths, *svg.box[2:]) if subpaths else None
+    return {svg.name: values} if values else {}
+
+def _alien_overlay(g):
+    return tuple(("circle", {"class": f"eye-cover {side}-eye", "cx": _pct(x), "cy": _pct(g["eye_y"]), "r": _pct(g["eye_r"]),
+                             "fill": "white", "transform": "scale(0)"})
+                 for side, x in (("left", g["eye_x"]), ("right", 100 - g["eye_x"])))
+
+def _human_overlay(g):
+    # pathLength="1"：描边动画按周长的比例计，与图标渲染尺寸无关
+    return (("circle", {"class": "v-shape v-circle", "cx": _pct(g["circle_cx"]), "cy": _pct(g["circle_cy"]), "r": _pct(g["circle_r"]),
+                        "pathLength": "1"}),
+            ("rect", {"class": "v-shape v-rect", "x": _pct(g["rect_x"]), "y": _pct(g["rect_y"]),
+                      "width": _pct(g["rect_w"]), "height": _pct(g["rect_h"]), "pathLength": "1"}))
+
+def _overlay_elements(name, geometry):
+    overlay = EFFECTS.get(name, {}).get("overlay")
+    return overlay(geometry[name]) if overlay else ()
+
+# ---------- 特效注册表 ----------
+# 以图标名精确匹配，只有实际加载到的图标对应的特效才会输出样式、脚本和事件
+#   timeline  [(相对该卷轴停止的毫秒 或 ("end", 毫秒) 相对本轮结束, 动作, 参数)]，由 compile_timeline 编译
+#             动作：add / remove 图标类，reel 卷轴类，bite 咬痕，particles 粒子发射器（PARTICLE_EMITTERS）
+#   css       该特效的样式
+#   overlay   几何段 -> 注入到每个实例里的 (标签, {属性}) 列表，几何段同名于 DEFAULT_GEOMETRY
+#   fit       (子路径, 宽, 高) -> 从路径自动拟合的几何段
+
+POP_OUT = [(0, "add", "active-overlay"), (0, "reel", "pop-out")]   # 特效超出格子时盖在相邻卷轴上
+
+EFFECTS = {
+    "anchor": {
+        "timeline": POP_OUT + [(0, "add", "anchor-hover-high"), (600, "remove", "anchor-hover-high"),
+                               (600, "add", "anchor-drop"), (800, "particles", "anchor")],
+        "css": """/* Anchor */
+        .anchor-hover-high svg { transform: translateY(var(--anchor-hover-y)) !important; }
+        .anchor-drop svg { animation: high-drop 0.2s cubic-bezier(0.5, 0, 0.75, 0) forwards; }
+        @keyframes high-drop { 0% { transform: translateY(var(--anchor-hover-y)); opacity: 1; } 100% { transform: translateY(0); opacity: 1; } }""",
+    },
+    "hammer": {
+        "timeline": POP_OUT + [(600, "add", "hammer-action"), (750, "particles", "hammer")],
+        "css": """/* Hammer */
+        .hammer-action svg { transform-origin: 80% 80%; animation: hammer-smash 0.4s cubic-bezier(0.25, 1, 0.5, 1) forwards; }
+        @keyframes hammer-smash { 0% { transform: rotate(0deg); } 40% { transform: rotate(60deg); } 100% { transform: rotate(0deg); } }""",
+    },
+    "heart": {
+        "timeline": POP_OUT + [(600, "add", "heartbeat")],
+        "css": """/* Heart */
+        .heartbeat svg { 
+            fill: var(--heart-color) !important; 
+            animation: heart-pulse 1.2s infinite ease-in-out;
+        }
+        @keyframes heart-pulse {
+             0% { transform: scale(1); }
+             15% { transform: scale(1.25); }
+             30% { transform: scale(1); }
+             45% { transform: scale(1.15); }
+             60% { transform: scale(1); }
+             100% { transform: scale(1); }
+        }""",
+    },
+    "apple": {
+        "timeline": [(600, "bite", "bite-1"), (600, "particles", "apple-1"), (850, "bite", "bite-2"), (850, "particles", "apple-2")],
+        "css": """/* Apple */
+        .bite-mark { position: absolute; background-color: var(--bg-color); border-radius: 50%; width: 32%; height: 32%; opacity: 0; z-index: 10; }
+        .bite-1 { top: 25%; right: 1%; } 
+        .bite-2 { top: 50%; right: -3%; }   
+        .bite-anim { animation: bite-snap 0.05s linear forwards; }
+        @keyframes bite-snap { from { opacity: 0; transform: scale(0.8); } to { opacity: 1; transform: scale(1); } }
+        @media (prefers-reduced-motion: reduce) { .bite-anim { opacity: 1; } }""",
+    },
+    "alien": {
+        "timeline": [(("end", -100), "add", "alien-action")],
+        "css": """/* Alien */
+        .eye-cover { transform: scale(0); transform-origin: center; transition: transform 0.1s cubic-bezier(0, 0, 0.2, 1); }
+        .alien-action .eye-cover { transform: scale(1) !important; }""",
+        "overlay": _alien_overlay,
+        "fit": _fit_alien,
+    },
+    "human": {
+        "timeline": POP_OUT + [(600, "add", "draw-square"), (2200, "add", "draw-circle")],
+        "css": """/* Human (Vitruvian) */
+        .v-shape {
+            fill: none; stroke: var(--icon-color); stroke-width: 2px;
+            /* [修改] 粗细改为 2px */
+            stroke-width: 2px; 
+            /* 周长归一化为 1（pathLength）；间隔和起始偏移略大于 1，圆头线帽在开始前不露出来 */
+            stroke-dasharray: 1 1.05; stroke-dashoffset: 1.02; opacity: 1; vector-effect: non-scaling-stroke; stroke-linecap: round;
+        }
+        .v-circle { transform-origin: center; transform: rotate(-135deg); }
+
+        .draw-circle .v-circle { animation: draw-stroke 1.6s linear forwards; }
+        .draw-square .v-rect { animation: draw-stroke 1.6s linear forwards; }
+        @keyframes draw-stroke { to { stroke-dashoffset: 0; } }
+        @media (prefers-reduced-motion: reduce) { .draw-circle .v-circle, .draw-square .v-rect { stroke-dashoffset: 0; } }""",
+        "overlay": _human_overlay,
+        "fit": _fit_human,
+    },
+}
+
+def active_effects(icons):
+    # 按注册顺序返回实际加载到的图标对应的特效名
+    names = {icon["name"] for icon in icons}
+    return [name for name in EFFECTS if name in names]
+
+def reel_effects(reels):
+    # 每个卷轴实际含有的特效：时间线只为卷轴上存在的图标编译事件
+    return [active_effects(icons) for _, icons in reels]
 
-def load_icons(directory):
+def _effect_emitters(effects):
+    return [arg for name in effects for _, action, arg in EFFECTS[name]["timeline"] if action == "particles"]
+
+def load_icons(directory, optimize=OPTIMIZE_SVG, precision=SVG_PRECISION, cache=None, simplify_px=None, render_px=None,
+               geometry=None):
+    # simplify_px: 几何简化的像素容差；render_px: 图标实际渲染边长
+    # geometry: 固定的特效几何；默认逐个图标拟合，再叠加 GEOMETRY_FILE
+    if simplify_px is None: simplify_px = SIMPLIFY_TOLERANCE_PX if SIMPLIFY_PATHS else 0
+    if render_px is None: render_px = _px(LOGO_SIZE) * ICON_RENDER_RATIO
     icons = []
     if not directory.exists(): return []
     for file in sorted(directory.glob("*.svg")):
-        content = get_svg_content(file)
-        if content: 
-            # 1. 外星人特效
-            if file.stem == 'alien':
-                eye_covers = """
-                    <circle class="eye-cover left-eye" cx="29.5%" cy="60.5%" r="18%" fill="white" transform="scale(0)" />
-                    <circle class="eye-cover right-eye" cx="70.5%" cy="60.5%" r="18%" fill="white" transform="scale(0)" />
-                """
-                content = content.replace('</svg>', f'{eye_covers}</svg>')
-            
-            # 2. 维特鲁威人特效 [更新为你指定的参数]
-            if file.stem == 'human':
-                v_shapes = """
-                    <circle class="v-shape v-circle" cx="50%" cy="50.5%" r="55%" />
-                    <rect class="v-shape v-rect" x="2%" y="8%" width="100.5%" height="92%" />
-                """
-                content = content.replace('</svg>', f'{v_shapes}</svg>')
-
-            icons.append({"name": file.stem, "content": content})
+        # 同一进程内按 路径 + mtime 记忆，watch 模式下没改动的文件不会重新解析
+        svg = svg_loader.load(file)
+        if svg is None: continue
+        # 只有注册了注入的特效才需要几何（拟合 + 读取 GEOMETRY_FILE）
+        overlay = (_overlay_elements(svg.name, geometry or load_geometry(auto=fit_overlay_geometry(svg)))
+                   if "overlay" in EFFECTS.get(svg.name, {}) else ())
+        # 缓存键 = 源文件内容 + 注入内容 + 影响处理结果的配置
+        key = _hash_key(svg.source, svg.name, svg_loader.render_elements(overlay), str(optimize), str(precision),
+                        str(simplify_px), str(render_px), str(CACHE_VERSION))
+        icon = cache.get("icons", key) if cache else None
+        if icon is None:
+            icon = _process_icon(svg, overlay, optimize, precision, simplify_px, render_px)
+            if cache: cache.put("icons", key, icon)
+        icon["key"] = key
+        icons.append(icon)
     return icons
 
-def generate_html():
-    h_icons = load_icons(H_REEL_DIR)
-    a_icons = load_icons(A_REEL_DIR)
+def _inherit_fill(content):
+    return re.sub(r'\s+fill="([^"]*)"', lambda m: m.group() if m.group(1).strip().lower() in KEEP_FILLS else '', content)
+
+def _process_icon(svg, overlay, optimize, precision, simplify_px=0, render_px=None):
+    # svg: svg_loader.SvgIcon；overlay: 要注入的 (标签, {属性}) 列表
+    # 优化后的结果同样解析成 IR，后续各阶段直接取字段
+    source = _inherit_fill(svg.source)
+    result = svg_loader.parse_svg(source, svg.name) if source != svg.source else svg
+    if optimize:
+        # 像素容差换算到 viewBox 单位：图标按长边缩放到 render_px
+        size = max(svg.box[2:])
+        tolerance = simplify_px * size / render_px if simplify_px and size and render_px else 0
+        try:
+            result = svg_loader.parse_svg(optimize_svg(source, precision, tolerance), svg.name)
+        except (ValueError, svg_loader.xml.parsers.expat.ExpatError) as e:
+            # 优化结果不是合法 SVG 时退回原始图标，不让单个文件中断整个构建
+            print(f"⚠️ {svg.name}: 优化后的 SVG 无法解析（{e}），使用原始内容")
+            result = svg
+
+    # overlay 单独保存：sprite 模式下它必须留在每个实例里，才能按实例触发动画
+    return {"name": svg.name, "content": result.render(overlay),
+            "view_box": result.view_box, "body": result.body, "overlay": svg_loader.render_elements(overlay),
+            "bbox": list(svg.bbox) if svg.bbox else None,
+            "raw_bytes": len(svg.source.encode('utf-8')), "opt_bytes": len(result.body.encode('utf-8')),
+            "raw_nodes": svg.nodes, "opt_nodes": result.nodes}
+
+def report_optimization(icons):
+    simplify = f"，简化容差 {SIMPLIFY_TOLERANCE_PX}px" if SIMPLIFY_PATHS else ""
+    print(f"SVG 优化 (精度 {SVG_PRECISION} 位小数{simplify}):")
+    total_raw = total_opt = total_raw_nodes = total_opt_nodes = 0
+    for icon in icons:
+        raw, opt = icon["raw_bytes"], icon["opt_bytes"]
+        raw_nodes, opt_nodes = icon["raw_nodes"], icon["opt_nodes"]
+        total_raw += raw
+        total_opt += opt
+        total_raw_nodes += raw_nodes
+        total_opt_nodes += opt_nodes
+        print(f"  {icon['name']:<12} {raw:>6} B -> {opt:>6} B  (-{raw - opt} B, {100 * (raw - opt) / raw:.0f}%)"
+              f"  节点 {raw_nodes:>4} -> {opt_nodes:>4}")
+    print(f"  {'合计':<10} {total_raw:>6} B -> {total_opt:>6} B  (-{total_raw - total_opt} B)"
+          f"  节点 {total_raw_nodes:>4} -> {total_opt_nodes:>4}")
+
+def generate_html(use_cache=True, open_browser=True, output=OUTPUT_HTML, split=SPLIT_OUTPUT):
+    cache = BuildCache(CACHE_DIR, enabled=use_cache)
+    h_icons = load_icons(H_REEL_DIR, cache=cache)
+    a_icons = load_icons(A_REEL_DIR, cache=cache)
     
     if not h_icons or not a_icons:
         print("错误：未找到图标")
-        return
+        return None
+
+    if OPTIMIZE_SVG: report_optimization(h_icons + a_icons)
+
+    _check_repeat_distance(h_icons + a_icons)
+    if split:
+        assets = write_split_assets(h_icons, a_icons)
+        base = BASE_DIR if hasattr(output, 'write') else Path(output).parent
+        write_html(render_split_page(h_icons, a_icons, assets, base, cache), output)
+    else:
+        assets = {}
+        write_html(render_page(h_icons, a_icons, cache), output)
+    cache.report()
+    if not hasattr(output, 'write'):
+        print(f"最终优化版 v19 生成: {output}")
+        for path in assets.values(): print(f"  {path.name}")
+        if PRECOMPRESS: update_asset_manifest([output, *assets.values()], immutable=assets.values())
+        if open_browser: webbrowser.open(f'file://{Path(output).resolve()}')
+    return h_icons + a_icons
+
+# ---------- 粒子轨迹库 ----------
+
+def build_particle_bank(seed=PARTICLE_SEED):
+    # 与原先运行时 Math.random() 相同的分布，只是挪到构建期按种子生成
+    rng = random.Random(seed)
+    bank = {}
+    for name, e in PARTICLE_EMITTERS.items():
+        particles = []
+        for _ in range(e["bank"]):
+            p = {"left": e["x"] + (rng.random() - 0.5) * 10}
+            if e["type"] == 'water':
+                p["top"] = 60 + rng.random() * 30
+                p["tx"] = (rng.random() - 0.5) * 2.5 * e["spread"] * 1.3
+                p["ty"] = -(11 + rng.random() * 4)
+                p["size"] = 2 + rng.random() * 5
+            else:
+                p["top"] = e["y"] + (rng.random() - 0.5) * 5
+                p["tx"] = (rng.random() - 0.5) * e["spread"] * 2
+                p["ty"] = (10 + rng.random() * 20) * e["dir_y"]
+            particles.append(p)
+        bank[name] = particles
+    return bank
+
+PARTICLE_CSS = """/* === 粒子系统 === */
+        .particle-wrapper {
+            position: absolute;
+            /* 强制层级最高，确保粒子在 Frame 和 Mask 之上 */
+            z-index: 100; 
+            opacity: 0;
+            pointer-events: none;
+            /* 开启 GPU 加速 */
+            transform: translateZ(1px); 
+            animation: fly-x 0.4s linear forwards;
+        }
+
+        .particle-inner {
+            width: 100%;
+            height: 100%;
+            animation: fly-y 0.4s cubic-bezier(0.25, 1, 0.5, 1) forwards;
+        }
+        """
+
+PARTICLE_TYPE_CSS = {
+    "crumb": """.p-crumb .particle-inner {
+            width: 0; height: 0; 
+            border-left: 2px solid transparent; 
+            border-right: 2px solid transparent; 
+            border-bottom: 4px solid var(--icon-color);
+        }""",
+    "water": """.p-water .particle-inner {
+            background-color: var(--water-color); 
+            border-radius: 50%;
+        }""",
+}
+
+PARTICLE_KEYFRAMES = """@keyframes fly-x {
+            0% { transform: translateX(0); opacity: 1; }
+            100% { transform: translateX(var(--tx)); opacity: 0; }
+        }
+
+        @keyframes fly-y {
+            0% { transform: translateY(0) scale(1); }
+            100% { transform: translateY(var(--ty)) scale(0.5); }
+        }"""
+
+def _particle_system_css(emitters):
+    # 没有任何特效用到粒子时整段不输出；粒子类型和轨迹只保留用到的发射器
+    if not emitters: return ""
+    bank = {name: particles for name, particles in build_particle_bank().items() if name in emitters}
+    types = [t for t in PARTICLE_TYPE_CSS if any(PARTICLE_EMITTERS[e]["type"] == t for e in emitters)]
+    return (PARTICLE_CSS + "\n        ".join(PARTICLE_TYPE_CSS[t] for t in types) + "\n\n        " + PARTICLE_KEYFRAMES
+            + "\n\n        /* 预计算的粒子轨迹：每个 class 固定位置 / 尺寸 / 位移 */\n        " + _particle_css(bank))
+
+def _particle_css(bank):
+    rules = []
+    for name, particles in bank.items():
+        for i, p in enumerate(particles):
+            size = f" width: {_scaled(p['size'])}; height: {_scaled(p['size'])};" if "size" in p else ""
+            rules.append(f".pt-{name}-{i} {{ top: {p['top']:.1f}%; left: {p['left']:.1f}%;{size} --tx: {_scaled(p['tx'])}; --ty: {_scaled(p['ty'])}; }}")
+    return "\n        ".join(rules)
+
+def _particle_table(emitters):
+    return json.dumps({name: [e["type"], e["bank"], e["min"], e["extra"]] for name, e in PARTICLE_EMITTERS.items() if name in emitters})
+
+# ---------- 旋转模糊贴图 ----------
+
+def _px(value, default=80.0):
+    try: return float(str(value).removesuffix("px"))
+    except ValueError: return default
+
+def _scaled(px):
+    # 按 LOGO_SIZE 设计的像素值换成 --size 的倍数：默认尺寸下不变，宿主覆盖 --size 时跟着缩放
+    return f"calc(var(--size) * {px / _px(LOGO_SIZE):.4g})"
 
-    h_render_list = h_icons * 3
-    a_render_list = a_icons * 3
+def _spin_texture(icons, color):
+    # 两轮图标竖排成一张 SVG，整体做一次高斯模糊；上下各多放一个邻居图标再裁掉，
+    # 这样首尾的模糊和循环衔接处一致
+    # color: 贴图是静态图片，用不了 var(--icon-color)，由调用方传入与 CSS 相同的颜色
+    size = _px(LOGO_SIZE)
+    icon = size * ICON_RENDER_RATIO
+    pad = (size - icon) / 2
+    n = len(icons)
+    defs = ''.join(f'<symbol id="s{i}" viewBox="{icon_["view_box"]}">{icon_["body"]}</symbol>'
+                   for i, icon_ in enumerate(icons) if icon_["view_box"])
+    order = [n - 1] + list(range(n)) * 2 + [0]
+    uses = ''.join(f'<use href="#s{idx}" x="{pad:g}" y="{row * size + pad:g}" width="{icon:g}" height="{icon:g}"/>'
+                   for row, idx in enumerate(order))
+    svg = (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 {size:g} {size:g} {2 * n * size:g}" fill="{color}">'
+           f'<defs>{defs}<filter id="b"><feGaussianBlur stdDeviation="{SPIN_BLUR}"/></filter></defs>'
+           f'<g filter="url(#b)">{uses}</g></svg>')
+    return "data:image/svg+xml," + urllib.parse.quote(svg.replace('"', "'"), safe=" =:/;,'.-_()")
 
-    html_content = f"""
+def _spin_css(reels):
+    if not PREBLUR_SPIN:
+        return """.blur-spin {
+            filter: blur(2px);
+            animation: infinite-spin 0.4s linear infinite;
+        }
+
+        @keyframes infinite-spin {
+            0% { transform: translateY(0); }
+            100% { transform: translateY(-33.33%); }
+        }"""
+    # 贴图只在 .reel.spinning 时显示，并隐藏真实卷轴；动画只有 transform，全程交给合成线程
+    return "\n        ".join(["""/* 预模糊贴图：两轮图标，平移 -50% 正好一轮 */
+        .spin-texture { position: absolute; top: 0; left: 0; width: var(--size); display: none; pointer-events: none;
+                        background-repeat: no-repeat; background-size: 100% 100%; will-change: transform; }
+        .reel.spinning .spin-texture { display: block; animation: texture-spin 0.4s linear infinite; }
+        .reel.spinning .strip { visibility: hidden; }
+        @keyframes texture-spin { 0% { transform: translateY(0); } 100% { transform: translateY(-50%); } }"""]
+                              + _spin_texture_rules(reels))
+
+def _spin_texture_rules(reels):
+    # 每个卷轴键一条规则；内容取决于图标，拆分输出时放进图标包而不是样式表
+    if not PREBLUR_SPIN: return []
+    rules, seen = [], set()
+    for key, icons in reels:
+        if key in seen: continue
+        seen.add(key)
+        rules.append(f'.spin-{key} {{ height: calc(var(--size) * {2 * len(icons)}); background-image: url("{_spin_texture(icons, ICON_COLOR)}"); }}')
+    return rules
+
+# ---------- 页面输出 ----------
+
+def _page_head(spin_css, effects):
+    return f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <style>
-        :root {{
+{_page_css(spin_css, effects)}    </style>
+</head>
+<body>
+"""
+
+def _css_vars(selector):
+    return f"""        {selector} {{
             --size: {LOGO_SIZE};
             --gap: {GAP_SIZE};
             --bg-color: {BG_COLOR};
             --icon-color: {ICON_COLOR};
             --heart-color: {HEART_COLOR};
             --water-color: {ANCHOR_WATER_COLOR};
-            --anchor-hover-y: -6px; 
+            --anchor-hover-y: {_scaled(-6)}; 
         }}
+"""
 
+def _page_css(spin_css, effects):
+    # effects: active_effects 的结果，只输出这些特效（及其用到的粒子）的样式
+    return _css_vars(":root") + f"""
         body {{
             display: flex;
             justify-content: center;
@@ -90,7 +907,11 @@ def generate_html():
             overflow: hidden;
         }}
 
-        /* === Logo 容器 === */
+""" + _logo_css(spin_css, effects)
+
+def _logo_css(spin_css, effects):
+    # 只作用于 .haa-logo 内部，嵌入到别的页面时不影响宿主
+    return f"""        /* === Logo 容器 === */
         .haa-logo {{
             display: flex;
             gap: var(--gap);
@@ -141,9 +962,12 @@ def generate_html():
             position: relative;
         }}
 
-        svg {{
-            width: 70%; 
-            height: 70%;
+        /* sprite 容器：只提供 <symbol> 定义，不参与布局 */
+        .icon-sprite {{ position: absolute; width: 0; height: 0; overflow: hidden; }}
+
+        .haa-logo svg {{
+            width: {ICON_RENDER_RATIO * 100:g}%; 
+            height: {ICON_RENDER_RATIO * 100:g}%;
             fill: var(--icon-color);
             transition: fill 0.3s ease;
             transform-origin: center center;
@@ -152,280 +976,718 @@ def generate_html():
         }}
 
         /* === 模糊旋转 === */
-        .blur-spin {{
-            filter: blur(2px);
-            animation: infinite-spin 0.4s linear infinite;
+        {spin_css}
+
+        /* 减少动态效果：关掉所有动画和过渡，卷轴每轮直接跳到结果 */
+        @media (prefers-reduced-motion: reduce) {{
+            .haa-logo *, .haa-logo *::before, .haa-logo *::after {{ animation: none !important; transition: none !important; }}
         }}
 
-        @keyframes infinite-spin {{
-            0% {{ transform: translateY(0); }}
-            100% {{ transform: translateY(-33.33%); }}
+        /* 暂停时冻结 Logo 内所有 CSS 动画，包括 blur-spin、heartbeat 这类无限循环的 */
+        .haa-logo.haa-paused *, .haa-logo.haa-paused *::before, .haa-logo.haa-paused *::after {{ animation-play-state: paused !important; }}
+
+        {_particle_system_css(_effect_emitters(effects))}
+
+        /* === 特效定义 === */
+        {(chr(10) + chr(10) + "        ").join(EFFECTS[name]["css"] for name in effects)}
+
+"""
+
+def _page_script(effects_by_reel):
+    return f"""
+    <script>
+{_page_js(effects_by_reel)}    </script>
+</body>
+</html>
+    """
+
+def _page_js(effects_by_reel):
+    # 只依赖各卷轴用到的特效，不含图标数据（卷轴图标数从 DOM 读取），拆分输出时图标内容变化不会让脚本缓存失效
+    return _logo_runtime_js(effects_by_reel) + """
+        // 拆分输出：sprite 和旋转贴图在单独的图标包里，<head> 里的 preload 已经提前开始下载
+        async function loadIconPayload() {
+            const link = document.getElementById('haa-icons');
+            if (!link) return;
+            const payload = await (await fetch(link.href)).json();
+            document.body.insertAdjacentHTML('afterbegin', payload.sprite);
+            const style = document.createElement('style');
+            style.textContent = payload.css;
+            document.head.appendChild(style);
+        }
+
+        // 页面里的每个 .haa-logo 都是一个实例，共用下面同一个调度器
+        const iconsReady = loadIconPayload();
+        window.onload = () => iconsReady.then(() => {
+            document.querySelectorAll('.haa-logo').forEach(root => startLogo(createLogo(root)));
+        });
+"""
+
+def _logo_runtime_js(effects_by_reel, icons=None, window=0):
+    # 页面和 <haa-logo> 组件共用的运行时：每个 Logo 一个实例（卷轴、粒子池、本轮目标、暂停状态），
+    # 所有实例由同一个 rAF 调度器驱动
+    # icons / window: 组件模式下每个卷轴只渲染 window 个格子，停止时按 icons 表换成目标图标
+    cycle, timeline = compile_timeline(effects_by_reel)
+    emitters = _effect_emitters([name for name in EFFECTS if any(name in effects for effects in effects_by_reel)])
+    icon_table = {icon["name"]: [icon["view_box"], icon["overlay"]] for icon in icons or ()}
+    return f"""        // 一轮动画的全部事件由生成器编译好：[毫秒, 卷轴, 图标名, 动作, 参数]，按时间排序
+        const CYCLE = {cycle};
+        const TIMELINE = {json.dumps(timeline, separators=(',', ':'), ensure_ascii=False)};
+        
+        const REEL_COPIES = {_reel_copies()};
+        // 虚拟卷轴：每个图标只有一份节点，记住原始顺序以便每轮重排
+        const VIRTUAL_REELS = {json.dumps(_reel_copies() == 1)};
+        // 窗口卷轴（组件）：每个卷轴只有 STRIP_WINDOW 个格子，图标名 -> [viewBox, overlay]
+        const STRIP_WINDOW = {window};
+        const ICONS = {json.dumps(icon_table, separators=(',', ':'), ensure_ascii=False)};
+
+        // 预模糊贴图模式只切换卷轴的 spinning 类；否则退回实时 filter: blur
+        const SPIN_TEXTURE = {json.dumps(PREBLUR_SPIN)};
+        // 减少动态效果：不显示旋转、不发射粒子，每轮直接切换到新图标（动画 / 过渡由 CSS 关掉）
+        const reducedMotion = window.matchMedia ? window.matchMedia('(prefers-reduced-motion: reduce)') : {{ matches: false }};
+        function setSpinning(strip, on) {{
+            if (reducedMotion.matches) on = false;
+            if (SPIN_TEXTURE) strip.parentElement.classList.toggle('spinning', on);
+            else strip.classList.toggle('blur-spin', on);
         }}
 
-        /* === 粒子系统 === */
-        .particle-wrapper {{
-            position: absolute;
-            /* 强制层级最高，确保粒子在 Frame 和 Mask 之上 */
-            z-index: 100; 
-            opacity: 0;
-            pointer-events: none;
-            /* 开启 GPU 加速 */
-            transform: translateZ(1px); 
-            animation: fly-x 0.4s linear forwards;
+        function setBoxIcon(box, name) {{
+            if (box.getAttribute('data-name') === name) return;
+            const [viewBox, overlay] = ICONS[name];
+            box.setAttribute('data-name', name);
+            box.innerHTML = `<svg${{viewBox ? ` viewBox="${{viewBox}}"` : ''}}><use href="#icon-${{name}}"/>${{overlay}}</svg>`;
         }}
 
-        .particle-inner {{
-            width: 100%;
-            height: 100%;
-            animation: fly-y 0.4s cubic-bezier(0.25, 1, 0.5, 1) forwards;
+        // 发射器 -> [粒子类型, 轨迹库大小, 最少粒子数, 随机追加数]
+        const PARTICLE_BANKS = {_particle_table(emitters)};
+
+        // 每个卷轴一个粒子池：idle 是未挂载的节点，live 是正在播放的节点；节点用到时才创建，最多 PARTICLE_POOL_SIZE 个
+        // 播放结束 (animationend) 即回收，DOM 节点数和内存不随循环次数增长
+        const PARTICLE_POOL_SIZE = {PARTICLE_POOL_SIZE if emitters else 0};
+        function createParticle(pool) {{
+            const wrapper = document.createElement('div');
+            const inner = document.createElement('div');
+            inner.className = 'particle-inner';
+            wrapper.appendChild(inner);
+            wrapper.addEventListener('animationend', e => {{ if (e.target === wrapper) releaseParticle(pool, wrapper); }});
+            pool.size++;
+            return wrapper;
         }}
-        
-        .p-crumb .particle-inner {{
-            width: 0; height: 0; 
-            border-left: 2px solid transparent; 
-            border-right: 2px solid transparent; 
-            border-bottom: 4px solid var(--icon-color);
+
+        function releaseParticle(pool, wrapper) {{
+            if (!pool.live.delete(wrapper)) return;
+            wrapper.remove();
+            pool.idle.push(wrapper);
         }}
 
-        .p-water .particle-inner {{
-            background-color: var(--water-color); 
-            border-radius: 50%;
+        // 后台标签页里动画可能不结束，新一轮开始时把残留的全部收回
+        function releaseAllParticles(pool) {{
+            pool.live.forEach(wrapper => releaseParticle(pool, wrapper));
         }}
 
-        @keyframes fly-x {{
-            0% {{ transform: translateX(0); opacity: 1; }}
-            100% {{ transform: translateX(var(--tx)); opacity: 0; }}
+        function spawnParticles(container, emitter, pool) {{
+            const [type, size, min, extra] = PARTICLE_BANKS[emitter];
+            const count = min + Math.floor(Math.random() * extra);
+            // 库大小是质数，随机起点 + 随机步长可以取到互不重复的一组轨迹
+            const start = Math.floor(Math.random() * size);
+            const step = 1 + Math.floor(Math.random() * (size - 1));
+            for (let k = 0; k < count; k++) {{
+                const wrapper = pool.idle.pop() || (pool.size < PARTICLE_POOL_SIZE ? createParticle(pool) : null);
+                if (!wrapper) break;
+                wrapper.className = `particle-wrapper p-${{type}} pt-${{emitter}}-${{(start + k * step) % size}}`;
+                pool.live.add(wrapper);
+                // 重新挂载即从头播放 fly-x / fly-y
+                container.appendChild(wrapper);
+            }}
         }}
 
-        @keyframes fly-y {{
-            0% {{ transform: translateY(0) scale(1); }}
-            100% {{ transform: translateY(var(--ty)) scale(0.5); }}
+        // 一个 Logo 实例：卷轴及其图标都从 root 内部读取，不依赖页面上的其他元素
+        // names: 组件模式下每个卷轴的图标名列表（窗口卷轴）；页面模式下卷轴里已经有全部图标
+        function createLogo(root, names = null) {{
+            const strips = Array.from(root.querySelectorAll('.strip'));
+            const logo = {{
+                root, strips, names,
+                reelIcons: strips.map(strip => Array.from(strip.children)),
+                reelCounts: names ? names.map(list => list.length) : strips.map(strip => strip.children.length / REEL_COPIES),
+                particlePools: strips.map(() => ({{ idle: [], live: new Set(), size: 0 }})),
+                // 每个卷轴本轮停在的图标，以及特效实际作用过的状态：{{ el, name, classes, reelClasses, nodes }}
+                // 下一轮启动时只撤销这些，样式重算只涉及每个卷轴的一个图标，而不是全部图标
+                targets: [],
+                cycleStart: null, cursor: 0,
+                connected: false, running: false, onScreen: true, pausedAt: null, pausedAnimations: [],
+            }};
+            root.haaLogo = logo;
+            return logo;
         }}
 
-        /* === 特效定义 === */
-        
-        /* Anchor */
-        .anchor-hover-high svg {{ transform: translateY(var(--anchor-hover-y)) !important; }}
-        .anchor-drop svg {{ animation: high-drop 0.2s cubic-bezier(0.5, 0, 0.75, 0) forwards; }}
-        @keyframes high-drop {{ 0% {{ transform: translateY(var(--anchor-hover-y)); opacity: 1; }} 100% {{ transform: translateY(0); opacity: 1; }} }}
+        const ACTIONS = {{
+            spin(logo, i) {{
+                const strip = logo.strips[i];
+                const target = logo.targets[i];
+                if (target) {{
+                    target.el.classList.remove(...target.classes);
+                    strip.parentElement.classList.remove(...target.reelClasses);
+                    target.nodes.forEach(n => n.remove());
+                    logo.targets[i] = null;
+                }}
+                releaseAllParticles(logo.particlePools[i]);
+                strip.style.transition = 'none';
+                strip.style.transform = 'translateY(0)';
+                setSpinning(strip, true);
+            }},
+            stop(logo, i) {{
+                const strip = logo.strips[i];
+                const count = logo.reelCounts[i];
+                const targetIndex = Math.floor(Math.random() * count);
+                // 位移用卷轴自身高度的百分比，不需要测量图标高度，Logo 尺寸变化也不用重新计算
+                let targetEl, finalPos;
+                if (logo.names) {{
+                    // 此时卷轴仍被旋转贴图遮住：格子依次换成目标之前的图标和目标，从第一格滚到最后一格
+                    const boxes = strip.children;
+                    const n = boxes.length;
+                    for (let k = 0; k < n; k++) setBoxIcon(boxes[k], logo.names[i][(targetIndex + k - n + 1 + n * count) % count]);
+                    targetEl = boxes[n - 1];
+                    finalPos = -(n - 1) / n;
+                }} else if (VIRTUAL_REELS) {{
+                    // 此时卷轴仍被旋转贴图遮住：把目标之后的图标排到前面、目标排最后，
+                    // 停止时从第一个滚到最后一个，看起来就像从上一轮接着转过来
+                    const icons = logo.reelIcons[i];
+                    strip.append(...icons.slice(targetIndex + 1), ...icons.slice(0, targetIndex + 1));
+                    targetEl = icons[targetIndex];
+                    finalPos = -(count - 1) / count;
+                }} else {{
+                    targetEl = strip.children[targetIndex + count];
+                    finalPos = -(targetIndex + count) / (REEL_COPIES * count);
+                }}
+                logo.targets[i] = {{ el: targetEl, name: targetEl.getAttribute('data-name'), classes: new Set(), reelClasses: new Set(), nodes: [] }};
+                setSpinning(strip, false);
+                strip.style.transition = 'transform 0.6s cubic-bezier(0.15, 1, 0.3, 1)';
+                strip.style.transform = `translateY(${{finalPos * 100}}%)`;
+            }},
+            add(logo, i, target, cls) {{
+                target.el.classList.add(cls);
+                target.classes.add(cls);
+            }},
+            remove(logo, i, target, cls) {{
+                target.el.classList.remove(cls);
+                target.classes.delete(cls);
+            }},
+            reel(logo, i, target, cls) {{
+                logo.strips[i].parentElement.classList.add(cls);
+                target.reelClasses.add(cls);
+            }},
+            bite(logo, i, target, cls) {{
+                const bite = document.createElement('div');
+                bite.className = `bite-mark ${{cls}} bite-anim`;
+                target.el.appendChild(bite);
+                target.nodes.push(bite);
+            }},
+            particles(logo, i, target, emitter) {{
+                if (!reducedMotion.matches) spawnParticles(target.el, emitter, logo.particlePools[i]);
+            }},
+        }};
 
-        /* Hammer */
-        .hammer-action svg {{ transform-origin: 80% 80%; animation: hammer-smash 0.4s cubic-bezier(0.25, 1, 0.5, 1) forwards; }}
-        @keyframes hammer-smash {{ 0% {{ transform: rotate(0deg); }} 40% {{ transform: rotate(60deg); }} 100% {{ transform: rotate(0deg); }} }}
+        function runEvent(logo, [, i, icon, action, arg]) {{
+            const target = logo.targets[i];
+            // 特效事件只在该卷轴停在同名图标上时执行
+            if (icon && !(target && target.name === icon)) return;
+            ACTIONS[action](logo, i, target, arg);
+        }}
 
-        /* Heart */
-        .heartbeat svg {{ 
-            fill: var(--heart-color) !important; 
-            animation: heart-pulse 1.2s infinite ease-in-out;
+        // 推进一个实例的时间线：执行所有到期的事件，动作都对齐到帧
+        function advance(logo, now) {{
+            if (logo.cycleStart === null) logo.cycleStart = now;
+            while (true) {{
+                const elapsed = now - logo.cycleStart;
+                while (logo.cursor < TIMELINE.length && TIMELINE[logo.cursor][0] <= elapsed) runEvent(logo, TIMELINE[logo.cursor++]);
+                if (elapsed < CYCLE) break;
+                // 落后超过一整轮（例如标签页在后台时 rAF 暂停）就从现在重新开始，不补放错过的轮次
+                logo.cycleStart = elapsed >= 2 * CYCLE ? now : logo.cycleStart + CYCLE;
+                logo.cursor = 0;
+            }}
         }}
-        @keyframes heart-pulse {{
-             0% {{ transform: scale(1); }}
-             15% {{ transform: scale(1.25); }}
-             30% {{ transform: scale(1); }}
-             45% {{ transform: scale(1.15); }}
-             60% {{ transform: scale(1); }}
-             100% {{ transform: scale(1); }}
+
+        // 唯一的调度器：不管页面上有多少个 Logo，每帧只有一次回调；没有正在播放的实例时不注册 rAF
+        const logos = new Set(), playing = new Set();
+        let rafId = 0;
+        function tick(now) {{
+            playing.forEach(logo => advance(logo, now));
+            rafId = playing.size ? requestAnimationFrame(tick) : 0;
         }}
 
-        /* Apple */
-        .bite-mark {{ position: absolute; background-color: var(--bg-color); border-radius: 50%; width: 32%; height: 32%; opacity: 0; z-index: 10; }}
-        .bite-1 {{ top: 25%; right: 1%; }} 
-        .bite-2 {{ top: 50%; right: -3%; }}   
-        .bite-anim {{ animation: bite-snap 0.05s linear forwards; }}
-        @keyframes bite-snap {{ from {{ opacity: 0; transform: scale(0.8); }} to {{ opacity: 1; transform: scale(1); }} }}
+        // 暂停 / 恢复：标签页隐藏、Logo 不在视口内或已从文档移除时停止推进并冻结它正在播放的 CSS 动画和过渡；
+        // 恢复时该实例的时间线整体后移暂停的时长，从暂停处继续
+        function updatePaused(logo) {{
+            const shouldRun = logo.connected && !document.hidden && logo.onScreen;
+            if (shouldRun === logo.running) return;
+            logo.running = shouldRun;
+            logo.root.classList.toggle('haa-paused', !shouldRun);
+            if (!shouldRun) {{
+                playing.delete(logo);
+                if (!playing.size) {{
+                    cancelAnimationFrame(rafId);
+                    rafId = 0;
+                }}
+                logo.pausedAt = performance.now();
+                // 只冻结正在播放的：已经播完（forwards）的动画再 play() 会从头开始
+                logo.pausedAnimations = logo.root.getAnimations ? logo.root.getAnimations({{ subtree: true }}).filter(a => a.playState === 'running') : [];
+                logo.pausedAnimations.forEach(a => a.pause());
+                return;
+            }}
+            if (logo.pausedAt !== null && logo.cycleStart !== null) logo.cycleStart += performance.now() - logo.pausedAt;
+            logo.pausedAt = null;
+            logo.pausedAnimations.forEach(a => a.play());
+            logo.pausedAnimations = [];
+            playing.add(logo);
+            if (!rafId) rafId = requestAnimationFrame(tick);
+        }}
 
-        /* Alien */
-        .eye-cover {{ transform: scale(0); transform-origin: center; transition: transform 0.1s cubic-bezier(0, 0, 0.2, 1); }}
-        .alien-action .eye-cover {{ transform: scale(1) !important; }}
+        // 所有实例共用一个 IntersectionObserver 和一个 visibilitychange 监听
+        const observer = window.IntersectionObserver ? new IntersectionObserver(entries => entries.forEach(entry => {{
+            const logo = entry.target.haaLogo;
+            if (!logo) return;
+            logo.onScreen = entry.isIntersecting;
+            updatePaused(logo);
+        }})) : null;
+        document.addEventListener('visibilitychange', () => logos.forEach(updatePaused));
 
-        /* Human (Vitruvian) */
-        .v-shape {{
-            fill: none; stroke: var(--icon-color); stroke-width: 2px;
-            /* [修改] 粗细改为 2px */
-            stroke-width: 2px; 
-            stroke-dasharray: 400; stroke-dashoffset: 400; opacity: 1; vector-effect: non-scaling-stroke; stroke-linecap: round;
+        function startLogo(logo) {{
+            logos.add(logo);
+            logo.connected = true;
+            if (observer) observer.observe(logo.root);
+            updatePaused(logo);
+        }}
+
+        // 移出文档：停止推进并从头开始下一次播放，下一轮的 spin 会撤销上一轮留下的状态
+        function stopLogo(logo) {{
+            logo.connected = false;
+            updatePaused(logo);
+            if (observer) observer.unobserve(logo.root);
+            logos.delete(logo);
+            logo.cycleStart = null;
+            logo.cursor = 0;
+            logo.pausedAt = null;
+            logo.pausedAnimations = [];
         }}
-        .v-circle {{ transform-origin: center; transform: rotate(-135deg); }}
+"""
 
-        .draw-circle .v-circle {{ animation: draw-stroke 1.6s linear forwards; }}
-        .draw-square .v-rect {{ animation: draw-stroke 1.6s linear forwards; }}
-        @keyframes draw-stroke {{ to {{ stroke-dashoffset: 0; }} }}
+def compile_timeline(effects_by_reel=(tuple(EFFECTS),) * 3):
+    # effects_by_reel: reel_effects 的结果，每个卷轴一组特效名
+    # 返回 (一轮时长, 事件表)；事件 = [毫秒, 卷轴, 图标名, 动作, 参数]，图标名为空的是卷轴自身的启动 / 停止
+    reels = len(effects_by_reel)
+    stop_at = reels * START_DELAY + SPIN_DURATION_BASE
+    cycle = stop_at + reels * SPIN_DELAY + WAIT_TIME
+    events = []
+    for i, effects in enumerate(effects_by_reel):
+        events.append((i * START_DELAY, i, "", "spin", ""))
+        stop = stop_at + i * SPIN_DELAY
+        events.append((stop, i, "", "stop", ""))
+        for keyword in effects:
+            for at, action, arg in EFFECTS[keyword]["timeline"]:
+                t = cycle + at[1] if isinstance(at, tuple) else stop + at
+                if not stop <= t < cycle: raise ValueError(f"特效 {keyword} 的事件 {action} {arg} 落在第 {i} 个卷轴本轮之外: {t} ms")
+                events.append((t, i, keyword, action, arg))
+    # 稳定排序：同一时刻保持声明顺序（先停止再触发特效）
+    return cycle, [list(e) for e in sorted(events, key=lambda e: e[0])]
+
+def _reel_copies():
+    # 实时模糊模式的 infinite-spin 要平移整整一份图标，必须保留三份；虚拟卷轴只在贴图模式下可用
+    return 1 if VIRTUAL_REELS and PREBLUR_SPIN else 3
+
+def _reels(h_icons, a_icons):
+    return (("h", h_icons), ("a", a_icons), ("a", a_icons))
+
+def render_page(h_icons, a_icons, cache=None):
+    # 按块产出整页内容，任何时刻内存里只有当前这一块，不再拼出整页字符串
+    reels = _reels(h_icons, a_icons)
+    effects = active_effects(h_icons + a_icons)
+    yield _page_head(_spin_css(reels), effects)
+    if SPRITE_MODE: yield from _iter_sprite(h_icons + a_icons)
+    yield from _iter_logo(reels, cache)
+    yield _page_script(reel_effects(reels))
+
+def _iter_logo(reels, cache=None):
+    yield '\n    <div class="haa-logo">\n'
+    strips = {}
+    copies = _reel_copies()
+    for key, icons in reels:
+        texture = f'<div class="spin-texture spin-{key}"></div>' if PREBLUR_SPIN else ''
+        yield f'        <div class="reel">{texture}<div class="strip">'
+        if cache and cache.enabled:
+            # 第二、三个卷轴内容相同，片段只读取 / 生成一次
+            if id(icons) not in strips: strips[id(icons)] = _cached_strip(icons * copies, SPRITE_MODE, cache)
+            yield strips[id(icons)]
+        else:
+            yield from _iter_strip(icons * copies, SPRITE_MODE)
+        yield '</div></div>\n'
+    yield '    </div>\n'
+
+def write_html(chunks, target=OUTPUT_HTML):
+    # target 可以是路径或任意可写文本流
+    if hasattr(target, 'write'):
+        for chunk in chunks: target.write(chunk)
+        return
+    # 写路径时先写同目录临时文件再原子替换，开发服务器永远不会读到写了一半的页面
+    target = Path(target)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            for chunk in chunks: f.write(chunk)
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists(): tmp.unlink()
 
-    </style>
+def hot_swap_icons(previous, current):
+    # watch 模式：图标内容变化时替换 <symbol>，特效几何变化时替换每个实例里的 overlay；其余情况整页刷新
+    # 预模糊贴图是按图形生成的静态图片，图形一变就得整页刷新，否则旋转时仍是旧图标
+    if not SPRITE_MODE or not previous or not current: return None
+    if [i["name"] for i in previous] != [i["name"] for i in current]: return None
+    patches = []
+    for old, new in zip(previous, current):
+        if old["key"] == new["key"]: continue
+        patch = {"id": _symbol_id(new)}
+        if (old["body"], old["view_box"]) != (new["body"], new["view_box"]):
+            if PREBLUR_SPIN: return None
+            patch.update(viewBox=new["view_box"], body=new["body"])
+        if old["overlay"] != new["overlay"]: patch["overlay"] = new["overlay"]
+        patches.append(patch)
+    return patches
+
+def _symbol_id(icon):
+    return f'icon-{icon["name"]}'
+
+def _iter_sprite(icons):
+    # 不能用 display:none，否则部分浏览器不渲染 symbol 内引用的 clipPath
+    yield '<svg class="icon-sprite" xmlns="http://www.w3.org/2000/svg" width="0" height="0" aria-hidden="true"><defs>'
+    for icon in icons:
+        view_box = f' viewBox="{icon["view_box"]}"' if icon["view_box"] else ''
+        yield f'<symbol id="{_symbol_id(icon)}"{view_box}>{icon["body"]}</symbol>'
+    yield '</defs></svg>'
+
+def _build_sprite(icons):
+    return ''.join(_iter_sprite(icons))
+
+def _cached_strip(icons, sprite, cache):
+    key = _hash_key(str(sprite), str(CACHE_VERSION), *(icon["key"] for icon in icons))
+    html = cache.get("strips", key)
+    if html is None:
+        html = _build_strip(icons, sprite)
+        cache.put("strips", key, html)
+    return html
+
+def _iter_strip(icons, sprite=False):
+    for icon in icons:
+        if sprite:
+            # 实例只保留外层 svg + <use> + 特效 overlay，百分比坐标仍相对同一个 viewBox
+            view_box = f' viewBox="{icon["view_box"]}"' if icon["view_box"] else ''
+            svg = f'<svg{view_box}><use href="#{_symbol_id(icon)}"/>{icon["overlay"]}</svg>'
+        else:
+            svg = icon["content"]
+        yield f'<div class="icon-box" data-name="{icon["name"]}">{svg}</div>'
+
+def _build_strip(icons, sprite=False):
+    return ''.join(_iter_strip(icons, sprite))
+
+# ---------- 预压缩 ----------
+
+def _etag(data):
+    return '"' + hashlib.sha256(data).hexdigest()[:16] + '"'
+
+def precompress(path):
+    # 以最高压缩等级写出 .gz / .br 兄弟文件，返回 manifest 条目；gzip 固定 mtime=0 保证重复构建字节一致
+    path = Path(path)
+    data = path.read_bytes()
+    entry = {"bytes": len(data), "sha256": hashlib.sha256(data).hexdigest(), "etag": _etag(data), "encodings": {}}
+    encoders = {"gzip": (".gz", lambda d: gzip.compress(d, compresslevel=9, mtime=0))}
+    if brotli: encoders["br"] = (".br", lambda d: brotli.compress(d, quality=11))
+    for name, (suffix, compress) in encoders.items():
+        packed = compress(data)
+        target = path.with_name(path.name + suffix)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(packed)
+        os.replace(tmp, target)
+        entry["encodings"][name] = {"file": target.name, "bytes": len(packed), "etag": _etag(packed)}
+    return entry
+
+def update_asset_manifest(paths, manifest=ASSET_MANIFEST, immutable=()):
+    # 记录每个输出文件的哈希 / ETag / 各编码大小，供静态托管直接发送预压缩字节
+    # immutable: 文件名带内容哈希的输出，标记为可永久缓存
+    manifest = Path(manifest)
+    immutable = {Path(p).resolve() for p in immutable}
+    try: data = json.loads(manifest.read_text(encoding='utf-8'))
+    except (OSError, ValueError): data = {}
+    # 带哈希的旧版本已被 _write_hashed / build_icon_pack 删掉，对应条目不能继续声明可永久缓存
+    data = {rel: entry for rel, entry in data.items() if (manifest.parent / rel).exists()}
+    for path in paths:
+        entry = precompress(path)
+        if Path(path).resolve() in immutable: entry["cache_control"] = IMMUTABLE_CACHE_CONTROL
+        data[Path(path).resolve().relative_to(manifest.resolve().parent).as_posix()] = entry
+        sizes = ", ".join(f"{k} {v['bytes']} B" for k, v in entry["encodings"].items())
+        print(f"预压缩: {Path(path).name} {entry['bytes']} B -> {sizes}")
+    if not brotli: print("  (未安装 brotli，跳过 .br)")
+    write_html([json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True)], manifest)
+    return data
+
+def _check_repeat_distance(icons):
+    # 内联模式下同一图标在卷轴里每隔一轮重复一次；一轮超过 gzip 窗口时重复的路径数据压不掉
+    reel = sum(len(icon["content"].encode('utf-8')) for icon in icons)
+    if not SPRITE_MODE and PRECOMPRESS and reel > DEFLATE_WINDOW:
+        print(f"⚠️ 内联模式下单轮图标 {reel} B 超过 gzip 窗口 {DEFLATE_WINDOW} B，建议开启 SPRITE_MODE")
+
+# ---------- 拆分输出 ----------
+
+def _write_hashed(stem, suffix, text, directory):
+    # 文件名带内容哈希：内容不变文件名就不变，可以按 immutable 长期缓存；同名的旧版本（及其 .gz / .br）删掉
+    data = text.encode('utf-8')
+    target = Path(directory) / f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}{suffix}"
+    if not target.exists() or target.read_bytes() != data: write_html([text], target)
+    for old in Path(directory).glob(f"{stem}.*{suffix}*"):
+        if not old.name.startswith(target.name): old.unlink()
+    return target
+
+def write_split_assets(h_icons, a_icons, directory=SPLIT_ASSETS_DIR):
+    # 样式和脚本不含图标数据；图标变化只会换掉图标包（sprite + 旋转贴图规则）和很小的 HTML 外壳
+    reels = _reels(h_icons, a_icons)
+    effects = active_effects(h_icons + a_icons)
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    payload = {"sprite": _build_sprite(h_icons + a_icons) if SPRITE_MODE else "",
+               "css": "\n".join(_spin_texture_rules(reels))}
+    return {"css": _write_hashed("haa", ".css", _page_css(_spin_css(()), effects), directory),
+            "js": _write_hashed("haa", ".js", _page_js(reel_effects(reels)), directory),
+            "icons": _write_hashed("haa-icons", ".json", json.dumps(payload, ensure_ascii=False, separators=(',', ':')), directory)}
+
+def render_split_page(h_icons, a_icons, assets, base, cache=None):
+    # assets: write_split_assets 的结果；base: HTML 所在目录，引用写成相对路径
+    css, js, icons = (Path(os.path.relpath(assets[k], base)).as_posix() for k in ("css", "js", "icons"))
+    # 样式表在 <head> 里本来就会被预加载扫描到；脚本在 body 末尾、图标包由脚本请求，都要提前声明
+    yield f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <link rel="preload" href="{js}" as="script">
+    <link rel="preload" id="haa-icons" href="{icons}" as="fetch" type="application/json" crossorigin>
+    <link rel="stylesheet" href="{css}">
 </head>
 <body>
+"""
+    yield from _iter_logo(_reels(h_icons, a_icons), cache)
+    yield f"""    <script src="{js}" defer></script>
+</body>
+</html>
+"""
 
-    <div class="haa-logo">
-        <div class="reel"><div class="strip">{_build_strip(h_render_list)}</div></div>
-        <div class="reel"><div class="strip">{_build_strip(a_render_list)}</div></div>
-        <div class="reel"><div class="strip">{_build_strip(a_render_list)}</div></div>
-    </div>
+# ---------- 可嵌入组件 ----------
 
-    <script>
-        const WAIT_TIME = 3500;
-        const SPIN_DURATION_BASE = 1000; 
-        const SPIN_DELAY = 400; 
-        const START_DELAY = 150;
-        
-        const reelCounts = [{len(h_icons)}, {len(a_icons)}, {len(a_icons)}];
-        const strips = document.querySelectorAll('.strip');
-        const iconHeight = document.querySelector('.icon-box').offsetHeight;
+def render_component(h_icons, a_icons):
+    # 自包含的 <haa-logo> 脚本：样式和 sprite 在第一个实例连接时插入文档一次，
+    # 每个实例只有三个卷轴、每个卷轴 COMPONENT_WINDOW 个 <use> 格子，由共用的调度器驱动
+    reels = _reels(h_icons, a_icons)
+    effects = active_effects(h_icons + a_icons)
+    # :where() 优先级为 0，宿主页面写 haa-logo { --size: 40px } 即可覆盖；描边动画（pathLength）、
+    # 旋转贴图（background-size 100%）、粒子和锚的位移都相对 --size，换尺寸不用重新生成
+    css = _css_vars(":where(haa-logo)") + _logo_css(_spin_css(reels), effects)
+    names = [[key, [icon["name"] for icon in icons]] for key, icons in reels]
+    return f"""// <haa-logo> 自定义元素，由 main.py --component 生成，不要手工修改
+// 用法：<script src="haa-logo.js" defer></script> 之后在页面任意位置写 <haa-logo></haa-logo>
+(() => {{
+        const STYLE = {json.dumps(css, ensure_ascii=False)};
+        const SPRITE = {json.dumps(_build_sprite(h_icons + a_icons), ensure_ascii=False)};
+        const REELS = {json.dumps(names, separators=(',', ':'), ensure_ascii=False)};
 
-        async function sleep(ms) {{ return new Promise(r => setTimeout(r, ms)); }}
+{_logo_runtime_js(reel_effects(reels), h_icons + a_icons, COMPONENT_WINDOW)}
+        // 样式表和 sprite 整页只插入一次
+        let installed = false;
+        function installShared() {{
+            if (installed) return;
+            installed = true;
+            const style = document.createElement('style');
+            style.textContent = STYLE;
+            document.head.appendChild(style);
+            document.body.insertAdjacentHTML('afterbegin', SPRITE);
+        }}
 
-        function spawnParticles(container, startX, startY, type, dirY, spreadX = 15) {{
-            let count = (type === 'water') ? (20 + Math.floor(Math.random() * 10)) : (3 + Math.floor(Math.random() * 3));
-            for (let k = 0; k < count; k++) {{
-                const wrapper = document.createElement('div');
-                wrapper.className = `particle-wrapper p-${{type}}`;
-                
-                const inner = document.createElement('div');
-                inner.className = 'particle-inner';
-                wrapper.appendChild(inner);
-
-                const safeY = type === 'water' ? (60 + Math.random() * 30) : (startY + (Math.random()-0.5)*5);
-                wrapper.style.top = safeY + '%';
-                wrapper.style.left = (startX + (Math.random()-0.5)*10) + '%'; 
-                
-                let tx, ty;
-                if (type === 'water') {{
-                    const angle = (Math.random() - 0.5) * 2.5; 
-                    tx = angle * spreadX * 1.3; 
-                    ty = -(11 + Math.random() * 4); 
-                    const size = 2 + Math.random() * 5; 
-                    wrapper.style.width = size + 'px';
-                    wrapper.style.height = size + 'px';
-                }} else {{
-                    tx = (Math.random() - 0.5) * spreadX * 2;
-                    ty = (10 + Math.random() * 20) * dirY;
-                }}
-                
-                wrapper.style.setProperty('--tx', `${{tx}}px`);
-                wrapper.style.setProperty('--ty', `${{ty}}px`);
-                container.appendChild(wrapper);
+        // 初始显示每个卷轴的第一个图标，与整页版本一致
+        function buildReels(root) {{
+            root.classList.add('haa-logo');
+            root.innerHTML = REELS.map(([key]) => {{
+                const texture = SPIN_TEXTURE ? `<div class="spin-texture spin-${{key}}"></div>` : '';
+                return `<div class="reel">${{texture}}<div class="strip">${{'<div class="icon-box"></div>'.repeat(STRIP_WINDOW)}}</div></div>`;
+            }}).join('');
+            root.querySelectorAll('.strip').forEach((strip, i) => {{
+                Array.from(strip.children).forEach((box, k) => setBoxIcon(box, REELS[i][1][k % REELS[i][1].length]));
+            }});
+            return createLogo(root, REELS.map(([, list]) => list));
+        }}
+
+        class HaaLogoElement extends HTMLElement {{
+            connectedCallback() {{
+                installShared();
+                startLogo(this.haaLogo || buildReels(this));
+            }}
+            disconnectedCallback() {{
+                if (this.haaLogo) stopLogo(this.haaLogo);
             }}
         }}
 
-        async function runAnimationLoop() {{
-            while (true) {{
-                // 1. 依次启动
-                for (let i = 0; i < 3; i++) {{
-                    const strip = strips[i];
-                    strip.parentElement.classList.remove('pop-out');
-                    const icons = strip.querySelectorAll('.icon-box');
-                    icons.forEach(el => {{
-                        el.classList.remove('heartbeat', 'hammer-action', 'alien-action', 'anchor-drop', 'anchor-hover-high', 'active-overlay', 'draw-circle', 'draw-square');
-                        el.querySelectorAll('.bite-mark, .particle-wrapper').forEach(n => n.remove());
-                        el.style.opacity = ''; 
-                    }});
-
-                    strip.style.transition = 'none';
-                    strip.style.transform = 'translateY(0)';
-                    strip.classList.add('blur-spin');
-                    await sleep(START_DELAY);
-                }}
+        if (!customElements.get('haa-logo')) customElements.define('haa-logo', HaaLogoElement);
+}})();
+"""
 
-                await sleep(SPIN_DURATION_BASE);
-
-                // 2. 依次停止
-                for (let i = 0; i < 3; i++) {{
-                    const strip = strips[i];
-                    const count = reelCounts[i];
-                    const targetIndex = Math.floor(Math.random() * count); 
-                    const finalPos = -(targetIndex + count) * iconHeight;
-
-                    const targetEl = strip.children[targetIndex + count];
-                    const name = targetEl.getAttribute('data-name');
-                    const parentReel = strip.parentElement;
-
-                    strip.classList.remove('blur-spin');
-                    strip.style.transition = 'transform 0.6s cubic-bezier(0.15, 1, 0.3, 1)';
-                    strip.style.transform = `translateY(${{finalPos}}px)`;
-
-                    // === 溢出控制 ===
-                    if (['anchor', 'hammer', 'human', 'heart'].some(n => name.includes(n))) {{
-                        targetEl.classList.add('active-overlay'); 
-                        parentReel.classList.add('pop-out');      
-                    }}
-                    
-                    if (name.includes('anchor')) {{
-                        targetEl.classList.add('anchor-hover-high');
-                    }}
-
-                    // === 动画触发 ===
-                    if (name.includes('anchor')) {{
-                        setTimeout(() => {{
-                            targetEl.classList.remove('anchor-hover-high');
-                            targetEl.classList.add('anchor-drop');
-                            setTimeout(() => {{
-                                spawnParticles(targetEl, 50, 90, 'water', -1, 40); 
-                            }}, 200);
-                        }}, 600); 
-                    }}
-
-                    if (name.includes('heart')) setTimeout(() => targetEl.classList.add('heartbeat'), 600);
-
-                    if (name.includes('hammer')) {{
-                        setTimeout(() => {{
-                            targetEl.classList.add('hammer-action');
-                            // 锤子粒子范围 spreadX = 30
-                            setTimeout(() => spawnParticles(targetEl, 92, 45, 'crumb', 1, 30), 150);
-                        }}, 600);
-                    }}
-
-                    if (name.includes('apple')) {{
-                        setTimeout(() => {{
-                            const b1 = document.createElement('div');
-                            b1.className = 'bite-mark bite-1 bite-anim';
-                            targetEl.appendChild(b1);
-                            spawnParticles(targetEl, 75, 25, 'crumb', -1); 
-                            setTimeout(() => {{
-                                const b2 = document.createElement('div');
-                                b2.className = 'bite-mark bite-2 bite-anim';
-                                targetEl.appendChild(b2);
-                                spawnParticles(targetEl, 78, 50, 'crumb', 1);
-                            }}, 250); 
-                        }}, 600);
-                    }}
-                    
-                    if (name.includes('alien')) {{
-                        const totalTimeLeft = ((3 - i) * SPIN_DELAY) + WAIT_TIME;
-                        const triggerTime = totalTimeLeft - 100;
-                        setTimeout(() => targetEl.classList.add('alien-action'), triggerTime);
-                    }}
-
-                    if (name.includes('human')) {{
-                        setTimeout(() => {{
-                            targetEl.classList.add('draw-square');
-                            setTimeout(() => {{
-                                targetEl.classList.add('draw-circle');
-                            }}, 1600);
-                        }}, 600);
-                    }}
-
-                    await sleep(SPIN_DELAY);
-                }}
+def build_component(use_cache=True, output=COMPONENT_JS):
+    cache = BuildCache(CACHE_DIR, enabled=use_cache)
+    h_icons, a_icons = load_icons(H_REEL_DIR, cache=cache), load_icons(A_REEL_DIR, cache=cache)
+    if not h_icons or not a_icons:
+        print("错误：未找到图标")
+        return None
+    write_html([render_component(h_icons, a_icons)], output)
+    cache.report()
+    print(f"组件已生成: {output}")
+    if PRECOMPRESS: update_asset_manifest([output])
+    return output
 
-                await sleep(WAIT_TIME);
-            }}
-        }}
+# ---------- index.html 图标包 ----------
 
-        window.onload = runAnimationLoop;
-    </script>
-</body>
-</html>
-    """
-    
-    with open(OUTPUT_HTML, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    print(f"最终优化版 v19 生成: {OUTPUT_HTML}")
-    webbrowser.open(f'file://{OUTPUT_HTML.resolve()}')
+def build_icon_pack(use_cache=True, pack_dir=ICON_PACK_DIR, index_html=INDEX_HTML):
+    # 把处理好的图标（特效已注入）打成一个带内容哈希的 JSON，index.html 一次请求即可拿到全部图标
+    cache = BuildCache(CACHE_DIR, enabled=use_cache)
+    reels = {"h_reel": load_icons(H_REEL_DIR, cache=cache), "a_reel": load_icons(A_REEL_DIR, cache=cache)}
+    if not all(reels.values()):
+        print("错误：未找到图标")
+        return None
 
-def _build_strip(icons):
-    html = ""
-    for icon in icons:
-        html += f'<div class="icon-box" data-name="{icon["name"]}">{icon["content"]}</div>'
-    return html
+    pack = {"version": 1,
+            "reels": {reel: [icon["name"] for icon in icons] for reel, icons in reels.items()},
+            "icons": {icon["name"]: icon["content"] for icons in reels.values() for icon in icons}}
+    data = json.dumps(pack, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    digest = hashlib.sha256(data.encode('utf-8')).hexdigest()[:10]
+
+    pack_dir = Path(pack_dir)
+    pack_file = pack_dir / f"icons.{digest}.json"
+    write_html([data], pack_file)
+    # 旧版本的包（及其 .gz / .br）不再被引用，直接清掉
+    for old in pack_dir.glob("icons.*.json*"):
+        if not old.name.startswith(pack_file.name): old.unlink()
+
+    url = "./" + pack_file.resolve().relative_to(Path(index_html).resolve().parent).as_posix()
+    html = Path(index_html).read_text(encoding='utf-8')
+    updated = re.sub(r"const ICON_PACK_URL = '[^']*';", f"const ICON_PACK_URL = '{url}';", html)
+    if updated != html: write_html([updated], index_html)
+    cache.report()
+    print(f"图标包已生成: {pack_file} ({len(data.encode('utf-8'))} B, {len(pack['icons'])} 个图标)")
+    if PRECOMPRESS: update_asset_manifest([pack_file, index_html])
+    return pack_file
+
+# ---------- 多版本批量构建 ----------
+
+_DEFAULT_CONFIG = {key: globals()[key] for key in VARIANT_KEYS}
+_WORKER_ICON_SETS = {}
+
+def load_variants(path):
+    # 支持 TOML / JSON：[defaults] 为公共覆盖项，[[variant]] 每项一个版本，必须有 name
+    path = Path(path)
+    if path.suffix == ".toml":
+        with open(path, 'rb') as f: data = tomllib.load(f)
+    else:
+        with open(path, 'r', encoding='utf-8') as f: data = json.load(f)
+    defaults = data.get("defaults", {})
+    variants = []
+    for entry in data.get("variant", data.get("variants", [])):
+        entry = {**defaults, **entry}
+        if "name" not in entry: raise ValueError(f"变体缺少 name: {entry}")
+        # name 直接进输出文件名：只允许字母数字、下划线、点和连字符，不能带路径分隔符
+        if not re.fullmatch(r'[\w.-]+', str(entry["name"])): raise ValueError(f"变体 name 不合法: {entry['name']!r}")
+        config = {}
+        for key, value in entry.items():
+            if key == "name": continue
+            if key.upper() not in VARIANT_KEYS: raise ValueError(f"未知配置项 {key} (变体 {entry['name']})")
+            if key.upper().endswith("_DIR"): value = (path.parent / value).resolve()
+            config[key.upper()] = value
+        variants.append({"name": str(entry["name"]), "config": config})
+    names = [v["name"] for v in variants]
+    if len(set(names)) != len(names): raise ValueError("变体 name 重复")
+    return variants
+
+def _variant_config(variant):
+    return {**_DEFAULT_CONFIG, **variant["config"]}
+
+def _icon_set_key(config):
+    return (str(config["H_REEL_DIR"]), str(config["A_REEL_DIR"]), config["OPTIMIZE_SVG"], config["SVG_PRECISION"],
+            config["LOGO_SIZE"])
+
+def _init_worker(icon_sets):
+    _WORKER_ICON_SETS.update(icon_sets)
+
+def _build_variant(variant, output_dir):
+    # 配置是模块全局变量：每个版本先整体恢复默认值再覆盖，避免同一进程里的上一个版本残留
+    config = _variant_config(variant)
+    globals().update(config)
+    h_icons, a_icons = _WORKER_ICON_SETS[_icon_set_key(config)]
+    output = Path(output_dir) / f"haa_logo_{variant['name']}.html"
+    write_html(render_page(h_icons, a_icons), output)
+    entry = precompress(output) if PRECOMPRESS else {"bytes": output.stat().st_size}
+    return {"name": variant["name"], "file": output.name, **entry,
+            "config": {k: str(v) if isinstance(v, Path) else v for k, v in variant["config"].items()}}
+
+def build_variants(variants_file, output_dir=VARIANTS_OUTPUT_DIR, jobs=None, use_cache=True):
+    started = time.perf_counter()
+    variants = load_variants(variants_file)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # 图标只在主进程解析一次（按图标目录 + 优化参数分组），再整体交给各个 worker
+    cache = BuildCache(CACHE_DIR, enabled=use_cache)
+    icon_sets = {}
+    for variant in variants:
+        config = _variant_config(variant)
+        key = _icon_set_key(config)
+        if key in icon_sets: continue
+        # 简化容差跟着该版本的 LOGO_SIZE 走
+        icon_sets[key] = tuple(load_icons(Path(config[d]), optimize=config["OPTIMIZE_SVG"],
+                                          precision=config["SVG_PRECISION"], cache=cache,
+                                          render_px=_px(config["LOGO_SIZE"]) * ICON_RENDER_RATIO)
+                               for d in ("H_REEL_DIR", "A_REEL_DIR"))
+        if not all(icon_sets[key]):
+            print(f"错误：未找到图标 {key[0]} / {key[1]}")
+            return None
+
+    if jobs == 1:
+        _init_worker(icon_sets)
+        results = [_build_variant(v, output_dir) for v in variants]
+        globals().update(_DEFAULT_CONFIG)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(icon_sets,)) as pool:
+            chunk = max(1, len(variants) // (4 * (jobs or os.cpu_count() or 1)))
+            results = list(pool.map(_build_variant, variants, [output_dir] * len(variants), chunksize=chunk))
+
+    manifest = {"generated": time.strftime("%Y-%m-%dT%H:%M:%S"), "variants": results}
+    write_html([json.dumps(manifest, ensure_ascii=False, indent=2)], output_dir / "manifest.json")
+    cache.report()
+    print(f"已生成 {len(results)} 个版本 -> {output_dir}  ({time.perf_counter() - started:.2f} s)")
+    return manifest
 
 if __name__ == "__main__":
-    generate_html()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="生成 HAA 老虎机 Logo 页面")
+    parser.add_argument("--no-cache", action="store_true", help="不读取也不写入构建缓存")
+    parser.add_argument("--watch", action="store_true", help="启动本地开发服务器，图标或配置变化时自动重新生成并刷新页面")
+    parser.add_argument("--port", type=int, default=None, help="开发服务器端口")
+    parser.add_argument("--variants", metavar="FILE", help="按 TOML/JSON 变体文件批量生成多个版本")
+    parser.add_argument("--out", default=VARIANTS_OUTPUT_DIR, help="批量生成的输出目录")
+    parser.add_argument("--jobs", type=int, default=None, help="批量生成的进程数，默认等于 CPU 核数")
+    parser.add_argument("--headless", action="store_true", help="只生成文件，不打开浏览器")
+    parser.add_argument("--pack", action="store_true", help="为 index.html 生成单文件图标包并更新其引用")
+    parser.add_argument("--split", action="store_true", default=SPLIT_OUTPUT,
+                        help="样式 / 脚本 / 图标包输出为带内容哈希的独立文件 (SPLIT_ASSETS_DIR)")
+    parser.add_argument("--component", action="store_true", help="生成可嵌入的 <haa-logo> 自定义元素脚本 (COMPONENT_JS)")
+    args = parser.parse_args()
+    if args.pack:
+        build_icon_pack(use_cache=not args.no_cache)
+    elif args.component:
+        build_component(use_cache=not args.no_cache)
+    elif args.variants:
+        build_variants(args.variants, args.out, jobs=args.jobs, use_cache=not args.no_cache)
+    elif args.watch:
+        import dev_server
+        dev_server.run("main", "generate_html", OUTPUT_HTML, [ASSETS_DIR], hot_swap="hot_swap_icons",
+                       build_kwargs={"use_cache": not args.no_cache, "split": args.split}, port=args.port or dev_server.DEV_PORT)
+    else:
+        generate_html(use_cache=not args.no_cache, open_browser=not args.headless, split=args.split)
\ No newline at end of file
@@ -0,0 +1,376 @@
+import math
+import os
+import random
+import re
+import xml.parsers.expat
+from html import escape
+from pathlib import Path
+
+# ================= 配置 =================
+CURVE_SAMPLES = 8              # 计算包围盒时每段曲线的采样点数
+# 这些容器里的图形不直接绘制，不计入包围盒
+HIDDEN_CONTAINERS = {"defs", "clipPath", "mask", "symbol", "metadata"}
+
+# ================= 路径数据 =================
+
+_PATH_ARGS = {'m': 2, 'l': 2, 'h': 1, 'v': 1, 'c': 6, 's': 4, 'q': 4, 't': 2, 'a': 7, 'z': 0}
+_NUMBER_RE = re.compile(r'[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?')
+
+def _tokenize_path(d):
+    # 返回 [(命令字母, [参数...])]；弧线的两个 flag 可能被压成 "011"，需要逐字符读取
+    segments, pos, cmd = [], 0, None
+    while pos < len(d):
+        ch = d[pos]
+        if ch.isspace() or ch == ',':
+            pos += 1
+            continue
+        if ch.isalpha():
+            cmd = ch
+            pos += 1
+            if cmd in 'zZ': segments.append((cmd, []))
+            continue
+        if cmd is None or cmd in 'zZ': raise ValueError(f"无法解析的路径数据: {d[:30]}")
+        args = []
+        while len(args) < _PATH_ARGS[cmd.lower()]:
+            while pos < len(d) and (d[pos].isspace() or d[pos] == ','): pos += 1
+            if cmd in 'aA' and len(args) in (3, 4) and pos < len(d) and d[pos] in '01':
+                args.append(float(d[pos]))
+                pos += 1
+                continue
+            match = _NUMBER_RE.match(d, pos)
+            if not match: raise ValueError(f"无法解析的路径数据: {d[pos:pos + 30]}")
+            args.append(float(match.group()))
+            pos = match.end()
+        segments.append((cmd, args))
+        # M 后面跟的多余坐标按 L 处理
+        if cmd == 'M': cmd = 'L'
+        elif cmd == 'm': cmd = 'l'
+    return segments
+
+def _absolute_path(segments):
+    # 统一转成绝对坐标，H/V 也展开为带完整起点信息的形式
+    result, x, y, sx, sy = [], 0.0, 0.0, 0.0, 0.0
+    for cmd, args in segments:
+        rel = cmd.islower()
+        c = cmd.upper()
+        if c == 'Z':
+            result.append(('Z', []))
+            x, y = sx, sy
+            continue
+        if c == 'H':
+            args = [args[0] + (x if rel else 0)]
+            x = args[0]
+        elif c == 'V':
+            args = [args[0] + (y if rel else 0)]
+            y = args[0]
+        elif c == 'A':
+            args = args[:5] + [args[5] + (x if rel else 0), args[6] + (y if rel else 0)]
+            x, y = args[5], args[6]
+        else:
+            args = [v + ((x if i % 2 == 0 else y) if rel else 0) for i, v in enumerate(args)]
+            x, y = args[-2], args[-1]
+        if c == 'M': sx, sy = x, y
+        result.append((c, args))
+    return result
+
+# ================= 几何 =================
+
+def _parse_transform(text):
+    # 返回 2x3 仿射矩阵 (a, b, c, d, e, f)
+    matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+    for op, args in re.findall(r'(\w+)\s*\(([^)]*)\)', text or ""):
+        v = [float(x) for x in _NUMBER_RE.findall(args)]
+        if op == "matrix" and len(v) == 6: m = tuple(v)
+        elif op == "translate" and v: m = (1, 0, 0, 1, v[0], v[1] if len(v) > 1 else 0)
+        elif op == "scale" and v: m = (v[0], 0, 0, v[1] if len(v) > 1 else v[0], 0, 0)
+        elif op == "rotate" and v:
+            r = math.radians(v[0])
+            cx, cy = (v[1], v[2]) if len(v) == 3 else (0, 0)
+            cos, sin = math.cos(r), math.sin(r)
+            m = (cos, sin, -sin, cos, cx - cos * cx + sin * cy, cy - sin * cx - cos * cy)
+        else: continue
+        matrix = _compose(matrix, m)
+    return matrix
+
+def _compose(p, m):
+    a, b, c, d, e, f = p
+    return (a * m[0] + c * m[1], b * m[0] + d * m[1], a * m[2] + c * m[3], b * m[2] + d * m[3],
+            a * m[4] + c * m[5] + e, b * m[4] + d * m[5] + f)
+
+def _canonical_segments(segments):
+    # 只保留 M/L/C/A/Z：H/V 转成 L，S/Q/T 转成等价的三次贝塞尔
+    result, x, y, last_c2, last_q = [], 0.0, 0.0, None, None
+    for c, args in segments:
+        c2 = q = None
+        if c == 'H': c, args = 'L', [args[0], y]
+        elif c == 'V': c, args = 'L', [x, args[0]]
+        elif c == 'S':
+            rx, ry = (2 * x - last_c2[0], 2 * y - last_c2[1]) if last_c2 else (x, y)
+            c, args = 'C', [rx, ry] + args
+        elif c in 'QT':
+            qx, qy = ((args[0], args[1]) if c == 'Q' else
+                      (2 * x - last_q[0], 2 * y - last_q[1]) if last_q else (x, y))
+            ex, ey = args[-2], args[-1]
+            q = (qx, qy)
+            c, args = 'C', [x + 2 / 3 * (qx - x), y + 2 / 3 * (qy - y), ex + 2 / 3 * (qx - ex), ey + 2 / 3 * (qy - ey), ex, ey]
+        if c == 'C': c2 = (args[2], args[3])
+        result.append((c, args))
+        if c == 'Z' and result:
+            for prev_c, prev_args in reversed(result):
+                if prev_c == 'M':
+                    x, y = prev_args[0], prev_args[1]
+                    break
+        elif args: x, y = args[-2], args[-1]
+        last_c2, last_q = c2, q
+    return result
+
+def _cubic_point(p, t):
+    mt = 1 - t
+    a, b, c, d = mt * mt * mt, 3 * mt * mt * t, 3 * mt * t * t, t * t * t
+    return (a * p[0][0] + b * p[1][0] + c * p[2][0] + d * p[3][0],
+            a * p[0][1] + b * p[1][1] + c * p[2][1] + d * p[3][1])
+
+def _arc_points(x1, y1, args, steps):
+    # 弧线按中心参数化（SVG 规范 F.6.5）采样，每 90° 取 steps 个点，不含起点和终点
+    rx, ry, phi, large, sweep, x2, y2 = args
+    rx, ry = abs(rx), abs(ry)
+    if not rx or not ry or (x1, y1) == (x2, y2): return []
+    cos, sin = math.cos(math.radians(phi)), math.sin(math.radians(phi))
+    dx, dy = (x1 - x2) / 2, (y1 - y2) / 2
+    x1p, y1p = cos * dx + sin * dy, -sin * dx + cos * dy
+    # 半径不够连接两个端点时等比放大
+    scale = x1p ** 2 / rx ** 2 + y1p ** 2 / ry ** 2
+    if scale > 1: rx, ry = rx * math.sqrt(scale), ry * math.sqrt(scale)
+    num = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    den = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    coef = math.sqrt(max(0.0, num / den)) * (-1 if bool(large) == bool(sweep) else 1)
+    cxp, cyp = coef * rx * y1p / ry, -coef * ry * x1p / rx
+    cx, cy = cos * cxp - sin * cyp + (x1 + x2) / 2, sin * cxp + cos * cyp + (y1 + y2) / 2
+    theta = math.atan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+    delta = math.atan2((-y1p - cyp) / ry, (-x1p - cxp) / rx) - theta
+    if sweep and delta < 0: delta += 2 * math.pi
+    elif not sweep and delta > 0: delta -= 2 * math.pi
+    n = max(steps, math.ceil(abs(delta) / (math.pi / 2) * steps))
+    points = []
+    for k in range(1, n):
+        t = theta + delta * k / n
+        ex, ey = rx * math.cos(t), ry * math.sin(t)
+        points.append((cx + cos * ex - sin * ey, cy + sin * ex + cos * ey))
+    return points
+
+def _sample_points(segments):
+    # 端点 + 曲线采样点；先统一成 M/L/C/A/Z（S 反射控制点、Q/T 升阶），弧线按中心参数化采样
+    points, x, y, sx, sy = [], 0.0, 0.0, 0.0, 0.0
+    for cmd, args in _canonical_segments(segments):
+        if cmd == 'Z':
+            x, y = sx, sy
+            continue
+        if cmd == 'C':
+            curve = ((x, y), (args[0], args[1]), (args[2], args[3]), (args[4], args[5]))
+            points += [_cubic_point(curve, k / CURVE_SAMPLES) for k in range(1, CURVE_SAMPLES)]
+        elif cmd == 'A': points += _arc_points(x, y, args, CURVE_SAMPLES)
+        x, y = args[-2], args[-1]
+        if cmd == 'M': sx, sy = x, y
+        points.append((x, y))
+    return points
+
+def _number(attrs, name):
+    try: return float(attrs.get(name, 0))
+    except ValueError: return 0.0
+
+def _element_points(tag, attrs):
+    # 百分比等无法直接换算的长度按 0 处理
+    if tag == "path":
+        try: return _sample_points(_absolute_path(_tokenize_path(attrs.get("d", ""))))
+        except ValueError: return []
+    if tag in ("circle", "ellipse"):
+        cx, cy = _number(attrs, "cx"), _number(attrs, "cy")
+        rx = _number(attrs, "r" if tag == "circle" else "rx")
+        ry = _number(attrs, "r" if tag == "circle" else "ry")
+        return [(cx - rx, cy - ry), (cx + rx, cy + ry), (cx - rx, cy + ry), (cx + rx, cy - ry)]
+    if tag == "rect":
+        x, y, w, h = (_number(attrs, k) for k in ("x", "y", "width", "height"))
+        return [(x, y), (x + w, y), (x, y + h), (x + w, y + h)]
+    if tag == "line":
+        return [(_number(attrs, "x1"), _number(attrs, "y1")), (_number(attrs, "x2"), _number(attrs, "y2"))]
+    if tag in ("polygon", "polyline"):
+        v = [float(x) for x in _NUMBER_RE.findall(attrs.get("points", ""))]
+        return list(zip(v[0::2], v[1::2]))
+    return []
+
+def count_nodes(paths):
+    # 路径里的绘制命令数（不含 Z），即每帧要栅格化的节点数
+    count = 0
+    for d in paths:
+        try: count += sum(1 for c, _ in _tokenize_path(d) if c not in 'zZ')
+        except ValueError: pass
+    return count
+
+def enclosing_circle(points):
+    # 最小包围圆（Welzl 随机增量法，期望线性时间），返回 (cx, cy, r)
+    points = list(points)
+    random.Random(0).shuffle(points)
+
+    def inside(c, p): return math.hypot(p[0] - c[0], p[1] - c[1]) <= c[2] + 1e-9
+
+    def two(a, b): return ((a[0] + b[0]) / 2, (a[1] + b[1]) / 2, math.hypot(a[0] - b[0], a[1] - b[1]) / 2)
+
+    def three(a, b, c):
+        d = 2 * (a[0] * (b[1] - c[1]) + b[0] * (c[1] - a[1]) + c[0] * (a[1] - b[1]))
+        # 三点共线：取最远两点为直径
+        if abs(d) < 1e-12: return max((two(a, b), two(a, c), two(b, c)), key=lambda t: t[2])
+        sa, sb, sc = a[0] ** 2 + a[1] ** 2, b[0] ** 2 + b[1] ** 2, c[0] ** 2 + c[1] ** 2
+        ux = (sa * (b[1] - c[1]) + sb * (c[1] - a[1]) + sc * (a[1] - b[1])) / d
+        uy = (sa * (c[0] - b[0]) + sb * (a[0] - c[0]) + sc * (b[0] - a[0])) / d
+        return (ux, uy, math.hypot(a[0] - ux, a[1] - uy))
+
+    circle = None
+    for i, p in enumerate(points):
+        if circle is not None and inside(circle, p): continue
+        circle = (p[0], p[1], 0.0)
+        for j in range(i):
+            q = points[j]
+            if inside(circle, q): continue
+            circle = two(p, q)
+            for k in range(j):
+                if not inside(circle, points[k]): circle = three(p, q, points[k])
+    return circle
+
+class Subpath:
+    # 一条子路径（M 到下一个 M）的采样点、包围盒、面积与形心，坐标已换算到根 viewBox
+    __slots__ = ("points", "bbox", "area", "centroid")
+
+    def __init__(self, points):
+        self.points = points
+        xs, ys = [p[0] for p in points], [p[1] for p in points]
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+        # 鞋带公式：采样多边形的面积与形心；退化（面积为 0）时形心取包围盒中心
+        a = cx = cy = 0.0
+        for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]):
+            cross = x0 * y1 - x1 * y0
+            a += cross
+            cx += (x0 + x1) * cross
+            cy += (y0 + y1) * cross
+        self.area = abs(a) / 2
+        self.centroid = ((cx / (3 * a), cy / (3 * a)) if abs(a) > 1e-12 else
+                         ((self.bbox[0] + self.bbox[2]) / 2, (self.bbox[1] + self.bbox[3]) / 2))
+
+# ================= 图标 IR =================
+
+class SvgIcon:
+    # 解析一次、各阶段共用：根属性、viewBox、原样的内部内容、路径数据与包围盒
+    __slots__ = ("name", "source", "attrs", "view_box", "body", "paths", "matrices", "bbox", "_subpaths")
+
+    def __init__(self, name, source, attrs, body, paths, bbox, matrices=None):
+        self.name, self.source, self.attrs, self.body, self.paths, self.bbox = name, source, attrs, body, paths, bbox
+        # 每条路径所在坐标系到根 viewBox 的仿射矩阵
+        self.matrices = matrices or ((1.0, 0.0, 0.0, 1.0, 0.0, 0.0),) * len(paths)
+        self.view_box = attrs.get("viewBox")
+        self._subpaths = None
+
+    @property
+    def box(self):
+        # viewBox 的四个数；没有 viewBox 时退回 width/height
+        if self.view_box:
+            return tuple(float(v) for v in self.view_box.replace(',', ' ').split())
+        return (0.0, 0.0, _number(self.attrs, "width"), _number(self.attrs, "height"))
+
+    @property
+    def nodes(self):
+        return count_nodes(self.paths)
+
+    def subpaths(self):
+        # 按需计算一次：叠加层几何（眼罩、维特鲁威圆/方框）都从这里取
+        if self._subpaths is None:
+            self._subpaths = []
+            for d, (a, b, c, dd, e, f) in zip(self.paths, self.matrices):
+                try: segments = _absolute_path(_tokenize_path(d))
+                except ValueError: continue
+                starts = [i for i, (cmd, _) in enumerate(segments) if cmd == 'M'] + [len(segments)]
+                for start, end in zip(starts, starts[1:]):
+                    points = _sample_points([seg for seg in segments[start:end] if seg[0] != 'Z'])
+                    if len(points) < 2: continue
+                    self._subpaths.append(Subpath([(a * x + c * y + e, b * x + dd * y + f) for x, y in points]))
+        return self._subpaths
+
+    def render(self, elements=(), **attrs):
+        # 结构化注入：在原内容之后追加元素，attrs 覆盖根属性（值为 None 表示删除）
+        root = {k: v for k, v in {**self.attrs, **attrs}.items() if v is not None}
+        return f'<svg{_render_attrs(root)}>{self.body}{render_elements(elements)}</svg>'
+
+def _render_attrs(attrs):
+    return ''.join(f' {k}="{escape(str(v))}"' for k, v in attrs.items())
+
+def render_elements(elements):
+    # elements: [(标签, {属性})]，注入用的都是无子元素的图形
+    return ''.join(f'<{tag}{_render_attrs(attrs)}/>' for tag, attrs in elements)
+
+def parse_svg(source, name=""):
+    # expat 流式解析：记录根元素内部内容在源文本里的范围，同时累计 transform 算包围盒
+    data = source.encode('utf-8')
+    parser = xml.parsers.expat.ParserCreate()
+    state = {"depth": 0, "root": None, "start": None, "end": None, "hidden": 0}
+    stack, paths, matrices = [], [], []
+    box = [math.inf, math.inf, -math.inf, -math.inf]
+
+    def mark():
+        if state["depth"] == 1 and state["start"] is None: state["start"] = parser.CurrentByteIndex
+
+    def start(tag, attrs):
+        mark()
+        state["depth"] += 1
+        if state["root"] is None:
+            state["root"] = attrs
+            stack.append((1.0, 0.0, 0.0, 1.0, 0.0, 0.0))
+            return
+        local = tag.split(':')[-1]
+        matrix = _compose(stack[-1], _parse_transform(attrs.get("transform")))
+        stack.append(matrix)
+        if local in HIDDEN_CONTAINERS: state["hidden"] += 1
+        if local == "path" and "d" in attrs:
+            paths.append(attrs["d"])
+            matrices.append(matrix)
+        if state["hidden"]: return
+        a, b, c, d, e, f = matrix
+        for x, y in _element_points(local, attrs):
+            px, py = a * x + c * y + e, b * x + d * y + f
+            box[0], box[1] = min(box[0], px), min(box[1], py)
+            box[2], box[3] = max(box[2], px), max(box[3], py)
+
+    def end(tag):
+        state["depth"] -= 1
+        stack.pop()
+        if state["depth"] == 0: state["end"] = parser.CurrentByteIndex
+        elif tag.split(':')[-1] in HIDDEN_CONTAINERS: state["hidden"] -= 1
+
+    parser.StartElementHandler, parser.EndElementHandler = start, end
+    parser.CharacterDataHandler = lambda text: mark()
+    parser.CommentHandler = lambda text: mark()
+    parser.Parse(data, True)
+    if state["root"] is None: raise ValueError("没有 <svg> 根元素")
+
+    # 自闭合的 <svg/> 没有内部内容
+    body_start = state["start"] if state["start"] is not None else state["end"]
+    body = data[body_start:state["end"]].decode('utf-8').strip() if state["end"] is not None else ""
+    bbox = tuple(box) if box[0] != math.inf else None
+    return SvgIcon(name, source, state["root"], body, tuple(paths), bbox, tuple(matrices))
+
+# ================= 加载 =================
+
+_MEMO = {}
+
+def load(path):
+    # 按 路径 + mtime + 大小 记忆：同一进程里反复构建时未改动的文件不再读取和解析
+    path = Path(path)
+    try: stat = path.stat()
+    except OSError: return None
+    key = os.path.abspath(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _MEMO.get(key)
+    if cached and cached[0] == stamp: return cached[1]
+    try:
+        icon = parse_svg(path.read_text(encoding='utf-8-sig'), path.stem)
+    except (OSError, ValueError, xml.parsers.expat.ExpatError):
+        return None
+    _MEMO[key] = (stamp, icon)
+    return icon
@@ -1,38 +1,41 @@
+import argparse
 import os
 import webbrowser
 from pathlib import Path
 
+import main
+import svg_loader
+
 # ================= 配置 =================
 BASE_DIR = Path(__file__).parent
 ASSETS_DIR = BASE_DIR / "assets" / "icons"
 # 注意：这里假设你的图标在 a_reel 文件夹里，如果找不到请检查路径
 ALIEN_PATH = ASSETS_DIR / "a_reel" / "alien.svg" 
 OUTPUT_HTML = BASE_DIR / "alien_eye_tuner_mirror.html"
+TUNER_PORT = 8766        # 与 main.py --watch（8765）同时运行
 
-def get_alien_content():
-    if not ALIEN_PATH.exists():
-        # 尝试去 h_reel 找找，防止放错文件夹
-        alt_path = ASSETS_DIR / "h_reel" / "alien.svg"
-        if alt_path.exists():
-            with open(alt_path, 'r', encoding='utf-8') as f:
-                return f.read().replace('</svg>', '')
-        
-        print(f"❌ 错误：找不到外星人图标，请检查路径: {ALIEN_PATH}")
-        return None
-        
-    try:
-        with open(ALIEN_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-            content = content.replace('</svg>', '')
-            return content
-    except Exception as e:
-        print(f"❌ 读取错误: {e}")
+# 调试用的两只眼睛，追加在外星人图标内部
+TEST_EYES = (
+    ("circle", {"id": "eye-left", "class": "test-eye", "cx": "30%", "cy": "55%", "r": "20%"}),
+    ("circle", {"id": "eye-right", "class": "test-eye", "cx": "70%", "cy": "55%", "r": "20%"}),
+)
+
+def get_alien_icon():
+    # 尝试去 h_reel 找找，防止放错文件夹
+    path = ALIEN_PATH if ALIEN_PATH.exists() else ASSETS_DIR / "h_reel" / "alien.svg"
+    icon = svg_loader.load(path)
+    if icon is None:
+        print(f"❌ 错误：找不到或无法解析外星人图标，请检查路径: {ALIEN_PATH}")
         return None
+    return icon
 
-def generate_test_bench():
-    alien_svg_body = get_alien_content()
-    if not alien_svg_body:
+def generate_test_bench(open_browser=True):
+    icon = get_alien_icon()
+    if icon is None:
         return
+    alien_svg = icon.render(TEST_EYES)
+    # 滑块初始值：从图标路径自动拟合，再叠加共享几何配置里保存的手工值
+    g = main.load_geometry(auto=main.fit_overlay_geometry(icon))["alien"]
 
     html_content = f"""
 <!DOCTYPE html>
@@ -174,10 +177,7 @@ def generate_test_bench():
     <div class="preview-area">
         <div class="center-line"></div>
         <div class="icon-container">
-            {alien_svg_body}
-            <circle id="eye-left" class="test-eye" cx="30%" cy="55%" r="20%" />
-            <circle id="eye-right" class="test-eye" cx="70%" cy="55%" r="20%" />
-            </svg>
+            {alien_svg}
         </div>
     </div>
 
@@ -196,26 +196,27 @@ def generate_test_bench():
             <h3>📐 参数调整 (只需调一边)</h3>
             
             <div class="input-row">
-                <label>X 轴位置 (离左边的距离) <span id="val-lx" class="highlight">30%</span></label>
-                <input type="range" id="inp-lx" min="0" max="50" step="0.5" value="30">
-                <div style="font-size: 11px; color: #666; margin-top: 2px;">右眼自动设为: <span id="val-rx">70%</span></div>
+                <label>X 轴位置 (离左边的距离) <span id="val-lx" class="highlight">{g['eye_x']:g}%</span></label>
+                <input type="range" id="inp-lx" min="0" max="50" step="any" value="{g['eye_x']:g}">
+                <div style="font-size: 11px; color: #666; margin-top: 2px;">右眼自动设为: <span id="val-rx">{100 - g['eye_x']:g}%</span></div>
             </div>
             
             <div class="input-row">
-                <label>Y 轴位置 (上下高度) <span id="val-ly" class="highlight">55%</span></label>
-                <input type="range" id="inp-ly" min="0" max="100" step="0.5" value="55">
+                <label>Y 轴位置 (上下高度) <span id="val-ly" class="highlight">{g['eye_y']:g}%</span></label>
+                <input type="range" id="inp-ly" min="0" max="100" step="any" value="{g['eye_y']:g}">
             </div>
             
             <div class="input-row">
-                <label>R 半径 (圆的大小) <span id="val-lr" class="highlight">20%</span></label>
-                <input type="range" id="inp-lr" min="0" max="50" step="0.5" value="20">
+                <label>R 半径 (圆的大小) <span id="val-lr" class="highlight">{g['eye_r']:g}%</span></label>
+                <input type="range" id="inp-lr" min="0" max="50" step="any" value="{g['eye_r']:g}">
             </div>
         </div>
 
         <div class="control-group">
-            <h3>📝 最终代码</h3>
+            <h3>📝 {main.GEOMETRY_FILE.name}</h3>
             <div class="code-output" id="result-code">...</div>
-            <button class="copy-btn" onclick="copyCode()">复制并粘贴回 Main.py</button>
+            <div id="save-status" style="font-size: 12px; color: #a6e3a1; margin: 8px 0;"></div>
+            <button class="copy-btn" onclick="copyCode()">复制到 {main.GEOMETRY_FILE.name}</button>
         </div>
     </div>
 
@@ -234,9 +235,27 @@ def generate_test_bench():
             valLy: document.getElementById('val-ly'),
             valLr: document.getElementById('val-lr'),
             
-            output: document.getElementById('result-code')
+            output: document.getElementById('result-code'),
+            status: document.getElementById('save-status')
         }};
 
+        // 由开发服务器（--watch）提供时，滑块数值直接写进 {main.GEOMETRY_FILE.name}，主页面会热替换；直接打开文件时只生成片段
+        const SAVE_URL = location.protocol.startsWith('http') ? '/__config' : null;
+        // 只提交拖动过的键：服务器按键合并，别处（其他调试台、手工编辑）改过的值不会被覆盖
+        let saveTimer = null, pending = {{}};
+        function save(section, key, value) {{
+            if (!SAVE_URL) return;
+            pending[key] = value;
+            clearTimeout(saveTimer);
+            saveTimer = setTimeout(() => {{
+                const body = JSON.stringify({{ [section]: pending }});
+                pending = {{}};
+                fetch(SAVE_URL, {{ method: 'POST', headers: {{ 'Content-Type': 'application/json' }}, body }})
+                    .then(r => {{ els.status.innerText = r.ok ? '✅ 已写入 {main.GEOMETRY_FILE.name}' : '❌ 保存失败'; }})
+                    .catch(() => {{ els.status.innerText = '❌ 开发服务器未运行'; }});
+            }}, 150);
+        }}
+
         function update() {{
             // 1. 获取数值
             const lx = parseFloat(els.lx.value);
@@ -266,20 +285,17 @@ def generate_test_bench():
             els.eyeL.style.transform = `scale(${{s}})`;
             els.eyeR.style.transform = `scale(${{s}})`;
 
-            // 6. 生成 Python 字符串 (保持格式化)
-            const code = `
-                eye_covers = \"\"\"
-                    <circle class="eye-cover left-eye" cx="${{lx}}%" cy="${{ly}}%" r="${{lr}}%" fill="white" transform="scale(0)" />
-                    <circle class="eye-cover right-eye" cx="${{rx}}%" cy="${{ly}}%" r="${{lr}}%" fill="white" transform="scale(0)" />
-                \"\"\"`.trim();
-            
-            els.output.innerText = code;
+            // 6. 写入共享几何配置（右眼由 main.py 镜像生成）
+            const values = {{ alien: {{ eye_x: lx, eye_y: ly, eye_r: lr }} }};
+            els.output.innerText = JSON.stringify(values, null, 2);
         }}
 
-        // 绑定事件
-        els.lx.addEventListener('input', update);
-        els.ly.addEventListener('input', update);
-        els.lr.addEventListener('input', update);
+        // 绑定事件：滑块 -> 几何配置里的键
+        const FIELDS = {{ lx: 'eye_x', ly: 'eye_y', lr: 'eye_r' }};
+        Object.entries(FIELDS).forEach(([id, key]) => els[id].addEventListener('input', () => {{
+            update();
+            save('alien', key, parseFloat(els[id].value));
+        }}));
         els.scale.addEventListener('input', update);
 
         function copyCode() {{
@@ -306,7 +322,16 @@ def generate_test_bench():
         f.write(html_content)
     
     print(f"✅ 镜像调试台已生成: {OUTPUT_HTML}")
-    webbrowser.open(f'file://{OUTPUT_HTML.resolve()}')
+    if open_browser: webbrowser.open(f'file://{OUTPUT_HTML.resolve()}')
 
 if __name__ == "__main__":
-    generate_test_bench()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--watch", action="store_true", help="启动本地开发服务器，滑块数值直接写入共享几何配置")
+    parser.add_argument("--port", type=int, default=None, help="开发服务器端口")
+    args = parser.parse_args()
+    if args.watch:
+        import dev_server
+        dev_server.run("test_alien_eyes", "generate_test_bench", OUTPUT_HTML, [ASSETS_DIR],
+                       port=args.port or TUNER_PORT, config_file=main.GEOMETRY_FILE)
+    else:
+        generate_test_bench()
\ No newline at end of file
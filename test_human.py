@@ -1,34 +1,41 @@
+import argparse
 import os
 import webbrowser
 from pathlib import Path
 
+import main
+import svg_loader
+
 # ================= 配置 =================
 BASE_DIR = Path(__file__).parent
 ASSETS_DIR = BASE_DIR / "assets" / "icons"
 HUMAN_PATH = ASSETS_DIR / "h_reel" / "human.svg" 
 OUTPUT_HTML = BASE_DIR / "human_geometry_tuner_v3.html"
+TUNER_PORT = 8767        # 与 main.py --watch（8765）同时运行
+
+# 可调的圆和方框，追加在人形图标内部
+TEST_SHAPES = (
+    ("circle", {"id": "v-circle", "class": "v-shape", "cx": "50%", "cy": "50%", "r": "35%"}),
+    ("rect", {"id": "v-rect", "class": "v-shape v-rect", "x": "15%", "y": "15%", "width": "70%", "height": "70%"}),
+)
 
-def get_human_content():
+def get_human_icon():
     target_path = HUMAN_PATH
     if not target_path.exists():
         target_path = ASSETS_DIR / "a_reel" / "human.svg"
-    
-    if not target_path.exists():
-        print(f"❌ 错误：找不到 human.svg，请检查 assets 文件夹")
-        return None
 
-    try:
-        with open(target_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            content = content.replace('</svg>', '') 
-            return content
-    except Exception as e:
-        print(f"❌ 读取错误: {e}")
+    icon = svg_loader.load(target_path)
+    if icon is None:
+        print(f"❌ 错误：找不到或无法解析 human.svg，请检查 assets 文件夹")
         return None
+    return icon
 
-def generate_test_bench():
-    human_svg_body = get_human_content()
-    if not human_svg_body: return
+def generate_test_bench(open_browser=True):
+    icon = get_human_icon()
+    if icon is None: return
+    human_svg = icon.render(TEST_SHAPES)
+    # 滑块初始值：从图标路径自动拟合，再叠加共享几何配置里保存的手工值
+    g = main.load_geometry(auto=main.fit_overlay_geometry(icon))["human"]
 
     html_content = f"""
 <!DOCTYPE html>
@@ -140,10 +147,7 @@ def generate_test_bench():
         <div class="crosshair-x"></div>
         <div class="crosshair-y"></div>
         <div class="icon-container">
-            {human_svg_body}
-            <circle id="v-circle" class="v-shape" cx="50%" cy="50%" r="35%" />
-            <rect id="v-rect" class="v-shape v-rect" x="15%" y="15%" width="70%" height="70%" />
-            </svg>
+            {human_svg}
         </div>
     </div>
 
@@ -153,32 +157,33 @@ def generate_test_bench():
         <div class="control-group" style="border-left: 3px solid #00ffcc;">
             <h3 style="color: #00ffcc;">⚪ 圆形 (Circle)</h3>
             
-            <label>水平位置 (Center X) <span id="val-cx" class="val">55%</span></label>
-            <input type="range" id="inp-cx" min="0" max="100" step="0.5" value="55">
+            <label>水平位置 (Center X) <span id="val-cx" class="val">{g['circle_cx']:g}%</span></label>
+            <input type="range" id="inp-cx" min="0" max="100" step="any" value="{g['circle_cx']:g}">
 
-            <label>垂直位置 (Center Y) <span id="val-cy" class="val">46.5%</span></label>
-            <input type="range" id="inp-cy" min="0" max="100" step="0.5" value="46.5">
+            <label>垂直位置 (Center Y) <span id="val-cy" class="val">{g['circle_cy']:g}%</span></label>
+            <input type="range" id="inp-cy" min="0" max="100" step="any" value="{g['circle_cy']:g}">
 
-            <label>半径 (Radius) <span id="val-r" class="val">57.5%</span></label>
-            <input type="range" id="inp-r" min="0" max="100" step="0.5" value="57.5">
+            <label>半径 (Radius) <span id="val-r" class="val">{g['circle_r']:g}%</span></label>
+            <input type="range" id="inp-r" min="0" max="100" step="any" value="{g['circle_r']:g}">
         </div>
 
         <div class="control-group" style="border-left: 3px solid #ff00ff;">
             <h3 style="color: #ff00ff;">⬜ 矩形 (Rectangle)</h3>
             
-            <label>左侧位置 (X) <span id="val-rx" class="val">2%</span></label>
-            <input type="range" id="inp-rx" min="-50" max="50" step="0.25" value="2">
+            <label>左侧位置 (X) <span id="val-rx" class="val">{g['rect_x']:g}%</span></label>
+            <input type="range" id="inp-rx" min="-50" max="50" step="any" value="{g['rect_x']:g}">
             
-            <label>顶部位置 (Y) <span id="val-ry" class="val">8%</span></label>
-            <input type="range" id="inp-ry" min="-50" max="50" step="0.25" value="8">
+            <label>顶部位置 (Y) <span id="val-ry" class="val">{g['rect_y']:g}%</span></label>
+            <input type="range" id="inp-ry" min="-50" max="50" step="any" value="{g['rect_y']:g}">
 
-            <label>宽度 (Width) <span id="val-rw" class="val">100.5%</span></label>
-            <input type="range" id="inp-rw" min="0" max="200" step="0.5" value="100.5">
+            <label>宽度 (Width) <span id="val-rw" class="val">{g['rect_w']:g}%</span></label>
+            <input type="range" id="inp-rw" min="0" max="200" step="any" value="{g['rect_w']:g}">
             
-            <label>高度 (Height) <span id="val-rh" class="val">92%</span></label>
-            <input type="range" id="inp-rh" min="0" max="200" step="0.5" value="92">
+            <label>高度 (Height) <span id="val-rh" class="val">{g['rect_h']:g}%</span></label>
+            <input type="range" id="inp-rh" min="0" max="200" step="any" value="{g['rect_h']:g}">
         </div>
         
+        <div id="save-status" style="font-size: 12px; color: #00ffcc; margin: 8px 0;"></div>
         <div class="code-output" id="result-code">...</div>
     </div>
 
@@ -196,9 +201,27 @@ def generate_test_bench():
             circle: document.getElementById('v-circle'),
             rect: document.getElementById('v-rect'),
             
-            output: document.getElementById('result-code')
+            output: document.getElementById('result-code'),
+            status: document.getElementById('save-status')
         }};
 
+        // 由开发服务器（--watch）提供时，滑块数值直接写进 {main.GEOMETRY_FILE.name}，主页面会热替换；直接打开文件时只生成片段
+        const SAVE_URL = location.protocol.startsWith('http') ? '/__config' : null;
+        // 只提交拖动过的键：服务器按键合并，别处（其他调试台、手工编辑）改过的值不会被覆盖
+        let saveTimer = null, pending = {{}};
+        function save(section, key, value) {{
+            if (!SAVE_URL) return;
+            pending[key] = value;
+            clearTimeout(saveTimer);
+            saveTimer = setTimeout(() => {{
+                const body = JSON.stringify({{ [section]: pending }});
+                pending = {{}};
+                fetch(SAVE_URL, {{ method: 'POST', headers: {{ 'Content-Type': 'application/json' }}, body }})
+                    .then(r => {{ els.status.innerText = r.ok ? '✅ 已写入 {main.GEOMETRY_FILE.name}' : '❌ 保存失败'; }})
+                    .catch(() => {{ els.status.innerText = '❌ 开发服务器未运行'; }});
+            }}, 150);
+        }}
+
         function update() {{
             // 1. 获取数值 (现在全部是手动值，没有自动计算了)
             const cx = parseFloat(els.cx.value);
@@ -230,21 +253,17 @@ def generate_test_bench():
             els.rect.setAttribute('width', rw + '%');
             els.rect.setAttribute('height', rh + '%');
 
-            // 4. 代码生成
-            const code = `
-                v_shapes = \"\"\"
-                    <circle class="v-shape v-circle" cx="${{cx}}%" cy="${{cy}}%" r="${{r}}%" />
-                    <rect class="v-shape v-rect" x="${{rx}}%" y="${{ry}}%" width="${{rw}}%" height="${{rh}}%" />
-                \"\"\"`.trim();
-            
-            els.output.innerText = code;
+            // 4. 写入共享几何配置
+            const values = {{ human: {{ circle_cx: cx, circle_cy: cy, circle_r: r, rect_x: rx, rect_y: ry, rect_w: rw, rect_h: rh }} }};
+            els.output.innerText = JSON.stringify(values, null, 2);
         }}
 
-        Object.values(els).forEach(el => {{
-            if(el && el.tagName === 'INPUT') {{
-                el.addEventListener('input', update);
-            }}
-        }});
+        // 滑块 -> 几何配置里的键
+        const FIELDS = {{ cx: 'circle_cx', cy: 'circle_cy', r: 'circle_r', rx: 'rect_x', ry: 'rect_y', rw: 'rect_w', rh: 'rect_h' }};
+        Object.entries(FIELDS).forEach(([id, key]) => els[id].addEventListener('input', () => {{
+            update();
+            save('human', key, parseFloat(els[id].value));
+        }}));
         
         update();
     </script>
@@ -255,7 +274,16 @@ def generate_test_bench():
     with open(OUTPUT_HTML, 'w', encoding='utf-8') as f:
         f.write(html_content)
     print(f"✅ V3 全手动调试台已生成: {OUTPUT_HTML}")
-    webbrowser.open(f'file://{OUTPUT_HTML.resolve()}')
+    if open_browser: webbrowser.open(f'file://{OUTPUT_HTML.resolve()}')
 
 if __name__ == "__main__":
-    generate_test_bench()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--watch", action="store_true", help="启动本地开发服务器，滑块数值直接写入共享几何配置")
+    parser.add_argument("--port", type=int, default=None, help="开发服务器端口")
+    args = parser.parse_args()
+    if args.watch:
+        import dev_server
+        dev_server.run("test_human", "generate_test_bench", OUTPUT_HTML, [ASSETS_DIR],
+                       port=args.port or TUNER_PORT, config_file=main.GEOMETRY_FILE)
+    else:
+        generate_test_bench()
\ No newline at end of file
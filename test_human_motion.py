@@ -1,24 +1,15 @@
+import argparse
 import os
 import webbrowser
 from pathlib import Path
 import time
 
-# ================= 调试参数配置区域 (修改这里) =================
+import main
+import svg_loader
 
-# 1. 圆形参数 (Circle)
-# cx: 水平中心 (50%是正中，>50%向右，<50%向左)
-# cy: 垂直中心 (50%是正中，>50%向下，<50%向上)
-CIRCLE_CX = "50%"      
-CIRCLE_CY = "47.5%"    
-CIRCLE_R  = "56%"      
-
-# 2. 方形参数 (Rectangle)
-RECT_X = "-0.5%"       
-RECT_Y = "23.25%"      
-RECT_W = "101%"        
-RECT_H = "76.5%"       
-
-# ==========================================================
+# ================= 配置 =================
+# 圆和方框的几何不再在这里手写：与 main.py 一样从路径自动拟合，再叠加 assets/icons/geometry.json
+TUNER_PORT = 8768        # 与 main.py --watch（8765）及其他调试台同时运行
 
 BASE_DIR = Path(__file__).parent
 ASSETS_DIR = BASE_DIR / "assets" / "icons"
@@ -30,23 +21,14 @@ if not HUMAN_PATH.exists():
 OUTPUT_HTML = BASE_DIR / "debug_human_only.html"
 
 def get_human_svg():
-    if not HUMAN_PATH.exists():
+    icon = svg_loader.load(HUMAN_PATH)
+    if icon is None:
         return "Error: human.svg not found"
-    try:
-        with open(HUMAN_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # 注入参数
-            v_shapes = f"""
-                <circle class="v-shape v-circle" cx="{CIRCLE_CX}" cy="{CIRCLE_CY}" r="{CIRCLE_R}" />
-                <rect class="v-shape v-rect" x="{RECT_X}" y="{RECT_Y}" width="{RECT_W}" height="{RECT_H}" />
-            """
-            # 替换闭合标签前的内容
-            content = content.replace('</svg>', f'{v_shapes}</svg>')
-            return content
-    except Exception as e:
-        return f"Error: {e}"
-
-def generate_debug_page():
+    # 注入与正式页面完全相同的圆和方框
+    geometry = main.load_geometry(auto=main.fit_overlay_geometry(icon))
+    return icon.render(main._overlay_elements("human", geometry))
+
+def generate_debug_page(open_browser=True):
     svg_content = get_human_svg()
     
     html = f"""
@@ -98,8 +80,8 @@ def generate_debug_page():
             fill: none; 
             stroke: #000; 
             stroke-width: 2px;
-            stroke-dasharray: 400; 
-            stroke-dashoffset: 400; 
+            stroke-dasharray: 1 1.05; 
+            stroke-dashoffset: 1.02; 
             opacity: 1; 
             vector-effect: non-scaling-stroke; 
             stroke-linecap: round;
@@ -154,7 +136,15 @@ def generate_debug_page():
         f.write(html)
     
     print(f"Debug file generated: {OUTPUT_HTML}")
-    webbrowser.open(f'file://{OUTPUT_HTML.resolve()}')
+    if open_browser: webbrowser.open(f'file://{OUTPUT_HTML.resolve()}')
 
 if __name__ == "__main__":
-    generate_debug_page()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--watch", action="store_true", help="启动本地开发服务器，图标或参数变化时自动刷新页面")
+    parser.add_argument("--port", type=int, default=None, help="开发服务器端口")
+    args = parser.parse_args()
+    if args.watch:
+        import dev_server
+        dev_server.run("test_human_motion", "generate_debug_page", OUTPUT_HTML, [ASSETS_DIR], port=args.port or TUNER_PORT)
+    else:
+        generate_debug_page()
\ No newline at end of file
@@ -0,0 +1,59 @@
+import math
+
+import pytest
+
+import main
+import svg_loader
+
+def _bbox(d):
+    points = svg_loader._sample_points(svg_loader._absolute_path(svg_loader._tokenize_path(d)))
+    xs, ys = [p[0] for p in points], [p[1] for p in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+def test_arc_is_sampled_along_the_ellipse():
+    # 两段半圆弧组成的圆：端点只在水平直径上，包围盒要靠弧线采样撑开
+    assert _bbox("M0 50A50 50 0 1 0 100 50A50 50 0 1 0 0 50Z") == pytest.approx((0, 0, 100, 100), abs=0.5)
+
+def test_arc_radius_is_scaled_up_when_too_small():
+    assert _bbox("M0 0A1 1 0 0 1 100 0") == pytest.approx((0, -50, 100, 0), abs=0.5)
+
+def test_smooth_cubic_reflects_previous_control_point():
+    # S 的第一个控制点是上一段第二个控制点的反射 (100, -100)，曲线会向上鼓出
+    assert _bbox("M0 0C0 100 100 100 100 0S200 -100 200 0")[1] == pytest.approx(-75, abs=0.5)
+
+def test_smooth_quadratic_follows_reflected_control_point():
+    assert _bbox("M0 0Q50 100 100 0T200 0")[1] == pytest.approx(-50, abs=0.5)
+
+def test_transformed_group_bbox():
+    svg = svg_loader.parse_svg('<svg viewBox="0 0 200 200"><g transform="translate(10 20) scale(2)">'
+                               '<path d="M0 0H50V50H0Z"/></g></svg>')
+    assert svg.bbox == pytest.approx((10, 20, 110, 120))
+
+def _icon(name):
+    return svg_loader.load(main.A_REEL_DIR / f"{name}.svg") or svg_loader.load(main.H_REEL_DIR / f"{name}.svg")
+
+def test_alien_eyes_are_inside_the_head():
+    svg = _icon("alien")
+    eyes = main.fit_overlay_geometry(svg)["alien"]
+    head = max(svg.subpaths(), key=lambda s: s.area).bbox
+    vw, vh = svg.box[2:]
+    assert 0 < eyes["eye_x"] < 50 and 0 < eyes["eye_r"]
+    assert head[0] <= eyes["eye_x"] * vw / 100 <= head[2]
+    assert head[1] <= eyes["eye_y"] * vh / 100 <= head[3]
+
+def test_human_circle_encloses_the_figure():
+    svg = _icon("human")
+    g = main.fit_overlay_geometry(svg)["human"]
+    vw, vh = svg.box[2:]
+    cx, cy, r = g["circle_cx"] * vw / 100, g["circle_cy"] * vh / 100, g["circle_r"] * main._diagonal(vw, vh) / 100
+    points = [p for s in svg.subpaths() for p in s.points]
+    # 百分比保留两位小数，允许 0.5% 的舍入
+    assert max(math.hypot(x - cx, y - cy) for x, y in points) <= r * 1.005
+    assert 0 <= g["rect_x"] and g["rect_x"] + g["rect_w"] <= 100.01
+    assert 0 <= g["rect_y"] and g["rect_y"] + g["rect_h"] <= 100.01
+
+def test_human_dash_does_not_depend_on_render_size():
+    # 描边动画按归一化周长计，渲染尺寸（LOGO_SIZE、组件 --size）变了也不用重算
+    shapes = main._overlay_elements("human", main.load_geometry())
+    assert [attrs["pathLength"] for _, attrs in shapes] == ["1", "1"]
+    assert all("style" not in attrs for _, attrs in shapes)
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+
+import ingest
+import svg_loader
+
+RAW = sorted(Path(ingest.RAW_DIR).glob("*.svg"))
+
+@pytest.mark.parametrize("source", RAW, ids=[p.stem for p in RAW])
+def test_normalized_icon_fits_the_canvas(source, monkeypatch):
+    # 长边撑满画布、短边居中；允许 SVG 优化时的坐标舍入。检查时用更密的曲线采样
+    size = ingest.INGEST_SIZE
+    normalized = ingest.normalize_svg(source.read_text(encoding='utf-8-sig'))
+    monkeypatch.setattr(svg_loader, "CURVE_SAMPLES", 64)
+    box = svg_loader.parse_svg(normalized).bbox
+    tol = 0.01 * size
+    assert min(box[0], box[1]) >= -tol and max(box[2], box[3]) <= size + tol
+    width, height = box[2] - box[0], box[3] - box[1]
+    assert max(width, height) == pytest.approx(size, abs=tol)
+    center = (box[0] + box[2]) / 2 if width < height else (box[1] + box[3]) / 2
+    assert center == pytest.approx(size / 2, abs=tol)
+
+def test_plan_reserves_mapped_names(tmp_path, monkeypatch):
+    # 推导出的名字不能抢走 INGEST_MAP 指定给别的文件的名字
+    monkeypatch.setattr(ingest, "INGEST_MAP", {"苹果": ("a", "apple")})
+    for stem in ("noun-apple-7941940", "苹果"): (tmp_path / f"{stem}.svg").write_text("<svg/>")
+    plan, _ = ingest._plan(tmp_path, "a")
+    assert {file.stem: name for file, _, name in plan} == {"noun-apple-7941940": "apple-2", "苹果": "apple"}
+
+def test_failed_source_keeps_its_icon(tmp_path, monkeypatch):
+    raw, reel = tmp_path / "raw", tmp_path / "a_reel"
+    raw.mkdir()
+    monkeypatch.setattr(ingest.main, "ASSETS_DIR", tmp_path)
+    monkeypatch.setattr(ingest, "REEL_DIRS", {"a": reel})
+    monkeypatch.setattr(ingest, "INGEST_MAP", {})
+    manifest = tmp_path / "ingest-manifest.json"
+    run = lambda: ingest.ingest(raw, "a", jobs=1, use_cache=False, manifest_path=manifest)
+    for stem in ("ok", "gone"): (raw / f"{stem}.svg").write_text('<svg xmlns="http://www.w3.org/2000/svg"><rect width="10" height="20"/></svg>')
+    run()
+    good = (reel / "ok.svg").read_text()
+    # 来源还在但这次处理失败：保留上一次的图标和清单条目；来源删掉了：删除对应图标
+    (raw / "ok.svg").write_text("<svg")
+    (raw / "gone.svg").unlink()
+    result = run()
+    assert (reel / "ok.svg").read_text() == good
+    assert not (reel / "gone.svg").exists()
+    assert [e["file"] for e in result["icons"]] == ["a_reel/ok.svg"]
@@ -0,0 +1,30 @@
+import pytest
+
+import main
+from svg_loader import _absolute_path, _tokenize_path
+
+def _coords(d):
+    return [v for _, args in _absolute_path(_tokenize_path(d)) for v in args]
+
+@pytest.mark.parametrize("value, precision, text", [
+    (10, 0, "10"), (100, 0, "100"), (-20, 0, "-20"), (0.4, 0, "0"), (12.5, 1, "12.5"), (10.0, 1, "10"),
+    (0.25, 2, ".25"), (-0.5, 2, "-.5"), (-0.001, 2, "0"),
+])
+def test_format_number(value, precision, text):
+    assert main._format_number(value, precision) == text
+
+@pytest.mark.parametrize("precision", [0, 1, 2])
+def test_optimize_path_round_trip(precision):
+    d = "M10 20L100 200C110.123 210.456 130 190 150.5 170.25Q160 160 170 175Z"
+    out = main.optimize_path(d, precision)
+    assert _coords(out) == pytest.approx(_coords(d), abs=0.5 * 10 ** -precision + 1e-9)
+
+def test_optimize_path_precision_zero_keeps_magnitude():
+    assert _coords(main.optimize_path("M10 20L100 200", 0)) == [10, 20, 100, 200]
+
+def test_optimize_svg_drops_nested_metadata():
+    svg = ('<svg xmlns="http://www.w3.org/2000/svg" xmlns:rdf="r" xmlns:dc="d" viewBox="0 0 10 10">'
+           '<metadata><rdf:RDF><dc:type rdf:resource="x" /></rdf:RDF></metadata><path d="M0 0L10 10"/></svg>')
+    out = main.optimize_svg(svg)
+    assert "metadata" not in out and "rdf" not in out
+    assert main.svg_loader.parse_svg(out, "x").paths
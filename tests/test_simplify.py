@@ -0,0 +1,47 @@
+import math
+
+import pytest
+
+import main
+import svg_loader
+
+def _segments(d):
+    return svg_loader._absolute_path(svg_loader._tokenize_path(d))
+
+def _outline(segments):
+    return svg_loader._sample_points(segments)
+
+def _max_deviation(points, reference):
+    # 每个采样点到参考采样点的最近距离
+    return max(min(math.hypot(p[0] - q[0], p[1] - q[1]) for q in reference) for p in points)
+
+def test_collinear_lines_collapse_to_one():
+    d = "M0 0" + "".join(f"L{x} {0.01 * (x % 2)}" for x in range(1, 101))
+    out = main.simplify_segments(_segments(d), 0.1)
+    assert [c for c, _ in out] == ['M', 'L']
+    assert out[-1][1] == pytest.approx([100, 0])
+
+def test_corners_are_kept():
+    out = main.simplify_segments(_segments("M0 0L50 0L100 0L100 50L100 100Z"), 0.1)
+    assert [c for c, _ in out] == ['M', 'L', 'L', 'Z']
+
+@pytest.mark.parametrize("tolerance", [0.1, 0.5, 2])
+def test_simplified_circle_stays_within_tolerance(tolerance, monkeypatch):
+    # 一个圆用 16 段三次贝塞尔描出，简化后曲线上每一点到圆的距离不能超过容差
+    n, r = 16, 100
+    d = f"M{r} 0"
+    for k in range(n):
+        a0, a1 = 2 * math.pi * k / n, 2 * math.pi * (k + 1) / n
+        h = 4 / 3 * math.tan((a1 - a0) / 4) * r
+        d += (f"C{r * math.cos(a0) - h * math.sin(a0)} {r * math.sin(a0) + h * math.cos(a0)} "
+              f"{r * math.cos(a1) + h * math.sin(a1)} {r * math.sin(a1) - h * math.cos(a1)} {r * math.cos(a1)} {r * math.sin(a1)}")
+    original = _segments(d + "Z")
+    out = main.simplify_segments(original, tolerance)
+    assert len(out) < len(original)
+    monkeypatch.setattr(svg_loader, "CURVE_SAMPLES", 64)
+    assert max(abs(math.hypot(x, y) - r) for x, y in _outline(out)) <= tolerance
+
+def test_zero_tolerance_keeps_geometry():
+    original = _segments("M0 0C10 20 30 20 40 0S70 -20 80 0L90 10Z")
+    out = main.simplify_segments(original, 0)
+    assert _max_deviation(_outline(out), _outline(original)) < 1e-6
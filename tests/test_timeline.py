@@ -0,0 +1,40 @@
+import pytest
+
+import main
+
+def test_cycle_length_follows_timing_constants():
+    cycle, _ = main.compile_timeline(([],) * 3)
+    assert cycle == 3 * main.START_DELAY + main.SPIN_DURATION_BASE + 3 * main.SPIN_DELAY + main.WAIT_TIME
+
+def test_events_are_sorted_and_inside_the_cycle():
+    cycle, events = main.compile_timeline()
+    times = [e[0] for e in events]
+    assert times == sorted(times)
+    assert all(0 <= t < cycle for t in times)
+
+def test_each_reel_spins_then_stops_once():
+    _, events = main.compile_timeline(([],) * 3)
+    assert [(e[1], e[3]) for e in events] == [(0, "spin"), (1, "spin"), (2, "spin"), (0, "stop"), (1, "stop"), (2, "stop")]
+
+def test_effect_events_are_relative_to_their_reels_stop():
+    cycle, events = main.compile_timeline(([], ["hammer"], ["alien"]))
+    stops = {e[1]: e[0] for e in events if e[3] == "stop"}
+    hammer = [e for e in events if e[2] == "hammer"]
+    assert {e[1] for e in hammer} == {1}
+    assert [e[0] - stops[1] for e in hammer] == [at for at, _, _ in main.EFFECTS["hammer"]["timeline"]]
+    # ("end", t) 相对本轮结束
+    assert [e[0] for e in events if e[2] == "alien"] == [cycle - 100]
+
+def test_same_time_events_keep_stop_before_effects():
+    _, events = main.compile_timeline((["heart"], [], []))
+    stop = next(i for i, e in enumerate(events) if e[3] == "stop" and e[1] == 0)
+    assert all(i > stop for i, e in enumerate(events) if e[2] == "heart")
+
+def test_reels_only_get_their_own_effects():
+    _, events = main.compile_timeline((["heart"], ["apple"], ["apple"]))
+    assert {(e[1], e[2]) for e in events if e[2]} == {(0, "heart"), (1, "apple"), (2, "apple")}
+
+def test_event_outside_the_cycle_is_rejected(monkeypatch):
+    monkeypatch.setitem(main.EFFECTS, "heart", dict(main.EFFECTS["heart"], timeline=[(10 ** 6, "add", "x")]))
+    with pytest.raises(ValueError):
+        main.compile_timeline((["heart"],))
@@ -0,0 +1,43 @@
+import json
+import re
+
+import pytest
+
+import main
+
+def _write(tmp_path, names):
+    path = tmp_path / "variants.json"
+    path.write_text(json.dumps({"variants": [{"name": n, "logo_size": "40px"} for n in names]}), encoding='utf-8')
+    return path
+
+def test_load_variants(tmp_path):
+    variants = main.load_variants(_write(tmp_path, ["small", "dark-v2.1"]))
+    assert [v["name"] for v in variants] == ["small", "dark-v2.1"]
+    assert variants[0]["config"] == {"LOGO_SIZE": "40px"}
+
+@pytest.mark.parametrize("name", ["../x", "a/b", "a\\\\b", "", "x y"])
+def test_unsafe_variant_names_are_rejected(tmp_path, name):
+    with pytest.raises(ValueError):
+        main.load_variants(_write(tmp_path, [name]))
+
+def test_duplicate_variant_names_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        main.load_variants(_write(tmp_path, ["a", "a"]))
+
+def test_variant_icon_color_reaches_rendered_paths(tmp_path):
+    # 图形上不能留写死的颜色，否则 ICON_COLOR 对它们无效
+    path = tmp_path / "variants.json"
+    path.write_text(json.dumps({"variants": [{"name": "dark", "BG_COLOR": "#111111", "ICON_COLOR": "#f4f4f4"}]}), encoding='utf-8')
+    main.build_variants(path, tmp_path / "out", jobs=1, use_cache=False)
+    html = (tmp_path / "out" / "haa_logo_dark.html").read_text(encoding='utf-8')
+    assert "--icon-color: #f4f4f4;" in html
+    fills = set(re.findall(r'<(?:path|circle|rect|ellipse|polygon)\b[^>]*?\sfill="([^"]*)"', html))
+    assert fills <= main.KEEP_FILLS
+    # 预模糊贴图是静态图片，颜色在生成时写入
+    assert "fill='%23f4f4f4'" in html
+
+def test_effect_offsets_follow_size_override():
+    # 组件允许宿主覆盖 --size：粒子轨迹和锚的位移不能写死像素
+    css = main._particle_system_css(list(main.PARTICLE_EMITTERS)) + main._css_vars(":where(haa-logo)")
+    offsets = re.findall(r'(?:width|height|--tx|--ty|--anchor-hover-y): ([^;]+);', css)
+    assert offsets and all(value.startswith("calc(var(--size) *") for value in offsets if value not in ("0", "100%"))